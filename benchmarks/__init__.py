@@ -0,0 +1,7 @@
+"""
+Suíte de benchmarks do Sabor Express.
+
+Os módulos deste pacote medem o classificador, o carregador de dados,
+a serialização e os endpoints da API sobre catálogos sintéticos gerados
+de forma determinística (ver 'benchmarks.gerar_catalogo').
+"""
@@ -0,0 +1,225 @@
+"""
+Utilitários compartilhados pelos benchmarks.
+
+Responsável por:
+- Tornar o código em 'src/' importável sem instalação prévia.
+- Medir funções com repetições e agregar os tempos.
+- Apontar as configurações da aplicação para um catálogo sintético.
+"""
+
+import gc
+import json
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+RAIZ_PROJETO = Path(__file__).resolve().parents[1]
+
+if str(RAIZ_PROJETO / "src") not in sys.path:
+    sys.path.insert(0, str(RAIZ_PROJETO / "src"))
+
+
+def medir(
+    nome: str, func: Callable[[], Any], operacoes: int = 1, repeticoes: int = 5
+) -> Dict[str, Any]:
+    """
+    Executa 'func' algumas vezes e retorna um resultado serializável.
+
+    Args:
+        nome: Identificador estável do benchmark (usado na comparação).
+        func: Função sem argumentos a ser medida.
+        operacoes: Quantas operações lógicas uma chamada de 'func' representa.
+        repeticoes: Quantas vezes 'func' é executada.
+    """
+    tempos: List[float] = []
+    for _ in range(repeticoes):
+        gc.collect()
+        inicio = time.perf_counter()
+        func()
+        tempos.append(time.perf_counter() - inicio)
+
+    mediana = statistics.median(tempos)
+    return {
+        "nome": nome,
+        "operacoes": operacoes,
+        "repeticoes": repeticoes,
+        "mediana_s": mediana,
+        "minimo_s": min(tempos),
+        "maximo_s": max(tempos),
+        "ops_por_segundo": operacoes / mediana if mediana else None,
+    }
+
+
+def usar_catalogo(raiz: Path) -> None:
+    """Faz a aplicação ler os dados de '<raiz>/data' em vez do projeto."""
+    from core.config import settings
+
+    settings.PROJECT_ROOT = Path(raiz).resolve()
+
+
+def aguardar_catalogo(client: Any, espera: float = 600.0) -> float:
+    """
+    Espera '/health/ready' responder 200 (o catálogo é carregado em segundo
+    plano) e retorna o tempo de espera. 'client' é um cliente HTTP com a
+    URL base do servidor (ex: 'TestClient').
+    """
+    inicio = time.perf_counter()
+    while client.get("/health/ready").status_code != 200:
+        if time.perf_counter() - inicio > espera:
+            raise RuntimeError("O catálogo da API não ficou pronto.")
+        time.sleep(0.02)
+    return time.perf_counter() - inicio
+
+
+@contextmanager
+def servidor_api() -> Iterator[str]:
+    """
+    Sobe a API real (Uvicorn) numa thread, numa porta livre, e retorna a URL
+    base dos endpoints ('http://127.0.0.1:<porta>/api').
+    """
+    import httpx
+    import uvicorn
+    from api.router import app
+
+    porta = porta_livre()
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=porta, log_level="warning")
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    with httpx.Client(base_url=f"http://127.0.0.1:{porta}") as client:
+        aguardar_catalogo(client)
+    try:
+        yield f"http://127.0.0.1:{porta}/api"
+    finally:
+        server.should_exit = True
+        thread.join()
+
+
+def porta_livre() -> int:
+    """Uma porta TCP livre em 127.0.0.1."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def processo_uvicorn(
+    raiz: Path, porta: int, variaveis: Optional[Dict[str, str]] = None
+) -> subprocess.Popen:
+    """
+    Inicia a API (Uvicorn) num processo separado, lendo o catálogo de 'raiz'
+    (com 'variaveis' de ambiente extras, ex: as do profiling).
+    """
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "api.router:app",
+            "--port",
+            str(porta),
+            "--log-level",
+            "warning",
+        ],
+        cwd=RAIZ_PROJETO / "src",
+        env={
+            **os.environ,
+            "PROJECT_ROOT": str(Path(raiz).resolve()),
+            **(variaveis or {}),
+        },
+        stdout=subprocess.DEVNULL,
+    )
+
+
+@contextmanager
+def servidor_api_processo(
+    raiz: Path, espera: float = 600.0, variaveis: Optional[Dict[str, str]] = None
+) -> Iterator[tuple]:
+    """
+    Sobe a API (Uvicorn) num processo separado, lendo o catálogo de 'raiz',
+    espera o catálogo ficar pronto e retorna (URL base dos endpoints, PID do
+    servidor). Útil para medir a memória do servidor sem misturá-la com a
+    do cliente.
+    """
+    import requests
+
+    porta = porta_livre()
+    processo = processo_uvicorn(raiz, porta, variaveis)
+    try:
+        limite = time.monotonic() + espera
+        while True:
+            try:
+                pronto = requests.get(
+                    f"http://127.0.0.1:{porta}/health/ready", timeout=1
+                )
+                if pronto.status_code == 200:
+                    break
+            except requests.ConnectionError:
+                pass
+            if processo.poll() is not None or time.monotonic() > limite:
+                raise RuntimeError("O servidor da API não subiu.")
+            time.sleep(0.1)
+        yield f"http://127.0.0.1:{porta}/api", processo.pid
+    finally:
+        processo.terminate()
+        processo.wait()
+
+
+def memoria_processo(pid: int, campo: str = "VmRSS") -> Optional[int]:
+    """Lê 'VmRSS'/'VmHWM' (KiB) de '/proc/<pid>/status', ou None fora do Linux."""
+    try:
+        with open(f"/proc/{pid}/status", encoding="utf-8") as status:
+            for linha in status:
+                if linha.startswith(campo + ":"):
+                    return int(linha.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def cpu_processo(pid: int) -> Optional[float]:
+    """Tempo de CPU (usuário + sistema, em segundos) do processo, ou None."""
+    try:
+        with open(f"/proc/{pid}/stat", encoding="utf-8") as stat:
+            # Campos após o nome do processo (que pode conter espaços)
+            campos = stat.read().rsplit(")", 1)[1].split()
+    except OSError:
+        return None
+    return (int(campos[11]) + int(campos[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def ambiente() -> Dict[str, Any]:
+    """Coleta metadados para tornar dois resultados comparáveis."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=RAIZ_PROJETO,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "data": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def salvar_json(dados: Dict[str, Any], destino: Path) -> None:
+    """Grava o resultado em JSON (UTF-8, indentado para facilitar diffs)."""
+    destino.parent.mkdir(parents=True, exist_ok=True)
+    with open(destino, "w", encoding="utf-8") as arquivo:
+        json.dump(dados, arquivo, indent=2, ensure_ascii=False)
@@ -0,0 +1,51 @@
+"""
+Benchmark do 'ApiClient' da CLI contra a API real rodando localmente.
+
+Compara buscas sequenciais de detalhes usando uma conexão nova por chamada
+('requests.request', o comportamento anterior) com a sessão persistente
+(keep-alive) do 'ApiClient', com o cache do cliente desligado para que
+toda chamada chegue à API. Um terceiro cenário mede as mesmas buscas
+respondidas pelo cache.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List
+
+import requests
+
+from ._util import medir, servidor_api
+
+CHAMADAS = 1_000
+
+
+def executar(_raiz: Path) -> List[Dict[str, Any]]:
+    """Mede 'CHAMADAS' buscas sequenciais de detalhes de um restaurante."""
+    from cli.components.api_client import CACHE_TTLS, ApiClient
+
+    with servidor_api() as base_url:
+        nome = requests.get(f"{base_url}/restaurantes", timeout=30).json()[0]["nome"]
+
+        def sem_pool():
+            for _ in range(CHAMADAS):
+                response = requests.request(
+                    "get", f"{base_url}/restaurantes/{nome}", timeout=5
+                )
+                response.raise_for_status()
+                response.json()
+
+        def com_pool():
+            sem_cache = {tipo: 0 for tipo in CACHE_TTLS}
+            with ApiClient(base_url, cache_ttls=sem_cache) as client:
+                for _ in range(CHAMADAS):
+                    client.get_restaurant_details(nome)
+
+        def com_cache():
+            with ApiClient(base_url) as client:
+                for _ in range(CHAMADAS):
+                    client.get_restaurant_details(nome)
+
+        return [
+            medir("api_client.detalhes_sem_pool", sem_pool, CHAMADAS, repeticoes=3),
+            medir("api_client.detalhes_com_pool", com_pool, CHAMADAS, repeticoes=3),
+            medir("api_client.detalhes_com_cache", com_cache, CHAMADAS, repeticoes=3),
+        ]
@@ -0,0 +1,133 @@
+"""
+Benchmark do autocompletar por prefixo ('utils.autocomplete').
+
+Mede o tempo de construção dos índices e a latência das consultas
+('sugerir') com prefixos sorteados de 1 a 12 caracteres, reportando a
+mediana e o p99 (o alvo é ficar abaixo de 1 ms com 1M de nomes):
+- sobre os nomes do catálogo (restaurantes e itens, como na API);
+- sobre nomes sintéticos únicos (pior caso de tamanho do índice).
+
+Uso (1M de nomes):
+    python -m benchmarks.bench_autocomplete --nomes 1000000
+"""
+
+import gc
+import random
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import typer
+
+from ._util import medir
+from .gerar_catalogo import _itens
+
+
+def _nomes_unicos(quantidade: int, semente: int = 42) -> List[Tuple[str, int]]:
+    """Nomes de itens com sufixo único e pesos sorteados."""
+    rng = random.Random(semente)
+    return [
+        (f"{item['item']} {i}", rng.randint(1, 100))
+        for i, item in enumerate(_itens(rng, quantidade))
+    ]
+
+
+def _medir_consultas(
+    nome: str, indice, nomes: List[str], consultas: int, semente: int = 42
+) -> Dict[str, Any]:
+    """Latência de 'sugerir' com prefixos de nomes existentes."""
+    rng = random.Random(semente)
+    prefixos = [rng.choice(nomes)[: rng.randint(1, 12)] for _ in range(consultas)]
+    latencias: List[float] = []
+    gc.collect()
+    for prefixo in prefixos:
+        inicio = time.perf_counter()
+        indice.sugerir(prefixo)
+        latencias.append(time.perf_counter() - inicio)
+    latencias.sort()
+    return {
+        "nome": nome,
+        "operacoes": consultas,
+        "repeticoes": 1,
+        "mediana_s": statistics.median(latencias),
+        "minimo_s": latencias[0],
+        "maximo_s": latencias[-1],
+        "ops_por_segundo": consultas / sum(latencias),
+        "p99_s": latencias[int(len(latencias) * 0.99)],
+        "nomes_indexados": len(indice),
+    }
+
+
+def _medir_sinteticos(
+    quantidade: int, consultas: int, repeticoes: int = 1
+) -> List[Dict[str, Any]]:
+    """Construção e consultas sobre 'quantidade' nomes únicos."""
+    from utils.autocomplete import IndiceAutocomplete
+
+    nomes = _nomes_unicos(quantidade)
+    indices: List[IndiceAutocomplete] = []
+    construcao = medir(
+        "autocomplete.sinteticos.construcao",
+        lambda: indices.append(IndiceAutocomplete(nomes)),
+        quantidade,
+        repeticoes,
+    )
+    consultas_resultado = _medir_consultas(
+        "autocomplete.sinteticos.consulta",
+        indices[-1],
+        [nome for nome, _ in nomes],
+        consultas,
+    )
+    return [construcao, consultas_resultado]
+
+
+def executar(raiz: Path) -> List[Dict[str, Any]]:
+    """Mede os índices do catálogo em 'raiz' e 100 mil nomes sintéticos."""
+    from utils.autocomplete import AutocompleteCatalogo
+    from utils.data_reader import carregar_dados_restaurantes
+
+    restaurantes = list(carregar_dados_restaurantes().values())
+    autocomplete = AutocompleteCatalogo()
+    resultados = [
+        medir(
+            "autocomplete.catalogo.construcao",
+            lambda: autocomplete.construir(restaurantes),
+            len(restaurantes),
+            3,
+        )
+    ]
+    nomes_itens = [item.item for r in restaurantes for item in r.cardapio]
+    if restaurantes:
+        resultados.append(
+            _medir_consultas(
+                "autocomplete.catalogo.restaurantes",
+                autocomplete.restaurantes,
+                [r.nome for r in restaurantes],
+                10_000,
+            )
+        )
+        resultados.append(
+            _medir_consultas(
+                "autocomplete.catalogo.itens", autocomplete.itens, nomes_itens, 10_000
+            )
+        )
+    return resultados + _medir_sinteticos(100_000, 10_000)
+
+
+def main(
+    nomes: int = typer.Option(1_000_000, help="Quantidade de nomes únicos."),
+    consultas: int = typer.Option(100_000, help="Consultas medidas."),
+):
+    """Constrói o índice com nomes sintéticos e imprime p50/p99 das consultas."""
+    construcao, consulta = _medir_sinteticos(nomes, consultas)
+    typer.echo(
+        f"{consulta['nomes_indexados']:,} nomes: construção"
+        f" {construcao['mediana_s']:.2f} s; consulta p50"
+        f" {consulta['mediana_s'] * 1e6:.1f} µs, p99 {consulta['p99_s'] * 1e6:.1f} µs,"
+        f" máx {consulta['maximo_s'] * 1e6:.1f} µs"
+    )
+
+
+if __name__ == "__main__":
+    typer.run(main)
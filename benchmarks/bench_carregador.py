@@ -0,0 +1,42 @@
+"""
+Benchmark do carregador de dados ('utils.data_reader').
+
+Mede a carga sem o cache de cardápios classificados (apagado antes de cada
+repetição: parse, classificação e gravação do cache) e com o cache pronto.
+Falha (RuntimeError) se a carga pelo cache divergir da carga a frio.
+"""
+
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List
+
+from ._util import medir
+
+
+def executar(raiz: Path) -> List[Dict[str, Any]]:
+    """Mede 'carregar_dados_restaurantes' a frio e com o cache de cardápios."""
+    from core.config import settings
+    from utils.data_reader import carregar_dados_restaurantes
+
+    def carregar_a_frio():
+        shutil.rmtree(settings.MENU_CACHE_DIR, ignore_errors=True)
+        return carregar_dados_restaurantes()
+
+    a_frio = carregar_a_frio()
+    if carregar_dados_restaurantes() != a_frio:
+        raise RuntimeError("carregador: a carga pelo cache diverge da carga a frio.")
+    total_itens = sum(len(r.cardapio) for r in a_frio.values())
+    return [
+        medir(
+            "carregador.carregar_dados_restaurantes.sem_cache",
+            carregar_a_frio,
+            total_itens,
+            repeticoes=3,
+        ),
+        medir(
+            "carregador.carregar_dados_restaurantes.com_cache",
+            carregar_dados_restaurantes,
+            total_itens,
+            repeticoes=3,
+        ),
+    ]
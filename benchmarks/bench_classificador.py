@@ -0,0 +1,120 @@
+"""
+Benchmark do classificador de itens: regras ('classify_item') x modelo
+Naive Bayes ('utils.classifier_model', requer numpy).
+
+Mede a vazão dos dois motores sobre os nomes do catálogo e a acurácia de
+cada um no CSV rotulado ('data/rotulos_classificador.csv').
+
+Uso (1M de itens):
+    python -m benchmarks.bench_classificador --itens 1000000
+"""
+
+import json
+import random
+from pathlib import Path
+from typing import Any, Dict, List
+
+import typer
+
+from ._util import RAIZ_PROJETO, medir
+from .gerar_catalogo import _itens
+
+ROTULOS = RAIZ_PROJETO / "data" / "rotulos_classificador.csv"
+
+
+def _nomes_itens(raiz: Path, limite: int = 200_000) -> List[str]:
+    """Lê nomes de itens do catálogo gerado, até 'limite' nomes."""
+    nomes: List[str] = []
+    for file_path in sorted((raiz / "data" / "restaurants").glob("*.json")):
+        with open(file_path, "r", encoding="utf-8") as arquivo:
+            nomes.extend(item["item"] for item in json.load(arquivo))
+        if len(nomes) >= limite:
+            break
+    return nomes[:limite]
+
+
+def _medir_motores(
+    prefixo: str, nomes: List[str], repeticoes: int = 3
+) -> List[Dict[str, Any]]:
+    """Mede os dois motores sobre os mesmos nomes."""
+    from utils.classifier import classify_item
+
+    def classificar_todos():
+        for nome in nomes:
+            classify_item(nome)
+
+    resultados = [
+        medir(f"{prefixo}.classify_item", classificar_todos, len(nomes), repeticoes)
+    ]
+    try:
+        from utils import classifier_model
+    except ImportError:
+        return resultados  # numpy não instalado: só as regras
+
+    modelo = classifier_model.NaiveBayesClassifier.carregar(
+        classifier_model.MODELO_PADRAO
+    )
+
+    def prever_todos():
+        # Sem o cache de atributos da execução anterior
+        classifier_model._atributos_palavra.cache_clear()
+        modelo.predict(nomes)
+
+    resultados.append(
+        medir(f"{prefixo}.modelo_predict", prever_todos, len(nomes), repeticoes)
+    )
+    return resultados
+
+
+def acuracia() -> List[Dict[str, Any]]:
+    """Acurácia das regras e do modelo (validação cruzada) no CSV rotulado."""
+    from utils.classifier import classify_item
+
+    try:
+        from utils.classifier_model import ler_rotulos, validacao_cruzada
+    except ImportError:
+        return []
+
+    nomes, rotulos = ler_rotulos(ROTULOS)
+    regras = sum(classify_item(n) == r for n, r in zip(nomes, rotulos)) / len(nomes)
+    return [
+        {"nome": "classificador.acuracia.regras", "acuracia": regras},
+        {
+            "nome": "classificador.acuracia.modelo",
+            "acuracia": validacao_cruzada(nomes, rotulos),
+        },
+    ]
+
+
+def executar(raiz: Path) -> List[Dict[str, Any]]:
+    """Mede a classificação de todos os nomes de itens do catálogo."""
+    return _medir_motores("classificador", _nomes_itens(raiz))
+
+
+def main(
+    itens: int = typer.Option(1_000_000, help="Quantidade de nomes classificados."),
+    semente: int = typer.Option(42, help="Semente do gerador de nomes."),
+):
+    """Compara vazão e acurácia dos dois motores."""
+    rng = random.Random(semente)
+    repetidos = [item["item"] for item in _itens(rng, itens)]
+    # Pior caso para o cache de atributos: cada nome tem uma palavra inédita
+    unicos = [f"{nome} {i}x" for i, nome in enumerate(repetidos)]
+
+    resultados = (
+        _medir_motores("classificador", repetidos, repeticoes=1)
+        + _medir_motores("classificador_unicos", unicos, repeticoes=1)
+        + acuracia()
+    )
+    for resultado in resultados:
+        if "acuracia" in resultado:
+            typer.echo(f"{resultado['nome']:<40} {resultado['acuracia']:.1%}")
+        else:
+            typer.echo(
+                f"{resultado['nome']:<40} {resultado['mediana_s']:7.2f} s"
+                f"  {resultado['ops_por_segundo']:>12,.0f} itens/s"
+            )
+
+
+if __name__ == "__main__":
+    typer.run(main)
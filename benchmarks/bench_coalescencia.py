@@ -0,0 +1,142 @@
+"""
+Benchmark de "estouro de manada" na listagem filtrada de restaurantes.
+
+Contra a API rodando em outro processo, dispara rodadas de requisições
+idênticas simultâneas ('GET /api/restaurantes?categoria=Fast Food') com
+concorrência crescente e reporta, para cada nível:
+- o tempo de CPU do servidor por requisição (via '/proc/<pid>/stat');
+- a latência mediana das requisições (do envio da rajada à resposta);
+- a fração das requisições atendidas por uma execução compartilhada
+  (contadores de '/health/stats').
+
+Uso:
+    python -m benchmarks.bench_coalescencia --tamanho 1k
+"""
+
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+from urllib.parse import urlsplit
+
+import typer
+
+from ._util import cpu_processo, servidor_api_processo
+from .gerar_catalogo import TAMANHOS, gerar_catalogo
+
+ROTA = "/api/restaurantes?categoria=Fast%20Food"
+
+
+async def _ler_resposta(leitor: asyncio.StreamReader) -> None:
+    """Lê uma resposta HTTP/1.1 com 'Content-Length' e confere o status."""
+    status = await leitor.readline()
+    if b" 200 " not in status:
+        raise RuntimeError(f"Resposta inesperada: {status!r}")
+    tamanho = 0
+    while (linha := await leitor.readline()) != b"\r\n":
+        if linha.lower().startswith(b"content-length:"):
+            tamanho = int(linha.split(b":", 1)[1])
+    await leitor.readexactly(tamanho)
+
+
+async def _rodadas(
+    base_url: str, pid: int, concorrencia: int, requisicoes: int
+) -> Dict[str, Any]:
+    # Conexões cruas: um cliente HTTP em Python serializaria a rajada
+    # (ocupado lendo as respostas grandes) antes de o servidor vê-la inteira
+    import requests
+
+    partes = urlsplit(base_url)
+    pedido = f"GET {ROTA} HTTP/1.1\r\nHost: {partes.hostname}\r\n\r\n".encode()
+    conexoes = [
+        await asyncio.open_connection(partes.hostname, partes.port)
+        for _ in range(concorrencia)
+    ]
+
+    async def rajada() -> List[float]:
+        inicio = time.perf_counter()
+        for _, escritor in conexoes:
+            escritor.write(pedido)
+
+        async def aguardar(leitor: asyncio.StreamReader) -> float:
+            await _ler_resposta(leitor)
+            return time.perf_counter() - inicio
+
+        return list(await asyncio.gather(*(aguardar(l) for l, _ in conexoes)))
+
+    stats_url = f"{partes.scheme}://{partes.netloc}/health/stats"
+    await rajada()  # aquecimento
+    stats_antes = requests.get(stats_url).json()["coalescencia"]
+    cpu_antes = cpu_processo(pid)
+
+    latencias: List[float] = []
+    rodadas = max(1, requisicoes // concorrencia)
+    inicio = time.perf_counter()
+    for _ in range(rodadas):
+        latencias += await rajada()
+    duracao = time.perf_counter() - inicio
+
+    cpu_depois = cpu_processo(pid)
+    stats_depois = requests.get(stats_url).json()["coalescencia"]
+    for _, escritor in conexoes:
+        escritor.close()
+
+    executadas = stats_depois["executadas"] - stats_antes["executadas"]
+    compartilhadas = stats_depois["compartilhadas"] - stats_antes["compartilhadas"]
+    total = len(latencias)
+    return {
+        "nome": f"coalescencia.concorrencia_{concorrencia}",
+        "operacoes": total,
+        "repeticoes": rodadas,
+        "mediana_s": statistics.median(latencias),
+        "minimo_s": min(latencias),
+        "maximo_s": max(latencias),
+        "ops_por_segundo": total / duracao,
+        "concorrencia": concorrencia,
+        "cpu_por_requisicao_ms": (
+            (cpu_depois - cpu_antes) / total * 1000
+            if cpu_antes is not None and cpu_depois is not None
+            else None
+        ),
+        "execucoes": executadas,
+        "fracao_compartilhada": compartilhadas / max(1, executadas + compartilhadas),
+    }
+
+
+def executar(
+    raiz: Path,
+    concorrencias: Sequence[int] = (1, 10, 100, 500),
+    requisicoes: int = 500,
+) -> List[Dict[str, Any]]:
+    """Mede a listagem filtrada sob concorrência crescente."""
+    with servidor_api_processo(raiz) as (url, pid):
+        return [
+            asyncio.run(_rodadas(url, pid, concorrencia, requisicoes))
+            for concorrencia in concorrencias
+        ]
+
+
+def main(
+    tamanho: str = typer.Option(
+        "1k", help=f"Tamanho do catálogo sintético: {', '.join(TAMANHOS)}."
+    ),
+    requisicoes: int = typer.Option(500, help="Requisições por nível."),
+):
+    """Gera um catálogo temporário e imprime CPU/requisição por concorrência."""
+    with tempfile.TemporaryDirectory(prefix="sabor_coalescencia_") as temp_dir:
+        gerar_catalogo(Path(temp_dir), *TAMANHOS[tamanho])
+        for resultado in executar(Path(temp_dir), requisicoes=requisicoes):
+            cpu = resultado["cpu_por_requisicao_ms"]
+            typer.echo(
+                f"concorrência {resultado['concorrencia']:>4}:"
+                f" CPU {cpu or 0:8.2f} ms/requisição,"
+                f" latência p50 {resultado['mediana_s'] * 1000:8.1f} ms,"
+                f" {resultado['execucoes']:>4} execuções,"
+                f" {resultado['fracao_compartilhada']:.0%} compartilhadas"
+            )
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,61 @@
+"""
+Benchmark dos endpoints da API através de um cliente em processo.
+
+Usa o 'TestClient' do FastAPI (requer 'httpx'), que executa o ciclo de vida
+completo da aplicação, incluindo o carregamento do catálogo gerado.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List
+
+from ._util import aguardar_catalogo, medir
+
+
+def executar(raiz: Path, requisicoes: int = 50) -> List[Dict[str, Any]]:
+    """Mede cada endpoint de 'restaurantes' com 'requisicoes' chamadas."""
+    from fastapi.testclient import TestClient
+    from api.router import app
+
+    resultados: List[Dict[str, Any]] = []
+    with TestClient(app) as client:
+        aguardar_catalogo(client)
+        nomes = [r["nome"] for r in client.get("/api/restaurantes").json()]
+        alvo = nomes[len(nomes) // 2]
+
+        def repetir(method: str, url: str, **kwargs):
+            def rodar():
+                for _ in range(requisicoes):
+                    client.request(method, url, **kwargs).raise_for_status()
+
+            return rodar
+
+        cenarios = {
+            "endpoints.listar": ("GET", "/api/restaurantes", {}),
+            "endpoints.listar_filtrado": (
+                "GET",
+                "/api/restaurantes",
+                {"params": {"categoria": "Fast Food", "ativo": True}},
+            ),
+            "endpoints.detalhe": ("GET", f"/api/restaurantes/{alvo}", {}),
+            "endpoints.toggle": (
+                "PATCH",
+                f"/api/restaurantes/{alvo}/toggle_status",
+                {},
+            ),
+        }
+        for nome, (method, url, kwargs) in cenarios.items():
+            resultados.append(
+                medir(nome, repetir(method, url, **kwargs), requisicoes, repeticoes=3)
+            )
+
+        contador = iter(range(10**9))
+
+        def criar():
+            for _ in range(requisicoes):
+                client.post(
+                    "/api/restaurantes",
+                    json={"nome": f"Bench Novo {next(contador)}", "categoria": "Teste"},
+                ).raise_for_status()
+
+        resultados.append(medir("endpoints.criar", criar, requisicoes, repeticoes=3))
+    return resultados
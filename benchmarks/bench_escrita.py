@@ -0,0 +1,70 @@
+"""
+Benchmark da gravação incremental do 'data_fetcher' ('salvar_restaurantes').
+
+Usa um conjunto próprio de 10k restaurantes e reporta tempo e volume de
+escrita na primeira gravação, numa atualização sem mudanças, numa com 1%
+dos restaurantes alterados e na gravação em formato compacto.
+"""
+
+import contextlib
+import io
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from .gerar_catalogo import _itens
+
+RESTAURANTES = 10_000
+ITENS_POR_RESTAURANTE = 20
+
+
+def _gravar(
+    nome: str, agrupados: Dict[str, List[dict]], compacto: bool = False
+) -> Dict[str, Any]:
+    from utils.data_fetcher import salvar_restaurantes
+
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        estatisticas = salvar_restaurantes(agrupados, compacto)
+    segundos = time.perf_counter() - inicio
+    return {
+        "nome": nome,
+        "operacoes": len(agrupados),
+        "repeticoes": 1,
+        "mediana_s": segundos,
+        "minimo_s": segundos,
+        "maximo_s": segundos,
+        "ops_por_segundo": len(agrupados) / segundos if segundos else None,
+        **estatisticas,
+    }
+
+
+def executar(_raiz: Path) -> List[Dict[str, Any]]:
+    """Mede as gravações num diretório temporário."""
+    from core.config import settings
+
+    rng = random.Random(7)
+    agrupados = {
+        f"Restaurante {i:06d}": list(_itens(rng, ITENS_POR_RESTAURANTE))
+        for i in range(RESTAURANTES)
+    }
+
+    raiz_original = settings.PROJECT_ROOT
+    try:
+        with tempfile.TemporaryDirectory(prefix="sabor_escrita_") as temp_dir:
+            settings.PROJECT_ROOT = Path(temp_dir)
+            resultados = [
+                _gravar("escrita.primeira_gravacao", agrupados),
+                _gravar("escrita.atualizacao_inalterada", agrupados),
+            ]
+            for nome in rng.sample(sorted(agrupados), RESTAURANTES // 100):
+                agrupados[nome][0]["price"] += 1
+            resultados.append(_gravar("escrita.atualizacao_1pct", agrupados))
+            resultados.append(
+                _gravar("escrita.conversao_compacta", agrupados, compacto=True)
+            )
+    finally:
+        settings.PROJECT_ROOT = raiz_original
+    return resultados
@@ -0,0 +1,131 @@
+"""
+Benchmark do fluxo de eventos (SSE) com muitos assinantes ociosos.
+
+Abre 'assinantes' conexões em '/api/eventos' contra a API rodando em outro
+processo e reporta:
+- a memória do servidor por assinante conectado;
+- a latência de difusão: do 'toggle_status' até o evento chegar a cada
+  assinante (p50/p99/máx), repetida algumas vezes.
+
+Uso:
+    python -m benchmarks.bench_eventos --assinantes 5000
+"""
+
+import asyncio
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+from urllib.parse import urlsplit
+
+import typer
+
+from ._util import RAIZ_PROJETO, memoria_processo, servidor_api_processo
+
+
+async def _conectar(host: str, porta: int) -> Tuple[asyncio.StreamReader, Any]:
+    """Abre uma assinatura e aguarda o início do fluxo ('retry:')."""
+    leitor, escritor = await asyncio.open_connection(host, porta)
+    escritor.write(
+        f"GET /api/eventos HTTP/1.1\r\nHost: {host}\r\n"
+        "Accept: text/event-stream\r\n\r\n".encode()
+    )
+    await escritor.drain()
+    while b"retry:" not in await leitor.readline():
+        pass
+    return leitor, escritor
+
+
+async def _aguardar_evento(leitor: asyncio.StreamReader) -> float:
+    """Retorna o instante em que o próximo evento chegou."""
+    while True:
+        linha = await leitor.readline()
+        if not linha:
+            raise ConnectionError("Assinatura encerrada pelo servidor.")
+        if linha.startswith(b"event: status_alterado"):
+            return time.perf_counter()
+
+
+async def _medir(
+    base_url: str, pid: int, assinantes: int, rodadas: int
+) -> Dict[str, Any]:
+    import httpx
+    from utils.load_tester import percentil
+
+    partes = urlsplit(base_url)
+    rss_antes = memoria_processo(pid)
+
+    conexoes: List[Tuple[asyncio.StreamReader, Any]] = []
+    for inicio in range(0, assinantes, 500):
+        conexoes += await asyncio.gather(
+            *(
+                _conectar(partes.hostname, partes.port)
+                for _ in range(min(500, assinantes - inicio))
+            )
+        )
+    await asyncio.sleep(0.5)
+    rss_depois = memoria_processo(pid)
+
+    latencias: List[float] = []
+    duracao = 0.0
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        nome = (await client.get("/restaurantes")).json()[0]["nome"]
+        for _ in range(rodadas):
+            chegadas = [
+                asyncio.ensure_future(_aguardar_evento(leitor))
+                for leitor, _ in conexoes
+            ]
+            envio = time.perf_counter()
+            (
+                await client.patch(f"/restaurantes/{nome}/toggle_status")
+            ).raise_for_status()
+            rodada = [chegada - envio for chegada in await asyncio.gather(*chegadas)]
+            latencias += rodada
+            duracao += max(rodada)
+
+    for _, escritor in conexoes:
+        escritor.close()
+
+    latencias.sort()
+    return {
+        "nome": "eventos.difusao",
+        "operacoes": assinantes * rodadas,
+        "repeticoes": rodadas,
+        "mediana_s": statistics.median(latencias),
+        "minimo_s": latencias[0],
+        "maximo_s": latencias[-1],
+        # Entregas por segundo, até o último assinante de cada rodada
+        "ops_por_segundo": assinantes * rodadas / duracao,
+        "assinantes": assinantes,
+        "p99_s": percentil(latencias, 99),
+        "servidor_kib_por_assinante": (
+            (rss_depois - rss_antes) / assinantes if rss_antes and rss_depois else None
+        ),
+    }
+
+
+def executar(
+    raiz: Path, assinantes: int = 1000, rodadas: int = 5
+) -> List[Dict[str, Any]]:
+    """Mede a difusão de eventos para 'assinantes' conexões ociosas."""
+    with servidor_api_processo(raiz) as (url, pid):
+        return [asyncio.run(_medir(url, pid, assinantes, rodadas))]
+
+
+def main(
+    assinantes: int = typer.Option(5000, help="Conexões SSE abertas."),
+    rodadas: int = typer.Option(5, help="Eventos publicados (um por rodada)."),
+):
+    """Imprime memória por assinante e latência de difusão."""
+    resultado = executar(RAIZ_PROJETO, assinantes, rodadas)[0]
+    typer.echo(
+        f"{resultado['assinantes']} assinantes:"
+        f" {resultado['servidor_kib_por_assinante']:.1f} KiB/assinante no servidor;"
+        f" difusão p50 {resultado['mediana_s'] * 1000:.1f} ms,"
+        f" p99 {resultado['p99_s'] * 1000:.1f} ms,"
+        f" máx {resultado['maximo_s'] * 1000:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    typer.run(main)
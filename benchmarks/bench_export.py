@@ -0,0 +1,143 @@
+"""
+Benchmark da exportação em streaming (NDJSON) contra a lista JSON completa.
+
+Para cada cenário, um processo cliente novo consome a resposta da API (que
+roda em outro processo) e reporta:
+- o tempo até a primeira linha utilizável e o tempo total;
+- o pico de memória (RSS) do cliente;
+- o quanto o pico de memória do servidor cresceu durante a resposta
+  (via '/proc/<pid>/status'; só no Linux, senão fica None).
+
+Uso (1M de itens):
+    python -m benchmarks.bench_export --restaurantes 10000 --itens 100
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List
+
+import typer
+
+from ._util import RAIZ_PROJETO, memoria_processo, servidor_api_processo
+from .gerar_catalogo import gerar_catalogo
+
+# Código executado no processo cliente de cada cenário
+CENARIOS: Dict[str, str] = {
+    # Forma anterior: a lista completa (com os cardápios) num único JSON
+    "json_completo": (
+        "dados = requests.get(f'{url}/restaurantes').json()\n"
+        "marcar()\n"
+        "linhas = sum(len(r['cardapio']) for r in dados)\n"
+    ),
+    "ndjson_itens": (
+        "for linhas, _ in enumerate(ApiClient(url).export_restaurants('itens'), 1):\n"
+        "    marcar()\n"
+    ),
+    # Listagem da CLI: antes com a lista completa, agora em streaming. A
+    # primeira linha conta quando chega ao terminal (ver 'Saida' abaixo).
+    "cli_lista_json": (
+        "dados = ApiClient(url).get_restaurants()\n"
+        "linhas = MenuUI.display_restaurant_list(dados)\n"
+    ),
+    "cli_lista_ndjson": (
+        "linhas = MenuUI.display_restaurant_list(ApiClient(url).export_restaurants())\n"
+    ),
+}
+
+_SONDA = (
+    "import json, os, resource, sys, time\n"
+    "import requests\n"
+    "from cli.components.api_client import ApiClient\n"
+    "from cli.components.ui import MenuUI\n"
+    "url = {url!r}\n"
+    "primeira = None\n"
+    "def marcar():\n"
+    "    global primeira\n"
+    "    if primeira is None:\n"
+    "        primeira = time.perf_counter() - inicio\n"
+    "class Saida:\n"
+    "    destino = open(os.devnull, 'w')\n"
+    "    def write(self, texto):\n"
+    "        marcar()\n"
+    "        return self.destino.write(texto)\n"
+    "    def flush(self):\n"
+    "        self.destino.flush()\n"
+    "sys.stdout = Saida()\n"
+    "inicio = time.perf_counter()\n"
+    "{codigo}"
+    "total = time.perf_counter() - inicio\n"
+    "sys.stderr.write(json.dumps({{'primeira_s': primeira, 'total_s': total,"
+    " 'linhas': linhas,"
+    " 'rss_pico_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}}))\n"
+)
+
+
+def _zerar_pico(pid: int) -> None:
+    """Reinicia o VmHWM (pico de RSS) do processo, quando suportado."""
+    try:
+        with open(f"/proc/{pid}/clear_refs", "w", encoding="utf-8") as refs:
+            refs.write("5")
+    except OSError:
+        pass
+
+
+def medir_cenario(nome: str, url: str, pid: int) -> Dict[str, Any]:
+    """Roda o cenário num processo cliente novo e agrega as medidas."""
+    _zerar_pico(pid)
+    rss_antes = memoria_processo(pid, "VmRSS")
+    processo = subprocess.run(
+        [sys.executable, "-c", _SONDA.format(url=url, codigo=CENARIOS[nome])],
+        cwd=RAIZ_PROJETO / "src",
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    pico = memoria_processo(pid, "VmHWM")
+    dados = json.loads(processo.stderr.strip().splitlines()[-1])
+    return {
+        "nome": f"export.{nome}",
+        "operacoes": dados["linhas"],
+        "repeticoes": 1,
+        "mediana_s": dados["total_s"],
+        "minimo_s": dados["total_s"],
+        "maximo_s": dados["total_s"],
+        "ops_por_segundo": (
+            dados["linhas"] / dados["total_s"] if dados["total_s"] else None
+        ),
+        "primeira_linha_s": dados["primeira_s"],
+        "cliente_rss_pico_mb": dados["rss_pico_kb"] / 1024,
+        "servidor_rss_acrescimo_mb": (
+            (pico - rss_antes) / 1024 if pico and rss_antes else None
+        ),
+    }
+
+
+def executar(raiz: Path) -> List[Dict[str, Any]]:
+    """Mede todos os cenários contra uma API servindo o catálogo de 'raiz'."""
+    with servidor_api_processo(raiz) as (url, pid):
+        return [medir_cenario(nome, url, pid) for nome in CENARIOS]
+
+
+def main(
+    restaurantes: int = typer.Option(10_000, help="Restaurantes no catálogo."),
+    itens: int = typer.Option(100, help="Itens por restaurante."),
+):
+    """Gera um catálogo temporário e imprime as medidas de cada cenário."""
+    with tempfile.TemporaryDirectory(prefix="sabor_export_") as temp_dir:
+        gerar_catalogo(Path(temp_dir), restaurantes, itens)
+        for resultado in executar(Path(temp_dir)):
+            servidor = resultado["servidor_rss_acrescimo_mb"]
+            typer.echo(
+                f"{resultado['nome']:<25} {resultado['operacoes']:>9} linhas"
+                f"  1a linha {resultado['primeira_linha_s'] * 1000:8.1f} ms"
+                f"  total {resultado['mediana_s']:6.2f} s"
+                f"  cliente {resultado['cliente_rss_pico_mb']:7.1f} MB"
+                f"  servidor +{servidor or 0:7.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,224 @@
+"""
+Benchmark do 'data_fetcher' contra um servidor local que simula a fonte.
+
+Compara uma busca completa com uma atualização sem mudanças (304) e mede
+a retomada de um download interrompido, reportando bytes transferidos.
+
+Cada cenário também confere o resultado e falha (RuntimeError) se:
+- a atualização sem mudanças gravar algum arquivo;
+- o parcial de um download interrompido não guardar todos os bytes que
+  chegaram antes da queda;
+- a retomada não produzir os mesmos arquivos que uma busca completa;
+- um parcial inválido (HTTP 416) ou de outra versão da fonte ('If-Range'
+  diferente) não levar a um download completo e correto.
+"""
+
+import contextlib
+import hashlib
+import io
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from .servidor_fonte import ServidorFonte
+
+
+def _gerar_registros(raiz: Path, limite: int = 200_000) -> List[Dict[str, Any]]:
+    """Monta os registros da fonte, no formato original, a partir do catálogo."""
+    registros: List[Dict[str, Any]] = []
+    for file_path in sorted((raiz / "data" / "restaurants").glob("*.json")):
+        company = file_path.stem.replace("_", " ").title()
+        with open(file_path, "r", encoding="utf-8") as arquivo:
+            for item in json.load(arquivo):
+                registros.append(
+                    {
+                        "Company": company,
+                        "Item": item["item"],
+                        "price": item["price"],
+                        "description": item["description"],
+                    }
+                )
+        if len(registros) >= limite:
+            break
+    return registros
+
+
+def _versao(registros: List[Dict[str, Any]], semente: int) -> bytes:
+    """Corpo de uma nova versão da fonte, com alguns preços alterados."""
+    rng = random.Random(semente)
+    alterados = [dict(registro) for registro in registros]
+    for registro in rng.sample(alterados, max(1, len(alterados) // 100)):
+        registro["price"] = round(registro["price"] + rng.randint(1, 9), 2)
+    return json.dumps(alterados, ensure_ascii=False).encode("utf-8")
+
+
+def _arquivos(pasta: Path) -> Dict[str, str]:
+    """Hash do conteúdo de cada cardápio gravado em 'pasta'."""
+    return {
+        file_path.name: hashlib.sha256(file_path.read_bytes()).hexdigest()
+        for file_path in sorted(pasta.glob("*.json"))
+    }
+
+
+def _gravacoes(raiz: Path) -> Dict[str, int]:
+    """mtime de todos os arquivos sob 'raiz' (cardápios, manifesto e estado)."""
+    return {
+        str(file_path): file_path.stat().st_mtime_ns
+        for file_path in raiz.rglob("*")
+        if file_path.is_file()
+    }
+
+
+def _conferir(condicao: bool, mensagem: str) -> None:
+    if not condicao:
+        raise RuntimeError(f"data_fetcher: {mensagem}")
+
+
+def _referencia(corpo: bytes) -> Dict[str, str]:
+    """Arquivos de uma busca completa de 'corpo' num diretório novo."""
+    from core.config import settings
+
+    raiz_atual = settings.PROJECT_ROOT
+    try:
+        with tempfile.TemporaryDirectory(prefix="sabor_fetch_ref_") as temp_dir:
+            settings.PROJECT_ROOT = Path(temp_dir)
+            with ServidorFonte(corpo) as servidor:
+                _buscar(servidor, servidor.url)
+            return _arquivos(settings.DATA_DIR)
+    finally:
+        settings.PROJECT_ROOT = raiz_atual
+
+
+def _buscar(servidor: ServidorFonte, url: str) -> Dict[str, Any]:
+    from utils.data_fetcher import process_and_save_restaurants
+
+    bytes_antes = servidor.bytes_enviados
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        process_and_save_restaurants(url)
+    return {
+        "segundos": time.perf_counter() - inicio,
+        "bytes": servidor.bytes_enviados - bytes_antes,
+    }
+
+
+def _resultado(nome: str, medida: Dict[str, Any], **extras) -> Dict[str, Any]:
+    return {
+        "nome": nome,
+        "operacoes": 1,
+        "repeticoes": 1,
+        "mediana_s": medida["segundos"],
+        "minimo_s": medida["segundos"],
+        "maximo_s": medida["segundos"],
+        "ops_por_segundo": 1 / medida["segundos"] if medida["segundos"] else None,
+        "bytes_transferidos": medida["bytes"],
+        **extras,
+    }
+
+
+def _interromper(servidor: ServidorFonte, semente: int) -> None:
+    """Corta a próxima transferência entre 1/4 e 1/2 do corpo."""
+    tamanho = len(servidor.corpo)
+    servidor.interromper_apos = random.Random(semente).randint(
+        tamanho // 4, tamanho // 2
+    )
+
+
+def executar(raiz: Path) -> List[Dict[str, Any]]:
+    """Mede busca completa, atualização sem mudanças, retomada e reinícios."""
+    from core.config import settings
+    from utils.data_fetcher import _carregar_estado, _salvar_estado
+
+    registros = _gerar_registros(raiz)
+    corpo = json.dumps(registros, ensure_ascii=False).encode("utf-8")
+    versoes = [_versao(registros, semente) for semente in range(1, 5)]
+    raiz_original = settings.PROJECT_ROOT
+    try:
+        with tempfile.TemporaryDirectory(prefix="sabor_fetch_") as temp_dir:
+            settings.PROJECT_ROOT = Path(temp_dir)
+            parcial = settings.FETCH_STATE_FILE.with_name(
+                "restaurantes_fonte.json.partial"
+            )
+            with ServidorFonte(corpo) as servidor:
+                completa = _buscar(servidor, servidor.url)
+                _conferir(
+                    _arquivos(settings.DATA_DIR) == _referencia(corpo),
+                    "a busca completa não gravou os cardápios esperados.",
+                )
+
+                antes = _gravacoes(Path(temp_dir))
+                inalterada = _buscar(servidor, servidor.url)
+                _conferir(
+                    _gravacoes(Path(temp_dir)) == antes,
+                    "a atualização sem mudanças (304) gravou arquivos.",
+                )
+
+                # Nova versão da fonte, com a primeira transferência cortada
+                servidor.atualizar(versoes[0])
+                _interromper(servidor, 0)
+                interrompida = _buscar(servidor, servidor.url)
+                ja_baixados = parcial.stat().st_size if parcial.exists() else 0
+                _conferir(
+                    ja_baixados == interrompida["bytes"],
+                    f"o parcial guardou {ja_baixados} dos"
+                    f" {interrompida['bytes']} bytes recebidos antes da queda.",
+                )
+                retomada = _buscar(servidor, servidor.url)
+                _conferir(
+                    retomada["bytes"] == len(versoes[0]) - ja_baixados,
+                    "a retomada baixou o corpo de novo em vez de continuar.",
+                )
+                _conferir(
+                    _arquivos(settings.DATA_DIR) == _referencia(versoes[0]),
+                    "a retomada não produziu os mesmos arquivos da busca completa.",
+                )
+
+                # Parcial que já não corresponde à fonte: o servidor responde 416
+                servidor.atualizar(versoes[1])
+                parcial.write_bytes(b"x" * (len(versoes[1]) + 1))
+                estado = _carregar_estado()
+                estado["parcial"] = {"url": servidor.url, "etag": servidor.etag}
+                _salvar_estado(estado)
+                reinicio_416 = _buscar(servidor, servidor.url)
+                _conferir(
+                    _arquivos(settings.DATA_DIR) == _referencia(versoes[1]),
+                    "o reinício após HTTP 416 não produziu os arquivos esperados.",
+                )
+
+                # A fonte muda entre a interrupção e a retomada: 'If-Range'
+                # não confere e o servidor devolve o corpo novo inteiro
+                servidor.atualizar(versoes[2])
+                _interromper(servidor, 1)
+                _buscar(servidor, servidor.url)
+                servidor.atualizar(versoes[3])
+                reinicio_if_range = _buscar(servidor, servidor.url)
+                _conferir(
+                    reinicio_if_range["bytes"] == len(versoes[3]),
+                    "a retomada com 'If-Range' diferente não baixou o corpo novo.",
+                )
+                _conferir(
+                    _arquivos(settings.DATA_DIR) == _referencia(versoes[3]),
+                    "o reinício por 'If-Range' não produziu os arquivos esperados.",
+                )
+                _conferir(
+                    not parcial.exists(), "sobrou um download parcial após a busca."
+                )
+    finally:
+        settings.PROJECT_ROOT = raiz_original
+
+    economia = 1 - inalterada["bytes"] / completa["bytes"] if completa["bytes"] else 0
+    return [
+        _resultado("fetcher.busca_completa", completa),
+        _resultado(
+            "fetcher.atualizacao_inalterada",
+            inalterada,
+            bytes_economizados=completa["bytes"] - inalterada["bytes"],
+            fracao_economizada=economia,
+        ),
+        _resultado("fetcher.retomada", retomada, bytes_totais=len(versoes[0])),
+        _resultado("fetcher.reinicio_416", reinicio_416),
+        _resultado("fetcher.reinicio_if_range", reinicio_if_range),
+    ]
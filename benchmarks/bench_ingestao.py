@@ -0,0 +1,146 @@
+"""
+Benchmark da ingestão de itens de cardápio em NDJSON (streaming).
+
+Contra a API rodando em outro processo, envia 'itens' linhas para
+'POST /api/restaurantes/<nome>/cardapio' e reporta, por cenário:
+- linhas por segundo (do início do envio à resposta);
+- o aumento do pico de memória (VmHWM) do servidor.
+
+Cenários:
+- 'validos': todas as linhas são incluídas no cardápio;
+- 'rejeitados': nenhuma linha é válida (sem 'price'), então o aumento de
+  memória mostra só o custo do processamento em streaming, que não deve
+  crescer com o tamanho do envio;
+- 'documento_unico': referência com o cadastro de um restaurante com o
+  cardápio inteiro num único JSON ('POST /api/restaurantes').
+
+Uso (1M de linhas):
+    python -m benchmarks.bench_ingestao --itens 1000000
+"""
+
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+import typer
+
+from ._util import memoria_processo, servidor_api_processo
+from .gerar_catalogo import _itens, gerar_catalogo
+
+RESTAURANTE = "Restaurante 000000"
+TAMANHO_BLOCO = 64 * 1024
+
+
+def _blocos(linhas: Iterator[str]) -> List[bytes]:
+    """Agrupa as linhas NDJSON em blocos de ~TAMANHO_BLOCO (gerados antes de medir)."""
+    blocos: List[bytes] = []
+    atual: List[str] = []
+    tamanho = 0
+    for linha in linhas:
+        atual.append(linha)
+        tamanho += len(linha) + 1
+        if tamanho >= TAMANHO_BLOCO:
+            blocos.append(("\n".join(atual) + "\n").encode())
+            atual, tamanho = [], 0
+    if atual:
+        blocos.append(("\n".join(atual) + "\n").encode())
+    return blocos
+
+
+def _medir(raiz: Path, nome: str, itens: int, enviar, corpo: Any) -> Dict[str, Any]:
+    """Sobe a API, envia 'corpo' com 'enviar(url, corpo)' e mede tempo e memória."""
+    with servidor_api_processo(raiz) as (url, pid):
+        antes = memoria_processo(pid, "VmHWM")
+        inicio = time.perf_counter()
+        resultado = enviar(url, corpo)
+        duracao = time.perf_counter() - inicio
+        depois = memoria_processo(pid, "VmHWM")
+    return {
+        "nome": f"ingestao.{nome}",
+        "operacoes": itens,
+        "repeticoes": 1,
+        "mediana_s": duracao,
+        "minimo_s": duracao,
+        "maximo_s": duracao,
+        "ops_por_segundo": itens / duracao,
+        "aumento_pico_memoria_kib": (
+            depois - antes if antes is not None and depois is not None else None
+        ),
+        **resultado,
+    }
+
+
+def _enviar_ndjson(url: str, blocos: List[bytes]) -> Dict[str, Any]:
+    import requests
+
+    resposta = requests.post(
+        f"{url}/restaurantes/{RESTAURANTE}/cardapio",
+        data=iter(blocos),
+        headers={"Content-Type": "application/x-ndjson"},
+        timeout=600,
+    )
+    resposta.raise_for_status()
+    corpo = resposta.json()
+    return {chave: corpo[chave] for chave in ("recebidos", "incluidos", "rejeitados")}
+
+
+def _enviar_documento(url: str, documento: bytes) -> Dict[str, Any]:
+    import requests
+
+    resposta = requests.post(
+        f"{url}/restaurantes",
+        data=documento,
+        headers={"Content-Type": "application/json"},
+        timeout=600,
+    )
+    resposta.raise_for_status()
+    return {"incluidos": len(resposta.json()["cardapio"])}
+
+
+def executar(raiz: Path, itens: int = 100_000) -> List[Dict[str, Any]]:
+    """Mede os cenários de ingestão com 'itens' linhas sobre o catálogo de 'raiz'."""
+    rng = random.Random(42)
+    dados = list(_itens(rng, itens))
+    validos = _blocos(json.dumps(item, ensure_ascii=False) for item in dados)
+    rejeitados = _blocos(
+        json.dumps({"item": item["item"]}, ensure_ascii=False) for item in dados
+    )
+    resultados = [
+        _medir(raiz, "validos", itens, _enviar_ndjson, validos),
+        _medir(raiz, "rejeitados", itens, _enviar_ndjson, rejeitados),
+    ]
+    del validos, rejeitados
+    documento = json.dumps(
+        {
+            "nome": "Franquia Ingestao",
+            "categoria": "Fast Food",
+            "cardapio": [{**item, "categoria": "OUTROS"} for item in dados],
+        },
+        ensure_ascii=False,
+    ).encode()
+    resultados.append(
+        _medir(raiz, "documento_unico", itens, _enviar_documento, documento)
+    )
+    return resultados
+
+
+def main(
+    itens: int = typer.Option(1_000_000, help="Linhas (itens) enviadas."),
+):
+    """Gera um catálogo pequeno e imprime linhas/s e memória por cenário."""
+    with tempfile.TemporaryDirectory(prefix="sabor_ingestao_") as temp_dir:
+        gerar_catalogo(Path(temp_dir), 10, 50)
+        for resultado in executar(Path(temp_dir), itens):
+            memoria = resultado["aumento_pico_memoria_kib"]
+            typer.echo(
+                f"{resultado['nome']:<26} {resultado['ops_por_segundo']:>10,.0f}"
+                f" linhas/s  pico de memória +{(memoria or 0) / 1024:7.1f} MiB"
+                f"  incluídos {resultado['incluidos']:,}"
+            )
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,73 @@
+"""
+Benchmark (e verificação) do teste de carga ('utils.load_tester').
+
+Antes de medir, confere 'percentil' com amostras pequenas de resultado
+conhecido (posto mais próximo) e falha (RuntimeError) se algum divergir.
+Depois, roda o teste de carga por alguns segundos contra a API em outro
+processo, com uma mistura só de leituras, e reporta vazão e latências.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List
+
+from ._util import servidor_api_processo
+
+DURACAO_S = 3.0
+CONCORRENCIA = 10
+MIX = {"listar": 20, "filtrar": 30, "detalhe": 50}
+
+# (quantidade de amostras 1..n, p, valor esperado)
+PERCENTIS_CONHECIDOS = [
+    (10, 50, 5),
+    (10, 90, 9),
+    (10, 95, 10),
+    (10, 100, 10),
+    (10, 0, 1),
+    (4, 50, 2),
+    (4, 75, 3),
+    (4, 99, 4),
+    (30, 5, 2),
+    (50, 5, 3),
+    (100, 7, 7),
+    (1000, 99.9, 999),
+    (1, 50, 1),
+]
+
+
+def _conferir_percentis() -> None:
+    from utils.load_tester import percentil
+
+    if percentil([], 50) != 0.0:
+        raise RuntimeError("percentil: uma lista vazia deve resultar em 0.0.")
+    for quantidade, p, esperado in PERCENTIS_CONHECIDOS:
+        obtido = percentil([float(v) for v in range(1, quantidade + 1)], p)
+        if obtido != esperado:
+            raise RuntimeError(
+                f"percentil: p{p} de 1..{quantidade} deu {obtido}, esperado {esperado}."
+            )
+
+
+def executar(raiz: Path) -> List[Dict[str, Any]]:
+    """Confere os percentis e mede o teste de carga com leituras."""
+    from utils.load_tester import run_load_test
+
+    _conferir_percentis()
+    with servidor_api_processo(raiz) as (url, _pid):
+        relatorio = run_load_test(
+            url, mix=MIX, concorrencia=CONCORRENCIA, duracao=DURACAO_S
+        )
+    latencia = relatorio["latencia"]
+    return [
+        {
+            "nome": "loadtest.leituras",
+            "operacoes": relatorio["requisicoes"],
+            "repeticoes": 1,
+            "mediana_s": latencia["p50_ms"] / 1000,
+            "minimo_s": latencia["p50_ms"] / 1000,
+            "maximo_s": latencia["max_ms"] / 1000,
+            "ops_por_segundo": relatorio["vazao_rps"],
+            "p95_s": latencia["p95_ms"] / 1000,
+            "p99_s": latencia["p99_ms"] / 1000,
+            "erros": relatorio["erros"],
+        }
+    ]
@@ -0,0 +1,87 @@
+"""
+Benchmark (e verificação) do profiling sob demanda ('api.profiling').
+
+Contra a API rodando em outro processo, com 'PROFILING_TOKEN' definido,
+mede a exportação NDJSON e a listagem JSON com e sem o cabeçalho
+'X-Profile' (o custo do profiling) e confere os perfis gravados. Falha
+(RuntimeError) se:
+- a resposta perfilada não trouxer 'X-Profile-File' ou o arquivo não for
+  gravado;
+- o perfil da exportação em streaming não contiver a geração do corpo
+  ('_em_blocos', '_linhas') e a serialização dos itens ('model_dump_json');
+- o perfil da listagem (handler assíncrono) não contiver a consulta e a
+  serialização ('_listar_json', 'dump_json').
+"""
+
+import pstats
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Set
+
+import requests
+
+from ._util import medir, servidor_api_processo
+
+TOKEN = "bench-profiling"
+REPETICOES = 5
+
+# Rota -> funções que o perfil precisa conter
+CENARIOS: Dict[str, tuple] = {
+    "exportacao_ndjson": (
+        "/exportar/restaurantes?nivel=itens",
+        {"_em_blocos", "_linhas", "model_dump_json"},
+    ),
+    "listagem_json": ("/restaurantes", {"_listar_json", "dump_json"}),
+}
+
+
+def _conferir(condicao: bool, mensagem: str) -> None:
+    if not condicao:
+        raise RuntimeError(f"profiling: {mensagem}")
+
+
+def _funcoes(file_path: Path, espera: float = 10.0) -> Set[str]:
+    """Nomes das funções registradas no perfil (gravado ao fim do envio)."""
+    limite = time.monotonic() + espera
+    while not file_path.exists() and time.monotonic() < limite:
+        time.sleep(0.05)
+    _conferir(file_path.exists(), f"o perfil '{file_path.name}' não foi gravado.")
+    return {funcao for _, _, funcao in pstats.Stats(str(file_path)).stats}
+
+
+def executar(raiz: Path) -> List[Dict[str, Any]]:
+    """Mede cada cenário com e sem profiling e confere o conteúdo dos perfis."""
+    resultados: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="sabor_profiling_") as temp_dir:
+        variaveis = {"PROFILING_TOKEN": TOKEN, "PROFILE_DIR": temp_dir}
+        with servidor_api_processo(raiz, variaveis=variaveis) as (url, _pid):
+            with requests.Session() as sessao:
+                for nome, (rota, esperadas) in CENARIOS.items():
+
+                    def buscar(headers=None, rota=rota):
+                        resposta = sessao.get(url + rota, headers=headers, timeout=60)
+                        resposta.raise_for_status()
+                        return resposta
+
+                    perfilada = buscar({"X-Profile": TOKEN})
+                    arquivo = perfilada.headers.get("X-Profile-File")
+                    _conferir(arquivo is not None, f"'{nome}' sem 'X-Profile-File'.")
+                    faltando = esperadas - _funcoes(Path(temp_dir) / arquivo)
+                    _conferir(
+                        not faltando,
+                        f"o perfil de '{nome}' não contém {sorted(faltando)}.",
+                    )
+
+                    resultados.append(
+                        medir(f"profiling.{nome}.sem_perfil", buscar, 1, REPETICOES)
+                    )
+                    resultados.append(
+                        medir(
+                            f"profiling.{nome}.com_perfil",
+                            lambda buscar=buscar: buscar({"X-Profile": TOKEN}),
+                            1,
+                            REPETICOES,
+                        )
+                    )
+    return resultados
@@ -0,0 +1,115 @@
+"""
+Benchmark da inicialização da API com a carga do catálogo em segundo plano.
+
+Sobe a API num processo novo e mede, a partir do início do processo:
+- o tempo até a primeira resposta ('/health/live');
+- o tempo até o catálogo ficar pronto ('/health/ready' com 200);
+- a latência máxima de '/health/live' durante a carga (a prova de vida
+  não pode travar enquanto o catálogo é lido).
+
+Uso (1M de itens):
+    python -m benchmarks.bench_prontidao --restaurantes 10000 --itens 100
+"""
+
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import typer
+
+from ._util import porta_livre, processo_uvicorn
+from .gerar_catalogo import gerar_catalogo
+
+
+def _medir_inicio(raiz: Path, espera: float = 600.0) -> Dict[str, Any]:
+    """Uma inicialização: primeira resposta, pronto e latência da prova de vida."""
+    import requests
+
+    porta = porta_livre()
+    base = f"http://127.0.0.1:{porta}"
+    inicio = time.perf_counter()
+    processo = processo_uvicorn(raiz, porta)
+    try:
+        primeira = None
+        vivo: List[float] = []
+        status_dados = None
+        while time.perf_counter() - inicio < espera:
+            antes = time.perf_counter()
+            try:
+                requests.get(f"{base}/health/live", timeout=5).raise_for_status()
+            except requests.ConnectionError:
+                if processo.poll() is not None:
+                    raise RuntimeError("O servidor da API não subiu.") from None
+                time.sleep(0.005)
+                continue
+            if primeira is None:
+                primeira = time.perf_counter() - inicio
+                # Um endpoint de dados logo no início da carga
+                status_dados = requests.get(f"{base}/api/restaurantes").status_code
+            vivo.append(time.perf_counter() - antes)
+            if requests.get(f"{base}/health/ready").status_code == 200:
+                return {
+                    "primeira_resposta_s": primeira,
+                    "pronto_s": time.perf_counter() - inicio,
+                    "vivo_latencia_max_s": max(vivo),
+                    "status_dados_durante_carga": status_dados,
+                }
+            time.sleep(0.01)
+        raise RuntimeError("O catálogo da API não ficou pronto.")
+    finally:
+        processo.terminate()
+        processo.wait()
+
+
+def executar(raiz: Path, repeticoes: int = 3) -> List[Dict[str, Any]]:
+    """Mede 'repeticoes' inicializações da API servindo o catálogo de 'raiz'."""
+    medidas = [_medir_inicio(raiz) for _ in range(repeticoes)]
+    resultados = []
+    for nome, campo in (
+        ("prontidao.primeira_resposta", "primeira_resposta_s"),
+        ("prontidao.catalogo_pronto", "pronto_s"),
+    ):
+        tempos = [medida[campo] for medida in medidas]
+        resultados.append(
+            {
+                "nome": nome,
+                "operacoes": 1,
+                "repeticoes": repeticoes,
+                "mediana_s": statistics.median(tempos),
+                "minimo_s": min(tempos),
+                "maximo_s": max(tempos),
+                "ops_por_segundo": 1 / statistics.median(tempos),
+            }
+        )
+    resultados[-1]["vivo_latencia_max_s"] = max(
+        medida["vivo_latencia_max_s"] for medida in medidas
+    )
+    resultados[-1]["status_dados_durante_carga"] = medidas[0][
+        "status_dados_durante_carga"
+    ]
+    return resultados
+
+
+def main(
+    restaurantes: int = typer.Option(10_000, help="Restaurantes no catálogo."),
+    itens: int = typer.Option(100, help="Itens por restaurante."),
+    repeticoes: int = typer.Option(3, help="Inicializações medidas."),
+):
+    """Gera um catálogo temporário e imprime os tempos de inicialização."""
+    with tempfile.TemporaryDirectory(prefix="sabor_prontidao_") as temp_dir:
+        gerar_catalogo(Path(temp_dir), restaurantes, itens)
+        primeira, pronto = executar(Path(temp_dir), repeticoes)
+    typer.echo(
+        f"primeira resposta {primeira['mediana_s'] * 1000:.0f} ms;"
+        f" catálogo pronto {pronto['mediana_s']:.2f} s;"
+        f" /health/live durante a carga: máx"
+        f" {pronto['vivo_latencia_max_s'] * 1000:.0f} ms;"
+        f" /api/restaurantes durante a carga:"
+        f" {pronto['status_dados_durante_carga']}"
+    )
+
+
+if __name__ == "__main__":
+    typer.run(main)
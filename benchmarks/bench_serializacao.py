@@ -0,0 +1,31 @@
+"""Benchmark da serialização dos modelos, como feita pela resposta da API."""
+
+from pathlib import Path
+from typing import Any, Dict, List
+
+from ._util import medir
+
+
+def executar(raiz: Path) -> List[Dict[str, Any]]:
+    """Mede a serialização da lista completa e de um único restaurante."""
+    from pydantic import TypeAdapter
+    from models.schemas import Restaurante
+    from utils.data_reader import carregar_dados_restaurantes
+
+    restaurantes = list(carregar_dados_restaurantes().values())
+    adaptador = TypeAdapter(List[Restaurante])
+    total_itens = sum(len(r.cardapio) for r in restaurantes)
+    maior = max(restaurantes, key=lambda r: len(r.cardapio))
+
+    return [
+        medir(
+            "serializacao.lista_completa",
+            lambda: adaptador.dump_json(restaurantes),
+            total_itens,
+        ),
+        medir(
+            "serializacao.restaurante",
+            lambda: maior.model_dump_json(),
+            len(maior.cardapio),
+        ),
+    ]
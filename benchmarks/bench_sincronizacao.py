@@ -0,0 +1,86 @@
+"""
+Benchmark da sincronização incremental ('/api/restaurantes/changes')
+contra o recarregamento completo da lista ('/api/restaurantes').
+
+Depois de 'alteracoes' mudanças de status, mede o tamanho da resposta e a
+latência de cada forma de o cliente voltar a ficar em dia, através do
+cliente em processo ('TestClient').
+
+Uso:
+    python -m benchmarks.bench_sincronizacao --tamanho 1k
+"""
+
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+import typer
+
+from ._util import aguardar_catalogo, medir, usar_catalogo
+from .gerar_catalogo import TAMANHOS, gerar_catalogo
+
+
+def executar(
+    raiz: Path, alteracoes: Sequence[int] = (1, 10, 100), requisicoes: int = 20
+) -> List[Dict[str, Any]]:
+    """Compara o recarregamento completo com o delta após 'alteracoes' mudanças."""
+    from fastapi.testclient import TestClient
+    from api.router import app
+
+    resultados: List[Dict[str, Any]] = []
+    with TestClient(app) as client:
+        aguardar_catalogo(client)
+        completo = client.get("/api/restaurantes")
+        nomes = [r["nome"] for r in completo.json()]
+        versao = int(completo.headers["X-Catalog-Version"])
+
+        def repetir(url: str, params: Dict[str, Any]):
+            def rodar():
+                for _ in range(requisicoes):
+                    client.get(url, params=params).raise_for_status()
+
+            return rodar
+
+        resultado = medir(
+            "sincronizacao.completa", repetir("/api/restaurantes", {}), requisicoes
+        )
+        resultado["bytes"] = len(completo.content)
+        resultados.append(resultado)
+
+        for quantidade in alteracoes:
+            for nome in nomes[:quantidade]:
+                client.patch(f"/api/restaurantes/{nome}/toggle_status")
+            params = {"since": versao}
+            delta = client.get("/api/restaurantes/changes", params=params)
+            resultado = medir(
+                f"sincronizacao.delta_{quantidade}",
+                repetir("/api/restaurantes/changes", params),
+                requisicoes,
+            )
+            resultado["bytes"] = len(delta.content)
+            resultado["alterados"] = len(delta.json()["alterados"])
+            resultados.append(resultado)
+            versao = delta.json()["versao"]
+    return resultados
+
+
+def main(
+    tamanho: str = typer.Option(
+        "1k", help=f"Tamanho do catálogo sintético: {', '.join(TAMANHOS)}."
+    ),
+):
+    """Gera um catálogo temporário e imprime bytes e latência de cada forma."""
+    with tempfile.TemporaryDirectory(prefix="sabor_sync_") as temp_dir:
+        raiz = Path(temp_dir)
+        gerar_catalogo(raiz, *TAMANHOS[tamanho])
+        usar_catalogo(raiz)
+        for resultado in executar(raiz):
+            typer.echo(
+                f"{resultado['nome']:<28} {resultado['bytes']:>13,} bytes"
+                f"  {resultado['mediana_s'] / resultado['operacoes'] * 1000:8.2f}"
+                " ms/requisição"
+            )
+
+
+if __name__ == "__main__":
+    typer.run(main)
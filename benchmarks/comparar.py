@@ -0,0 +1,46 @@
+"""
+Compara dois arquivos de resultados gerados por 'benchmarks.run'.
+
+Uso:
+    python -m benchmarks.comparar base.json atual.json --limite 0.10
+"""
+
+import json
+from pathlib import Path
+
+import typer
+
+
+def _carregar(file_path: Path) -> dict:
+    with open(file_path, "r", encoding="utf-8") as arquivo:
+        dados = json.load(arquivo)
+    return {r["nome"]: r for r in dados["resultados"]}
+
+
+def main(
+    base: Path = typer.Argument(..., help="Resultado de referência."),
+    atual: Path = typer.Argument(..., help="Resultado a comparar."),
+    limite: float = typer.Option(
+        0.10, help="Variação relativa a partir da qual uma regressão é apontada."
+    ),
+):
+    """Mostra a variação da mediana por benchmark e falha se houver regressão."""
+    resultados_base, resultados_atuais = _carregar(base), _carregar(atual)
+    regressoes = 0
+    for nome in sorted(resultados_base.keys() & resultados_atuais.keys()):
+        antes = resultados_base[nome]["mediana_s"]
+        depois = resultados_atuais[nome]["mediana_s"]
+        variacao = (depois - antes) / antes if antes else 0.0
+        marcador = ""
+        if variacao > limite:
+            marcador = "  <-- REGRESSÃO"
+            regressoes += 1
+        typer.echo(
+            f"{nome:<45} {antes * 1000:10.2f} ms -> {depois * 1000:10.2f} ms"
+            f"  ({variacao:+.1%}){marcador}"
+        )
+    raise typer.Exit(code=1 if regressoes else 0)
+
+
+if __name__ == "__main__":
+    typer.run(main)
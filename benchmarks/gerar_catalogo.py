@@ -0,0 +1,150 @@
+"""
+Gerador determinístico de catálogos sintéticos.
+
+Escreve, sob um diretório raiz, a mesma estrutura usada pela aplicação:
+- '<raiz>/data/restaurants/<nome>.json': lista de itens do cardápio
+  ({"item", "price", "description"}), como gera o 'data_fetcher'.
+- '<raiz>/data/restaurants_metadata.json': lista de {"nome", "categoria", "ativo"}.
+
+A mesma semente sempre produz exatamente os mesmos arquivos.
+
+Uso:
+    python -m benchmarks.gerar_catalogo /tmp/catalogo --tamanho 1k
+"""
+
+import json
+import random
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+import typer
+
+# Tamanhos pré-definidos: (restaurantes, itens por restaurante)
+TAMANHOS: Dict[str, tuple] = {
+    "10": (10, 50),
+    "1k": (1_000, 100),
+    "100k": (100_000, 100),  # 10M de itens no total
+}
+
+CATEGORIAS_RESTAURANTE = ["Fast Food", "Pizzaria", "Mexicana", "Lanchonete", "Café"]
+
+# Vocabulário misto: palavras que acionam cada categoria do classificador
+# e palavras neutras, para exercitar todos os caminhos de 'classify_item'.
+PREFIXOS = ["Limited Time", "Classic", "Double", "Spicy", "Original", "Deluxe", ""]
+NUCLEOS = [
+    "Chicken Sandwich",
+    "Whopper",
+    "Big Mac",
+    "Cheese Pizza",
+    "Crunchy Taco",
+    "Bean Burrito",
+    "French Fries",
+    "Onion Rings",
+    "Chicken Nuggets",
+    "Garden Salad",
+    "Grilled Wrap",
+    "Apple Pie",
+    "Oreo Flurry",
+    "Chocolate Chip Cookie",
+    "Coca-Cola",
+    "Iced Coffee",
+    "Orange Juice",
+    "Hash Browns",
+    "Hotcakes",
+    "Biscuit",
+]
+SUFIXOS = ["(Small)", "(Medium)", "(Large)", "Combo", "Meal", "", ""]
+DESCRICOES = [
+    "Uma explosão de sabores em cada mordida.",
+    "Sabores autênticos que aquecem o coração.",
+    "Feito na hora com ingredientes selecionados.",
+    None,
+]
+
+
+def _nome_restaurante(indice: int) -> str:
+    return f"Restaurante {indice:06d}"
+
+
+def _itens(rng: random.Random, quantidade: int) -> Iterator[dict]:
+    for _ in range(quantidade):
+        partes = [rng.choice(PREFIXOS), rng.choice(NUCLEOS), rng.choice(SUFIXOS)]
+        yield {
+            "item": " ".join(p for p in partes if p),
+            "price": round(rng.uniform(1.0, 80.0), 2),
+            "description": rng.choice(DESCRICOES),
+        }
+
+
+def gerar_catalogo(
+    raiz: Path, restaurantes: int, itens_por_restaurante: int, semente: int = 42
+) -> Path:
+    """
+    Gera o catálogo sintético e retorna o diretório de cardápios.
+
+    Args:
+        raiz: Diretório que fará o papel de 'PROJECT_ROOT'.
+        restaurantes: Quantidade de restaurantes.
+        itens_por_restaurante: Quantidade de itens em cada cardápio.
+        semente: Semente do gerador pseudoaleatório.
+    """
+    rng = random.Random(semente)
+    data_dir = Path(raiz) / "data" / "restaurants"
+    data_dir.mkdir(parents=True, exist_ok=True)
+
+    metadados: List[dict] = []
+    for indice in range(restaurantes):
+        nome = _nome_restaurante(indice)
+        metadados.append(
+            {
+                "nome": nome,
+                "categoria": rng.choice(CATEGORIAS_RESTAURANTE),
+                "ativo": rng.random() < 0.7,
+            }
+        )
+        file_path = data_dir / f'{nome.replace(" ", "_").lower()}.json'
+        with open(file_path, "w", encoding="utf-8") as arquivo:
+            json.dump(
+                list(_itens(rng, itens_por_restaurante)),
+                arquivo,
+                indent=4,
+                ensure_ascii=False,
+            )
+
+    with open(
+        Path(raiz) / "data" / "restaurants_metadata.json", "w", encoding="utf-8"
+    ) as arquivo:
+        json.dump(metadados, arquivo, indent=2, ensure_ascii=False)
+
+    return data_dir
+
+
+def main(
+    raiz: Path = typer.Argument(..., help="Diretório raiz do catálogo gerado."),
+    tamanho: str = typer.Option(
+        "10", help=f"Tamanho pré-definido: {', '.join(TAMANHOS)}."
+    ),
+    restaurantes: int = typer.Option(
+        None, help="Sobrescreve a quantidade de restaurantes do tamanho escolhido."
+    ),
+    itens: int = typer.Option(
+        None, help="Sobrescreve a quantidade de itens por restaurante."
+    ),
+    semente: int = typer.Option(42, help="Semente do gerador."),
+):
+    """Gera um catálogo sintético no formato atual de 'DATA_DIR'."""
+    if tamanho not in TAMANHOS:
+        raise typer.BadParameter(f"Tamanho desconhecido: {tamanho}")
+    padrao_restaurantes, padrao_itens = TAMANHOS[tamanho]
+    restaurantes = restaurantes or padrao_restaurantes
+    itens = itens or padrao_itens
+
+    data_dir = gerar_catalogo(raiz, restaurantes, itens, semente)
+    typer.echo(
+        f"Gerados {restaurantes} restaurantes x {itens} itens "
+        f"({restaurantes * itens} itens) em {data_dir}"
+    )
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,108 @@
+"""
+Verificação de regressão do tempo de inicialização da CLI.
+
+Cada cenário roda num processo Python novo (importações a frio) e mede:
+- o tempo total até o fim do cenário;
+- se algum módulo proibido para aquele comando foi carregado
+  (ex: 'run-cli' não deve carregar uvicorn/fastapi/httpx).
+
+Uso:
+    python -m benchmarks.importacao --orcamento-ms 200
+Sai com código 1 se algum cenário estourar o orçamento ou carregar um
+módulo proibido.
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+import typer
+
+from ._util import RAIZ_PROJETO
+
+# (código executado no processo filho, módulos que não podem ser carregados)
+CENARIOS: Dict[str, tuple] = {
+    "help": (
+        "import main\n"
+        "try:\n"
+        "    main.cli_app(['--help'], standalone_mode=False)\n"
+        "except SystemExit:\n"
+        "    pass\n",
+        ["uvicorn", "fastapi", "requests", "httpx", "pydantic_settings", "rich"],
+    ),
+    "run_cli": (
+        "import main\nfrom cli import menu\nmenu.MenuApp()\n",
+        ["uvicorn", "fastapi", "httpx", "pydantic_settings"],
+    ),
+}
+
+_SONDA = (
+    "import json, sys, time\n"
+    "inicio = time.perf_counter()\n"
+    "{codigo}"
+    "fim = time.perf_counter()\n"
+    "sys.stderr.write(json.dumps({{'ms': (fim - inicio) * 1000,"
+    " 'proibidos': [m for m in {proibidos!r} if m in sys.modules]}}))\n"
+)
+
+
+def medir_cenario(nome: str, repeticoes: int = 5) -> Dict[str, Any]:
+    """Executa o cenário em processos novos e retorna a mediana do tempo."""
+    codigo, proibidos = CENARIOS[nome]
+    sonda = _SONDA.format(codigo=codigo, proibidos=proibidos)
+    tempos: List[float] = []
+    carregados: List[str] = []
+    for _ in range(repeticoes):
+        processo = subprocess.run(
+            [sys.executable, "-c", sonda],
+            cwd=RAIZ_PROJETO / "src",
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        dados = json.loads(processo.stderr.strip().splitlines()[-1])
+        tempos.append(dados["ms"] / 1000)
+        carregados = dados["proibidos"]
+
+    mediana = statistics.median(tempos)
+    return {
+        "nome": f"importacao.{nome}",
+        "operacoes": 1,
+        "repeticoes": repeticoes,
+        "mediana_s": mediana,
+        "minimo_s": min(tempos),
+        "maximo_s": max(tempos),
+        "ops_por_segundo": 1 / mediana if mediana else None,
+        "modulos_proibidos_carregados": carregados,
+    }
+
+
+def executar(_raiz: Path) -> List[Dict[str, Any]]:
+    """Mede todos os cenários (para a suíte de 'benchmarks.run')."""
+    return [medir_cenario(nome) for nome in CENARIOS]
+
+
+def main(
+    orcamento_ms: float = typer.Option(
+        200.0, help="Tempo máximo (mediana) aceito por cenário, em ms."
+    ),
+):
+    """Falha se algum cenário estourar o orçamento ou importar módulos proibidos."""
+    falhas = 0
+    for resultado in executar(RAIZ_PROJETO):
+        tempo_ms = resultado["mediana_s"] * 1000
+        proibidos = resultado["modulos_proibidos_carregados"]
+        ok = tempo_ms <= orcamento_ms and not proibidos
+        falhas += not ok
+        typer.echo(
+            f"{'OK  ' if ok else 'FALHA'} {resultado['nome']:<25} {tempo_ms:7.1f} ms"
+            + (f"  (carregou: {', '.join(proibidos)})" if proibidos else "")
+        )
+    raise typer.Exit(code=1 if falhas else 0)
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,103 @@
+"""
+Executa a suíte de benchmarks e grava os resultados em JSON.
+
+Uso:
+    python -m benchmarks.run --tamanho 1k --saida resultados/atual.json
+    python -m benchmarks.comparar resultados/base.json resultados/atual.json
+"""
+
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import typer
+
+from . import (
+    bench_api_client,
+    bench_autocomplete,
+    bench_carregador,
+    bench_classificador,
+    bench_coalescencia,
+    bench_endpoints,
+    bench_escrita,
+    bench_eventos,
+    bench_export,
+    bench_fetcher,
+    bench_ingestao,
+    bench_loadtest,
+    bench_profiling,
+    bench_prontidao,
+    bench_serializacao,
+    bench_sincronizacao,
+    importacao,
+)
+from ._util import ambiente, salvar_json, usar_catalogo
+from .gerar_catalogo import TAMANHOS, gerar_catalogo
+
+SUITES: Dict[str, Callable[[Path], List[Dict[str, Any]]]] = {
+    "classificador": bench_classificador.executar,
+    "carregador": bench_carregador.executar,
+    "serializacao": bench_serializacao.executar,
+    "endpoints": bench_endpoints.executar,
+    "fetcher": bench_fetcher.executar,
+    "escrita": bench_escrita.executar,
+    "api_client": bench_api_client.executar,
+    "export": bench_export.executar,
+    "eventos": bench_eventos.executar,
+    "sincronizacao": bench_sincronizacao.executar,
+    "prontidao": bench_prontidao.executar,
+    "profiling": bench_profiling.executar,
+    "coalescencia": bench_coalescencia.executar,
+    "autocomplete": bench_autocomplete.executar,
+    "ingestao": bench_ingestao.executar,
+    "loadtest": bench_loadtest.executar,
+    "importacao": importacao.executar,
+}
+
+
+def main(
+    tamanho: str = typer.Option(
+        "10", help=f"Tamanho do catálogo sintético: {', '.join(TAMANHOS)}."
+    ),
+    catalogo: Optional[Path] = typer.Option(
+        None, help="Reutiliza um catálogo já gerado em vez de gerar um novo."
+    ),
+    suite: List[str] = typer.Option(
+        list(SUITES), help="Suítes a executar (pode ser repetido)."
+    ),
+    saida: Path = typer.Option(
+        Path("bench_output.json"), help="Arquivo JSON de saída."
+    ),
+):
+    """Gera (ou reutiliza) um catálogo, executa as suítes e grava o JSON."""
+    desconhecidas = set(suite) - set(SUITES)
+    if desconhecidas:
+        raise typer.BadParameter(f"Suítes desconhecidas: {sorted(desconhecidas)}")
+
+    with tempfile.TemporaryDirectory(prefix="sabor_bench_") as temp_dir:
+        raiz = catalogo
+        if raiz is None:
+            raiz = Path(temp_dir)
+            restaurantes, itens = TAMANHOS[tamanho]
+            typer.echo(f"Gerando catálogo '{tamanho}' em {raiz}...")
+            gerar_catalogo(raiz, restaurantes, itens)
+        usar_catalogo(raiz)
+
+        resultados: List[Dict[str, Any]] = []
+        for nome in suite:
+            typer.echo(f"Executando suíte '{nome}'...")
+            for resultado in SUITES[nome](raiz):
+                resultados.append(resultado)
+                typer.echo(
+                    f"  {resultado['nome']:<45} {resultado['mediana_s'] * 1000:10.2f} ms"
+                    f"  ({resultado['ops_por_segundo']:,.0f} ops/s)"
+                )
+
+    salvar_json(
+        {"ambiente": ambiente(), "tamanho": tamanho, "resultados": resultados}, saida
+    )
+    typer.echo(f"Resultados gravados em {saida}")
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,91 @@
+"""
+Servidor HTTP local que simula a fonte de dados dos restaurantes.
+
+Suporta os recursos usados pelo 'data_fetcher': ETag/Last-Modified com
+respostas 304, requisições Range/If-Range (206) e interrupção proposital
+da transferência para exercitar a retomada.
+"""
+
+import hashlib
+import threading
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+
+class ServidorFonte:
+    """Serve um único corpo em '/restaurantes.json' numa porta livre."""
+
+    def __init__(self, corpo: bytes) -> None:
+        self.bytes_enviados = 0
+        self.requisicoes = 0
+        # Se definido, a próxima resposta completa é cortada após N bytes
+        self.interromper_apos: Optional[int] = None
+        self.atualizar(corpo)
+
+        servidor = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """Handler com suporte a requisições condicionais e parciais."""
+
+            def log_message(self, *args):  # Silencia o log padrão
+                pass
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                servidor.requisicoes += 1
+                if self.headers.get("If-None-Match") == servidor.etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+
+                inicio = 0
+                faixa = self.headers.get("Range")
+                if_range = self.headers.get("If-Range")
+                if faixa and (if_range is None or if_range == servidor.etag):
+                    inicio = int(faixa.removeprefix("bytes=").split("-")[0])
+                    if inicio >= len(servidor.corpo):
+                        self.send_response(416)
+                        self.end_headers()
+                        return
+                    self.send_response(206)
+                    self.send_header(
+                        "Content-Range",
+                        f"bytes {inicio}-{len(servidor.corpo) - 1}/{len(servidor.corpo)}",
+                    )
+                else:
+                    self.send_response(200)
+
+                dados = servidor.corpo[inicio:]
+                self.send_header("ETag", servidor.etag)
+                self.send_header("Last-Modified", servidor.last_modified)
+                self.send_header("Content-Length", str(len(dados)))
+                self.end_headers()
+
+                if servidor.interromper_apos is not None:
+                    dados = dados[: servidor.interromper_apos]
+                    servidor.interromper_apos = None
+                    self.close_connection = True
+                self.wfile.write(dados)
+                servidor.bytes_enviados += len(dados)
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    def atualizar(self, corpo: bytes) -> None:
+        """Troca o conteúdo servido (gera novos validadores)."""
+        self.corpo = corpo
+        self.etag = f'"{hashlib.sha256(corpo).hexdigest()[:16]}"'
+        self.last_modified = formatdate(usegmt=True)
+
+    @property
+    def url(self) -> str:
+        """URL completa do recurso servido."""
+        return f"http://127.0.0.1:{self._httpd.server_port}/restaurantes.json"
+
+    def __enter__(self) -> "ServidorFonte":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
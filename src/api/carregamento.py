@@ -0,0 +1,116 @@
+"""
+Carregamento do catálogo em segundo plano.
+
+A API passa a aceitar conexões assim que sobe: o catálogo é lido numa
+thread e cada restaurante entra no 'db' assim que o seu cardápio termina
+de ser validado. Enquanto isso, '/health/live' responde normalmente,
+'/health/ready' responde 503 com o progresso, e os endpoints de dados
+respondem 503 (exceto os de um restaurante que já foi carregado).
+
+Terminada a leitura, os índices de '/api/autocomplete' são construídos
+antes de o catálogo ser declarado pronto.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from utils.autocomplete import AutocompleteCatalogo
+from utils.data_reader import iterar_restaurantes
+from .catalogo import CatalogoVersionado
+from .profiling import perfilar_inicializacao
+
+
+class EstadoCarregamento:
+    """Progresso da carga do catálogo (atualizado pela thread de carga)."""
+
+    def __init__(self) -> None:
+        self.total: Optional[int] = None
+        self.carregados = 0
+        self.pronto = False
+        self.erro: Optional[str] = None
+        self.inicio: Optional[float] = None
+        self.fim: Optional[float] = None
+        self._cancelado = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def progresso(self) -> Dict[str, Any]:
+        """Resumo do progresso para '/health/ready' e as respostas 503."""
+        if self.erro is not None:
+            status = "erro"
+        else:
+            status = "pronto" if self.pronto else "carregando"
+        decorrido = None
+        if self.inicio is not None:
+            decorrido = round((self.fim or time.perf_counter()) - self.inicio, 3)
+        return {
+            "status": status,
+            "carregados": self.carregados,
+            "total": self.total,
+            "decorrido_s": decorrido,
+        }
+
+    def descricao(self) -> str:
+        """Mensagem curta para o 'detail' das respostas 503."""
+        if self.erro is not None:
+            return f"Falha ao carregar o catálogo: {self.erro}"
+        total = "?" if self.total is None else self.total
+        return (
+            "Catálogo em carregamento:"
+            f" {self.carregados}/{total} restaurantes carregados."
+        )
+
+    def iniciar(
+        self,
+        db: CatalogoVersionado,
+        autocomplete: Optional[AutocompleteCatalogo] = None,
+    ) -> None:
+        """
+        Esvazia o 'db' e começa a preenchê-lo numa thread; ao final, constrói
+        os índices de 'autocomplete' (se informado).
+        """
+        self.total, self.carregados, self.pronto, self.erro = None, 0, False, None
+        self._cancelado.clear()
+        self.inicio, self.fim = time.perf_counter(), None
+        db.clear()
+        self._thread = threading.Thread(
+            target=self._carregar,
+            args=(db, autocomplete),
+            name="carga-catalogo",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _ao_listar(self, total: int) -> None:
+        self.total = total
+
+    def _carregar(
+        self, db: CatalogoVersionado, autocomplete: Optional[AutocompleteCatalogo]
+    ) -> None:
+        try:
+            with perfilar_inicializacao():
+                for restaurante in iterar_restaurantes(self._ao_listar):
+                    if self._cancelado.is_set():
+                        return
+                    # Já pode ser servido pelos endpoints de um restaurante
+                    db[restaurante.nome.title()] = restaurante
+                    self.carregados += 1
+                if autocomplete is not None:
+                    autocomplete.construir(db.values())
+        except Exception as e:  # pylint: disable=broad-except
+            self.erro = f"{type(e).__name__}: {e}"
+            print(f"[ERRO] Falha ao carregar o catálogo: {self.erro}")
+            return
+        finally:
+            self.fim = time.perf_counter()
+        self.pronto = True
+        print(
+            f"INFO:     Catálogo carregado: {self.carregados} restaurantes"
+            f" em {self.fim - self.inicio:.2f} s."
+        )
+
+    def cancelar(self, espera: float = 5.0) -> None:
+        """Interrompe a carga em andamento (ao finalizar a aplicação)."""
+        self._cancelado.set()
+        if self._thread is not None:
+            self._thread.join(espera)
@@ -0,0 +1,119 @@
+"""
+Catálogo em memória com versão e registro de alterações.
+
+O 'CatalogoVersionado' é o dicionário por trás de 'get_db': cada alteração
+(inclusão, remoção ou mudança de um restaurante) incrementa a versão do
+catálogo e entra num registro limitado. Clientes que já têm uma cópia
+pedem só o que mudou desde a versão que conhecem; se o registro não cobre
+mais essa versão, eles precisam recarregar o catálogo inteiro.
+"""
+
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+from models.schemas import Restaurante
+
+# Alterações mantidas para a sincronização incremental
+TAMANHO_REGISTRO = 10_000
+# Cabeçalho com a versão do catálogo na listagem completa
+VERSAO_HEADER = "X-Catalog-Version"
+
+
+class Alteracoes(NamedTuple):
+    """Restaurantes alterados e nomes removidos desde uma versão."""
+
+    versao: int
+    alterados: List[Restaurante]
+    removidos: List[str]
+
+
+class CatalogoVersionado(Dict[str, Restaurante]):
+    """
+    Dicionário de restaurantes que registra cada alteração com uma versão.
+
+    As alterações são registradas por 'db[nome] = ...', 'del db[nome]',
+    'marcar_alterado' e 'recarregar'/'clear'; os demais métodos de 'dict'
+    que alteram o conteúdo não devem ser usados.
+    """
+
+    def __init__(self, tamanho_registro: int = TAMANHO_REGISTRO) -> None:
+        super().__init__()
+        self._versao = 0
+        # Versão a partir da qual o registro está completo
+        self._inicio_registro = 0
+        # (versão, nome, removido)
+        self._registro: Deque[Tuple[int, str, bool]] = deque(maxlen=tamanho_registro)
+        self._lock = threading.Lock()
+
+    @property
+    def versao(self) -> int:
+        """Versão atual do catálogo (cresce a cada alteração)."""
+        return self._versao
+
+    def _registrar(self, nome: str, removido: bool = False) -> int:
+        # Chamado com o lock adquirido
+        self._versao += 1
+        if len(self._registro) == self._registro.maxlen:
+            # A entrada mais antiga vai sair: o registro passa a cobrir menos
+            self._inicio_registro = self._registro[0][0]
+        self._registro.append((self._versao, nome, removido))
+        return self._versao
+
+    def __setitem__(self, nome: str, restaurante: Restaurante) -> None:
+        with self._lock:
+            super().__setitem__(nome, restaurante)
+            self._registrar(nome)
+
+    def __delitem__(self, nome: str) -> None:
+        with self._lock:
+            super().__delitem__(nome)
+            self._registrar(nome, removido=True)
+
+    def marcar_alterado(self, nome: str) -> int:
+        """
+        Registra a alteração de um restaurante modificado no lugar (ex: o
+        status em 'toggle_status') e retorna a nova versão.
+        """
+        with self._lock:
+            return self._registrar(nome)
+
+    def recarregar(self, dados: Mapping[str, Restaurante]) -> None:
+        """
+        Substitui todo o conteúdo. Conta como uma única versão nova, e todos
+        os clientes com versões anteriores precisam recarregar o catálogo.
+        """
+        with self._lock:
+            super().clear()
+            super().update(dados)
+            self._versao += 1
+            self._registro.clear()
+            self._inicio_registro = self._versao
+
+    def clear(self) -> None:
+        self.recarregar({})
+
+    def alteracoes_desde(self, versao: int) -> Optional[Alteracoes]:
+        """
+        Restaurantes alterados depois de 'versao', ou None se o registro não
+        cobre mais essa versão (ou ela é de outra execução do servidor).
+        """
+        with self._lock:
+            if versao < self._inicio_registro or versao > self._versao:
+                return None
+            # Só o estado final de cada nome importa
+            ultimos: Dict[str, bool] = {}
+            for versao_registro, nome, removido in reversed(self._registro):
+                if versao_registro <= versao:
+                    break
+                ultimos.setdefault(nome, removido)
+            alterados = [
+                self[nome]
+                for nome, removido in reversed(ultimos.items())
+                if not removido
+            ]
+            return Alteracoes(
+                versao=self._versao,
+                alterados=alterados,
+                removidos=[nome for nome, removido in ultimos.items() if removido],
+            )
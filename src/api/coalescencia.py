@@ -0,0 +1,44 @@
+"""
+Coalescência de consultas simultâneas iguais ("single-flight").
+
+Quando muitas requisições idênticas chegam ao mesmo tempo (ex: um painel
+atualizado por centenas de clientes), só a primeira executa a consulta; as
+demais aguardam e recebem o mesmo resultado, já serializado. Nada fica em
+cache: terminada a execução, a próxima requisição calcula de novo.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Executa uma só vez as chamadas simultâneas com a mesma chave."""
+
+    def __init__(self) -> None:
+        # Usado apenas no event loop: dispensa lock
+        self._em_andamento: Dict[Hashable, "asyncio.Future"] = {}
+        self.stats: Dict[str, int] = {"executadas": 0, "compartilhadas": 0}
+
+    @property
+    def em_andamento(self) -> int:
+        """Quantidade de execuções em andamento."""
+        return len(self._em_andamento)
+
+    async def executar(self, chave: Hashable, funcao: Callable[[], Awaitable[T]]) -> T:
+        """
+        Retorna o resultado de 'funcao()', compartilhando a execução com as
+        chamadas de mesma 'chave' que estiverem em andamento.
+        """
+        tarefa = self._em_andamento.get(chave)
+        if tarefa is None:
+            self.stats["executadas"] += 1
+            # Tarefa própria: se quem a iniciou for cancelado, os demais
+            # continuam aguardando o mesmo resultado
+            tarefa = asyncio.ensure_future(funcao())
+            self._em_andamento[chave] = tarefa
+            tarefa.add_done_callback(lambda _: self._em_andamento.pop(chave, None))
+        else:
+            self.stats["compartilhadas"] += 1
+        return await asyncio.shield(tarefa)
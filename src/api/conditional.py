@@ -0,0 +1,73 @@
+"""
+Requisições condicionais (ETag) para as respostas JSON da API.
+
+Middleware ASGI que calcula um ETag para as respostas 200 de requisições
+GET em JSON e responde 304 (sem corpo) quando o cliente já possui a mesma
+versão ('If-None-Match'). Respostas em streaming ou de outros tipos passam
+direto, sem serem acumuladas em memória. Um ETag já definido pelo endpoint
+(ex: calculado uma vez para várias respostas iguais) é mantido.
+"""
+
+import hashlib
+from typing import List
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+def calcular_etag(conteudo: bytes) -> str:
+    """ETag forte do corpo da resposta."""
+    return f'"{hashlib.sha1(conteudo).hexdigest()}"'
+
+
+class ETagMiddleware:
+    """Adiciona ETag às respostas JSON de GET e trata 'If-None-Match'."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        inicio: List[Message] = []
+        corpo: List[bytes] = []
+        repassar = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal repassar
+            if repassar:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                content_type = Headers(raw=message["headers"]).get("content-type", "")
+                if message["status"] != 200 or "application/json" not in content_type:
+                    repassar = True
+                    await send(message)
+                    return
+                inicio.append(message)
+                return
+
+            corpo.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            conteudo = b"".join(corpo)
+            start = inicio[0]
+            headers = MutableHeaders(raw=start["headers"])
+            etag = headers.get("etag") or calcular_etag(conteudo)
+            headers["ETag"] = etag
+
+            if if_none_match == etag:
+                del headers["content-length"]
+                del headers["content-type"]
+                await send({**start, "status": 304})
+                await send({"type": "http.response.body", "body": b""})
+                return
+            await send(start)
+            await send({"type": "http.response.body", "body": conteudo})
+
+        await self.app(scope, receive, send_wrapper)
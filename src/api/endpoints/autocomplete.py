@@ -0,0 +1,49 @@
+"""
+Endpoint de autocompletar (typeahead) de restaurantes e itens do cardápio.
+
+As sugestões vêm dos índices por prefixo construídos na carga do catálogo
+(ver 'utils.autocomplete'), com custo limitado por consulta mesmo com
+milhões de nomes.
+"""
+
+from enum import Enum
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from models.schemas import SugestoesAutocomplete
+from utils.autocomplete import K_MAXIMO, AutocompleteCatalogo
+from .restaurants import catalogo_pronto, get_autocomplete
+
+
+class TipoSugestao(str, Enum):
+    """O que sugerir."""
+
+    RESTAURANTE = "restaurante"
+    ITEM = "item"
+
+
+router = APIRouter()
+
+
+@router.get(
+    "",
+    response_model=SugestoesAutocomplete,
+    summary="Sugere nomes de restaurantes e itens a partir de um prefixo",
+    dependencies=[Depends(catalogo_pronto)],
+)
+async def autocompletar(
+    q: str = Query(..., max_length=200, description="Prefixo digitado."),
+    tipo: Optional[TipoSugestao] = Query(None, description="Só um dos tipos."),
+    limite: int = Query(K_MAXIMO, ge=1, le=K_MAXIMO),
+    autocomplete: AutocompleteCatalogo = Depends(get_autocomplete),
+):
+    """
+    Retorna as sugestões mais relevantes para o prefixo 'q' (sem diferenciar
+    maiúsculas nem acentos). 'async': a consulta leva microssegundos, não
+    vale um salto para o threadpool.
+    """
+    sugestoes = SugestoesAutocomplete()
+    if tipo in (None, TipoSugestao.RESTAURANTE):
+        sugestoes.restaurantes = autocomplete.restaurantes.sugerir(q, limite)
+    if tipo in (None, TipoSugestao.ITEM):
+        sugestoes.itens = autocomplete.itens.sugerir(q, limite)
+    return sugestoes
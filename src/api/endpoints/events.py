@@ -0,0 +1,40 @@
+"""
+Endpoint do fluxo de eventos do catálogo (Server-Sent Events).
+
+Eventos publicados:
+- 'restaurante_criado': {"nome", "categoria", "ativo"}
+- 'status_alterado': {"nome", "ativo"}
+- 'cardapio_atualizado': {"nome", "incluidos"} (ingestão de itens em NDJSON)
+- 'resync': o histórico não cobre a reconexão; recarregue a lista completa.
+"""
+
+from typing import Optional
+from fastapi import APIRouter, Depends, Header
+from fastapi.responses import StreamingResponse
+from ..events import EventBroker
+from .restaurants import get_broker
+
+router = APIRouter()
+
+
+@router.get(
+    "",
+    summary="Fluxo de eventos do catálogo (SSE)",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def stream_eventos(
+    ultimo_id: Optional[int] = None,
+    last_event_id: Optional[int] = Header(None),
+    broker: EventBroker = Depends(get_broker),
+):
+    """
+    Mantém a conexão aberta e envia os eventos conforme são publicados.
+    Ao reconectar, o cliente envia 'Last-Event-ID' (ou '?ultimo_id=') e
+    recebe os eventos que perdeu.
+    """
+    return StreamingResponse(
+        broker.assinar(last_event_id if last_event_id is not None else ultimo_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
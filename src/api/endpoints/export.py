@@ -0,0 +1,98 @@
+"""
+Endpoints de exportação do catálogo em streaming (NDJSON).
+
+Cada linha da resposta é um objeto JSON (um restaurante ou um item). As
+linhas são geradas sob demanda a partir do 'db', então a memória usada pelo
+servidor não cresce com o tamanho do catálogo.
+"""
+
+import json
+from enum import Enum
+from typing import Dict, Iterator, List, Optional
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from models.schemas import Restaurante
+from ..profiling import iterar_perfilado, perfilavel
+from .restaurants import catalogo_pronto, get_db
+
+# Tamanho aproximado (bytes) de cada bloco enviado ao cliente
+TAMANHO_BLOCO = 64 * 1024
+
+
+class NivelExportacao(str, Enum):
+    """Granularidade das linhas exportadas."""
+
+    RESTAURANTES = "restaurantes"  # Um restaurante por linha, sem o cardápio
+    COMPLETO = "completo"  # Um restaurante por linha, com o cardápio
+    ITENS = "itens"  # Um item do cardápio por linha
+
+
+router = APIRouter()
+
+
+def _linhas(restaurantes: List[Restaurante], nivel: NivelExportacao) -> Iterator[str]:
+    """Gera as linhas NDJSON, uma por restaurante ou por item."""
+    for restaurante in restaurantes:
+        if nivel is NivelExportacao.COMPLETO:
+            yield restaurante.model_dump_json()
+        elif nivel is NivelExportacao.RESTAURANTES:
+            yield json.dumps(
+                {
+                    "nome": restaurante.nome,
+                    "categoria": restaurante.categoria,
+                    "ativo": restaurante.ativo,
+                    "itens": len(restaurante.cardapio),
+                },
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+        else:
+            prefixo = f'{{"restaurante":{json.dumps(restaurante.nome)},'
+            for item in restaurante.cardapio:
+                # Reaproveita o JSON do item, acrescentando o restaurante
+                yield prefixo + item.model_dump_json()[1:]
+
+
+def _em_blocos(linhas: Iterator[str]) -> Iterator[bytes]:
+    """Agrupa as linhas em blocos de ~TAMANHO_BLOCO para reduzir o overhead."""
+    bloco: List[str] = []
+    tamanho = 0
+    for linha in linhas:
+        bloco.append(linha)
+        tamanho += len(linha) + 1
+        if tamanho >= TAMANHO_BLOCO:
+            yield ("\n".join(bloco) + "\n").encode("utf-8")
+            bloco, tamanho = [], 0
+    if bloco:
+        yield ("\n".join(bloco) + "\n").encode("utf-8")
+
+
+@router.get(
+    "/restaurantes",
+    summary="Exporta o catálogo em NDJSON (streaming)",
+    response_class=StreamingResponse,
+    dependencies=[Depends(catalogo_pronto)],
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+@perfilavel
+def export_restaurantes(
+    nivel: NivelExportacao = NivelExportacao.RESTAURANTES,
+    categoria: Optional[str] = None,
+    ativo: Optional[bool] = None,
+    db: Dict[str, Restaurante] = Depends(get_db),
+):
+    """
+    Exporta os restaurantes (ou seus itens) como NDJSON, uma linha por
+    registro, com os mesmos filtros da listagem.
+    """
+    # Copia só as referências: novas inclusões não afetam a exportação em curso
+    restaurantes = [
+        r
+        for r in list(db.values())
+        if (not categoria or r.categoria.lower() == categoria.lower())
+        and (ativo is None or r.ativo == ativo)
+    ]
+    return StreamingResponse(
+        iterar_perfilado(_em_blocos(_linhas(restaurantes, nivel))),
+        media_type="application/x-ndjson",
+    )
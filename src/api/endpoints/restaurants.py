@@ -2,9 +2,28 @@
 Endpoints para o recurso 'Restaurante'.
 """
 
-from typing import Dict, List, Optional
-from fastapi import APIRouter, Depends, HTTPException
-from models.schemas import Restaurante
+from typing import Dict, List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
+from models.schemas import (
+    AlteracoesCatalogo,
+    CategoriaCardapio,
+    ItemCardapio,
+    Restaurante,
+    ResultadoIngestao,
+)
+from utils.autocomplete import AutocompleteCatalogo
+from ..carregamento import EstadoCarregamento
+from ..catalogo import VERSAO_HEADER, CatalogoVersionado
+from ..coalescencia import SingleFlight
+from ..conditional import calcular_etag
+from ..events import EventBroker
+from ..ingestao import IngestaoCardapio, lotes_ndjson
+from ..profiling import perfilavel
+
+# Serializador reutilizável da listagem (mesmo JSON do 'response_model')
+_LISTA_ADAPTER = TypeAdapter(List[Restaurante])
 
 
 # ===================================================================
@@ -17,6 +36,60 @@ def get_db():
     raise NotImplementedError("get_db dependency not implemented")
 
 
+def get_broker():
+    """Difusor de eventos; também sobrescrito no router principal."""
+    raise NotImplementedError("get_broker dependency not implemented")
+
+
+def get_carga():
+    """Estado da carga do catálogo; também sobrescrito no router principal."""
+    raise NotImplementedError("get_carga dependency not implemented")
+
+
+def get_coalescencia():
+    """Coalescência das listagens; também sobrescrita no router principal."""
+    raise NotImplementedError("get_coalescencia dependency not implemented")
+
+
+def get_autocomplete():
+    """Índices do autocompletar; também sobrescritos no router principal."""
+    raise NotImplementedError("get_autocomplete dependency not implemented")
+
+
+def _indisponivel(carga: EstadoCarregamento) -> HTTPException:
+    """503 com o progresso da carga; o cliente pode tentar de novo em 1s."""
+    return HTTPException(
+        status_code=503, detail=carga.descricao(), headers={"Retry-After": "1"}
+    )
+
+
+async def catalogo_pronto(carga: EstadoCarregamento = Depends(get_carga)) -> None:
+    """
+    Responde 503 enquanto o catálogo não terminou de carregar ('async':
+    verificação trivial, não vale um salto para o threadpool).
+    """
+    if not carga.pronto:
+        raise _indisponivel(carga)
+
+
+def _buscar_restaurante(
+    nome_restaurante: str,
+    db: Dict[str, Restaurante],
+    carga: Optional[EstadoCarregamento] = None,
+) -> Restaurante:
+    """
+    Busca um restaurante pelo nome normalizado ou lança 404. Durante a
+    carga, um restaurante ainda não carregado resulta em 503.
+    """
+    nome_normalizado = nome_restaurante.replace("_", " ").title()
+    restaurante = db.get(nome_normalizado)
+    if not restaurante:
+        if carga is not None and not carga.pronto:
+            raise _indisponivel(carga)
+        raise HTTPException(status_code=404, detail="Restaurante não encontrado")
+    return restaurante
+
+
 # ===================================================================
 #  Criação do Router
 # ===================================================================
@@ -27,14 +100,17 @@ router = APIRouter()
 # ===================================================================
 
 
-@router.get("", response_model=List[Restaurante], summary="Lista e filtra restaurantes")
-def get_restaurantes(
-    categoria: Optional[str] = None,
-    ativo: Optional[bool] = None,
-    nome: Optional[str] = None,
-    db: Dict[str, Restaurante] = Depends(get_db),
-):
-    """Retorna uma lista de todos os restaurantes, com filtros opcionais."""
+@perfilavel
+def _listar_json(
+    db: Dict[str, Restaurante],
+    categoria: Optional[str],
+    ativo: Optional[bool],
+    nome: Optional[str],
+) -> Tuple[bytes, str]:
+    """
+    Filtra os restaurantes e serializa a lista (a parte cara da listagem).
+    Retorna o JSON e o seu ETag, calculado uma vez para todas as respostas.
+    """
     resultados = list(db.values())
     if categoria:
         resultados = [r for r in resultados if r.categoria.lower() == categoria.lower()]
@@ -42,7 +118,66 @@ def get_restaurantes(
         resultados = [r for r in resultados if r.ativo == ativo]
     if nome:
         resultados = [r for r in resultados if nome.lower() in r.nome.lower()]
-    return resultados
+    conteudo = _LISTA_ADAPTER.dump_json(resultados)
+    return conteudo, calcular_etag(conteudo)
+
+
+@router.get(
+    "",
+    response_model=List[Restaurante],
+    summary="Lista e filtra restaurantes",
+    dependencies=[Depends(catalogo_pronto)],
+)
+async def get_restaurantes(
+    categoria: Optional[str] = None,
+    ativo: Optional[bool] = None,
+    nome: Optional[str] = None,
+    db: CatalogoVersionado = Depends(get_db),
+    coalescencia: SingleFlight = Depends(get_coalescencia),
+):
+    """
+    Retorna uma lista de todos os restaurantes, com filtros opcionais.
+    Requisições simultâneas com os mesmos filtros (e a mesma versão do
+    catálogo) compartilham uma única consulta e serialização.
+    """
+    # Lida antes da cópia: no pior caso o cliente recebe de novo uma alteração
+    versao = db.versao
+    # Os filtros de texto não diferenciam maiúsculas de minúsculas
+    chave = ((categoria or "").lower(), ativo, (nome or "").lower(), versao)
+    conteudo, etag = await coalescencia.executar(
+        chave, lambda: run_in_threadpool(_listar_json, db, categoria, ativo, nome)
+    )
+    return Response(
+        conteudo,
+        media_type="application/json",
+        headers={VERSAO_HEADER: str(versao), "ETag": etag},
+    )
+
+
+@router.get(
+    "/changes",
+    response_model=AlteracoesCatalogo,
+    summary="Lista os restaurantes alterados desde uma versão do catálogo",
+    dependencies=[Depends(catalogo_pronto)],
+)
+@perfilavel
+def get_changes(
+    since: int = Query(..., ge=0, description="Última versão que o cliente tem."),
+    db: CatalogoVersionado = Depends(get_db),
+):
+    """
+    Retorna só os restaurantes incluídos ou alterados depois de 'since'. Se o
+    registro de alterações não cobre mais essa versão, responde com
+    'resync' e o cliente deve recarregar a lista completa.
+    """
+    alteracoes = db.alteracoes_desde(since)
+    if alteracoes is None:
+        return AlteracoesCatalogo(versao=db.versao, resync=True)
+    return AlteracoesCatalogo(
+        versao=alteracoes.versao,
+        alterados=alteracoes.alterados,
+        removidos=alteracoes.removidos,
+    )
 
 
 @router.get(
@@ -50,13 +185,107 @@ def get_restaurantes(
     response_model=Restaurante,
     summary="Busca um restaurante pelo nome",
 )
-def get_restaurant(nome_restaurante: str, db: Dict[str, Restaurante] = Depends(get_db)):
+@perfilavel
+def get_restaurant(
+    nome_restaurante: str,
+    db: Dict[str, Restaurante] = Depends(get_db),
+    carga: EstadoCarregamento = Depends(get_carga),
+):
     """Retorna os dados de um restaurante específico pelo seu nome."""
+    return _buscar_restaurante(nome_restaurante, db, carga)
+
+
+@router.get(
+    "/{nome_restaurante}/categorias",
+    response_model=List[CategoriaCardapio],
+    summary="Lista as categorias do cardápio de um restaurante",
+)
+@perfilavel
+def get_restaurant_categories(
+    nome_restaurante: str,
+    db: Dict[str, Restaurante] = Depends(get_db),
+    carga: EstadoCarregamento = Depends(get_carga),
+):
+    """Retorna as categorias do cardápio com a quantidade de itens de cada uma."""
+    restaurante = _buscar_restaurante(nome_restaurante, db, carga)
+    return [
+        CategoriaCardapio(categoria=categoria, quantidade=len(itens))
+        for categoria, itens in restaurante.itens_por_categoria.items()
+    ]
+
+
+@router.get(
+    "/{nome_restaurante}/cardapio",
+    response_model=List[ItemCardapio],
+    summary="Lista os itens do cardápio, com filtro opcional por categoria",
+)
+@perfilavel
+def get_restaurant_menu(
+    nome_restaurante: str,
+    categoria: Optional[str] = None,
+    db: Dict[str, Restaurante] = Depends(get_db),
+    carga: EstadoCarregamento = Depends(get_carga),
+):
+    """Retorna os itens do cardápio, apenas os da categoria se informada."""
+    restaurante = _buscar_restaurante(nome_restaurante, db, carga)
+    if not categoria:
+        return restaurante.cardapio
+    return restaurante.itens_por_categoria.get(categoria.upper(), [])
+
+
+@router.post(
+    "/{nome_restaurante}/cardapio",
+    response_model=ResultadoIngestao,
+    summary="Inclui itens no cardápio a partir de NDJSON enviado em streaming",
+    dependencies=[Depends(catalogo_pronto)],
+)
+async def ingest_menu_items(
+    nome_restaurante: str,
+    request: Request,
+    db: CatalogoVersionado = Depends(get_db),
+    broker: EventBroker = Depends(get_broker),
+    autocomplete: AutocompleteCatalogo = Depends(get_autocomplete),
+):
+    """
+    Lê o corpo (um item por linha, ex: {"item": "Big Mac", "price": 25.9})
+    conforme ele chega e inclui os itens válidos no cardápio, lote a lote,
+    classificados como na carga do catálogo. As linhas inválidas não
+    interrompem o envio: são contadas e as primeiras detalhadas na resposta.
+    """
     nome_normalizado = nome_restaurante.replace("_", " ").title()
-    restaurante = db.get(nome_normalizado)
-    if not restaurante:
-        raise HTTPException(status_code=404, detail="Restaurante não encontrado")
-    return restaurante
+    restaurante = _buscar_restaurante(nome_restaurante, db)
+    ingestao = IngestaoCardapio()
+    nomes_cardapio = {item.item for item in restaurante.cardapio}
+    versao = None
+    try:
+        async for lote in lotes_ndjson(request.stream()):
+            # Decodificar, classificar e validar fica fora do event loop; a
+            # inclusão é feita aqui, então envios simultâneos não se misturam
+            itens = await run_in_threadpool(ingestao.processar_lote, lote)
+            restaurante.adicionar_itens(itens)
+            nomes_novos = {item.item for item in itens} - nomes_cardapio
+            nomes_cardapio |= nomes_novos
+            autocomplete.adicionar_itens(restaurante.nome, len(itens), nomes_novos)
+    finally:
+        # Mesmo se o envio for interrompido, o que entrou passa a ser sincronizado
+        if ingestao.incluidos:
+            versao = db.marcar_alterado(nome_normalizado)
+            broker.publicar(
+                "cardapio_atualizado",
+                {
+                    "nome": restaurante.nome,
+                    "incluidos": ingestao.incluidos,
+                    "versao": versao,
+                },
+            )
+    return ResultadoIngestao(
+        restaurante=restaurante.nome,
+        recebidos=ingestao.recebidos,
+        incluidos=ingestao.incluidos,
+        rejeitados=ingestao.rejeitados,
+        erros=ingestao.erros,
+        versao=versao,
+    )
 
 
 @router.post(
@@ -64,9 +293,14 @@ def get_restaurant(nome_restaurante: str, db: Dict[str, Restaurante] = Depends(g
     response_model=Restaurante,
     status_code=201,
     summary="Cadastra um novo restaurante",
+    dependencies=[Depends(catalogo_pronto)],
 )
+@perfilavel
 def create_restaurant(
-    restaurante_input: Restaurante, db: Dict[str, Restaurante] = Depends(get_db)
+    restaurante_input: Restaurante,
+    db: CatalogoVersionado = Depends(get_db),
+    broker: EventBroker = Depends(get_broker),
+    autocomplete: AutocompleteCatalogo = Depends(get_autocomplete),
 ):
     """Recebe os dados de um novo restaurante e o adiciona ao 'banco de dados'."""
     nome_normalizado = restaurante_input.nome.title()
@@ -74,7 +308,16 @@ def create_restaurant(
         raise HTTPException(
             status_code=409, detail="Restaurante com este nome já existe."
         )
+    restaurante_input.indexar_categorias()
     db[nome_normalizado] = restaurante_input
+    autocomplete.adicionar_restaurante(restaurante_input)
+    broker.publicar(
+        "restaurante_criado",
+        {
+            **restaurante_input.model_dump(include={"nome", "categoria", "ativo"}),
+            "versao": db.versao,
+        },
+    )
     return restaurante_input
 
 
@@ -82,9 +325,13 @@ def create_restaurant(
     "/{nome_restaurante}/toggle_status",
     response_model=Restaurante,
     summary="Ativa ou desativa um restaurante",
+    dependencies=[Depends(catalogo_pronto)],
 )
+@perfilavel
 def toggle_restaurant_status(
-    nome_restaurante: str, db: Dict[str, Restaurante] = Depends(get_db)
+    nome_restaurante: str,
+    db: CatalogoVersionado = Depends(get_db),
+    broker: EventBroker = Depends(get_broker),
 ):
     """Encontra um restaurante pelo nome e inverte seu status 'ativo'."""
     nome_normalizado = nome_restaurante.replace("_", " ").title()
@@ -92,4 +339,9 @@ def toggle_restaurant_status(
     if not restaurante:
         raise HTTPException(status_code=404, detail="Restaurante não encontrado")
     restaurante.ativo = not restaurante.ativo
+    versao = db.marcar_alterado(nome_normalizado)
+    broker.publicar(
+        "status_alterado",
+        {"nome": restaurante.nome, "ativo": restaurante.ativo, "versao": versao},
+    )
     return restaurante
@@ -0,0 +1,180 @@
+"""
+Difusão de eventos do catálogo para os assinantes (Server-Sent Events).
+
+O 'EventBroker' recebe os eventos publicados pelos endpoints (que rodam em
+threads do threadpool) e os entrega a cada assinante, que os consome no
+event loop. Cada assinante tem um buffer limitado: quem não acompanha o
+ritmo é desconectado e, ao reconectar com 'Last-Event-ID', recebe o que
+perdeu a partir do histórico (também limitado).
+
+Assinantes ociosos custam apenas um objeto pequeno e uma corrotina
+parada, o que permite manter milhares deles num único worker.
+"""
+
+import asyncio
+import itertools
+import json
+import threading
+from collections import deque
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Set
+
+# Eventos mantidos para retomada via 'Last-Event-ID'
+TAMANHO_HISTORICO = 1000
+# Eventos pendentes por assinante antes de ele ser desconectado
+TAMANHO_BUFFER = 256
+# Intervalo (segundos) entre comentários de keep-alive na conexão ociosa
+INTERVALO_KEEPALIVE = 15.0
+
+
+@dataclass(frozen=True)
+class Evento:
+    """Um evento publicado, já com o identificador sequencial."""
+
+    id: int
+    tipo: str
+    dados: Dict[str, Any]
+
+    @cached_property
+    def texto(self) -> str:
+        """O evento no protocolo SSE (formatado uma vez para todos)."""
+        dados = json.dumps(self.dados, ensure_ascii=False, separators=(",", ":"))
+        return f"id: {self.id}\nevent: {self.tipo}\ndata: {dados}\n\n"
+
+
+class _Assinante:
+    """Buffer limitado de eventos de uma conexão."""
+
+    __slots__ = ("pendentes", "sinal", "estourou", "ocioso")
+
+    def __init__(self) -> None:
+        self.pendentes: Deque[Evento] = deque()
+        self.sinal = asyncio.Event()
+        self.estourou = False
+        # Marcado pelo keep-alive; desmarcado a cada evento entregue
+        self.ocioso = False
+
+
+class EventBroker:
+    """Distribui eventos para todos os assinantes conectados."""
+
+    def __init__(
+        self,
+        tamanho_historico: int = TAMANHO_HISTORICO,
+        tamanho_buffer: int = TAMANHO_BUFFER,
+        intervalo_keepalive: float = INTERVALO_KEEPALIVE,
+    ) -> None:
+        self.tamanho_buffer = tamanho_buffer
+        self.intervalo_keepalive = intervalo_keepalive
+        self._historico: Deque[Evento] = deque(maxlen=tamanho_historico)
+        self._assinantes: Set[_Assinante] = set()
+        self._sequencia = itertools.count(1)
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._keepalive: Optional["asyncio.Task[None]"] = None
+        self.stats: Dict[str, int] = {"publicados": 0, "desconectados_por_atraso": 0}
+
+    @property
+    def assinantes(self) -> int:
+        """Quantidade de assinantes conectados."""
+        return len(self._assinantes)
+
+    @property
+    def ultimo_id(self) -> int:
+        """Identificador do último evento publicado (0 se nenhum)."""
+        return self._historico[-1].id if self._historico else 0
+
+    def publicar(self, tipo: str, dados: Dict[str, Any]) -> Evento:
+        """
+        Publica um evento para todos os assinantes. Pode ser chamado de
+        qualquer thread (os endpoints síncronos rodam no threadpool).
+        """
+        with self._lock:
+            evento = Evento(next(self._sequencia), tipo, dados)
+            self._historico.append(evento)
+            self.stats["publicados"] += 1
+            for assinante in self._assinantes:
+                if len(assinante.pendentes) >= self.tamanho_buffer:
+                    assinante.estourou = True
+                else:
+                    assinante.pendentes.append(evento)
+            loop = self._loop if self._assinantes else None
+
+        # Um único agendamento acorda todos os assinantes no event loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._acordar)
+        return evento
+
+    def _acordar(self) -> None:
+        with self._lock:
+            assinantes = list(self._assinantes)
+        for assinante in assinantes:
+            assinante.sinal.set()
+
+    async def _manter_vivos(self) -> None:
+        """
+        Uma única tarefa marca e acorda os assinantes periodicamente: quem
+        não recebeu nada desde a última passada envia um keep-alive. Evita
+        um temporizador por conexão, que custaria a cada evento difundido.
+        """
+        while self._assinantes:
+            await asyncio.sleep(self.intervalo_keepalive)
+            with self._lock:
+                assinantes = list(self._assinantes)
+            for assinante in assinantes:
+                if assinante.ocioso:
+                    assinante.sinal.set()
+                assinante.ocioso = True
+        self._keepalive = None
+
+    def _eventos_desde(self, ultimo_id: int) -> Optional[List[Evento]]:
+        """
+        Eventos posteriores a 'ultimo_id', ou None se não for possível saber
+        (já saíram do histórico ou o servidor reiniciou a numeração).
+        """
+        if ultimo_id == self.ultimo_id:
+            return []
+        if ultimo_id > self.ultimo_id or ultimo_id < self._historico[0].id - 1:
+            return None
+        return [e for e in self._historico if e.id > ultimo_id]
+
+    async def assinar(self, ultimo_id: Optional[int] = None) -> AsyncIterator[str]:
+        """
+        Produz o fluxo SSE de um assinante: primeiro o que ele perdeu desde
+        'ultimo_id' (se informado), depois os eventos novos, com keep-alive.
+        """
+        assinante = _Assinante()
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            perdidos = [] if ultimo_id is None else self._eventos_desde(ultimo_id)
+            self._assinantes.add(assinante)
+        if self._keepalive is None:
+            self._keepalive = asyncio.create_task(self._manter_vivos())
+
+        try:
+            # Pede que o cliente reconecte daqui a 1s, se a conexão cair
+            yield "retry: 1000\n\n"
+            if perdidos is None:
+                # O histórico não cobre a lacuna: o cliente deve recarregar tudo
+                yield Evento(self.ultimo_id, "resync", {}).texto
+            else:
+                for evento in perdidos:
+                    yield evento.texto
+
+            while True:
+                await assinante.sinal.wait()
+                assinante.sinal.clear()
+                if not assinante.pendentes:
+                    yield ": keep-alive\n\n"
+                    continue
+                assinante.ocioso = False
+                while assinante.pendentes:
+                    yield assinante.pendentes.popleft().texto
+                if assinante.estourou:
+                    # Ficou para trás: encerra; o cliente retoma pelo histórico
+                    self.stats["desconectados_por_atraso"] += 1
+                    return
+        finally:
+            with self._lock:
+                self._assinantes.discard(assinante)
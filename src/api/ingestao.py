@@ -0,0 +1,118 @@
+"""
+Ingestão de itens de cardápio em NDJSON, em streaming.
+
+O corpo da requisição (um item JSON por linha) é lido conforme chega e
+processado em lotes de 'TAMANHO_LOTE' linhas: cada lote é classificado e
+validado de uma vez (como na carga do catálogo) e os itens válidos já
+entram no cardápio. Linhas inválidas são contadas e as primeiras
+'LIMITE_ERROS' detalhadas na resposta, sem interromper o envio.
+
+A memória usada pela ingestão não depende do tamanho do envio: no máximo
+um lote, uma linha incompleta (até 'TAMANHO_MAX_LINHA') e os detalhes dos
+erros ficam guardados além dos itens incluídos.
+"""
+
+from typing import AsyncIterator, List, Optional, Tuple
+
+from pydantic_core import from_json
+from models.schemas import ErroIngestao, ItemCardapio
+from utils.data_reader import validar_itens
+
+# Linhas classificadas e validadas de uma vez
+TAMANHO_LOTE = 1000
+# Linhas maiores que isto são rejeitadas sem serem guardadas inteiras
+TAMANHO_MAX_LINHA = 64 * 1024
+# Quantidade de linhas rejeitadas detalhadas na resposta
+LIMITE_ERROS = 100
+
+# Uma linha numerada (None: a linha passou de 'TAMANHO_MAX_LINHA')
+Linha = Tuple[int, Optional[bytes]]
+
+
+async def lotes_ndjson(
+    blocos: AsyncIterator[bytes],
+    tamanho_lote: int = TAMANHO_LOTE,
+    tamanho_max_linha: int = TAMANHO_MAX_LINHA,
+) -> AsyncIterator[List[Linha]]:
+    """
+    Separa os blocos de bytes do corpo em linhas numeradas (a partir de 1,
+    ignorando as vazias) e as agrupa em lotes de até 'tamanho_lote'.
+    """
+    lote: List[Linha] = []
+    pendente = bytearray()  # Linha ainda sem o '\n'
+    numero = 0
+    descartando = False  # Restante de uma linha longa demais
+
+    def fechar_linha(linha: bytes) -> None:
+        nonlocal numero, descartando
+        numero += 1
+        if descartando or len(linha) > tamanho_max_linha:
+            lote.append((numero, None))
+            descartando = False
+        elif linha.strip():
+            lote.append((numero, linha))
+
+    async for bloco in blocos:
+        # Só o bloco novo é procurado: blocos pequenos não custam mais caro
+        fim = bloco.rfind(b"\n")
+        if fim < 0:
+            pendente += bloco
+        else:
+            linhas = (bytes(pendente) + bloco[:fim]).split(b"\n")
+            pendente = bytearray(bloco[fim + 1 :])
+            for linha in linhas:
+                fechar_linha(linha)
+                if len(lote) >= tamanho_lote:
+                    yield lote
+                    lote = []
+        if len(pendente) > tamanho_max_linha:
+            pendente, descartando = bytearray(), True
+    if pendente.strip() or descartando:
+        fechar_linha(bytes(pendente))
+    if lote:
+        yield lote
+
+
+class IngestaoCardapio:
+    """Contadores e erros de uma ingestão; 'processar_lote' roda no threadpool."""
+
+    def __init__(self) -> None:
+        self.recebidos = 0
+        self.incluidos = 0
+        self.rejeitados = 0
+        self.erros: List[ErroIngestao] = []
+
+    def _rejeitar(self, linha: int, erro: str) -> None:
+        self.rejeitados += 1
+        if len(self.erros) < LIMITE_ERROS:
+            self.erros.append(ErroIngestao(linha=linha, erro=erro))
+
+    def processar_lote(self, linhas: List[Linha]) -> List[ItemCardapio]:
+        """Decodifica, classifica e valida um lote; retorna os itens válidos."""
+        dados = []
+        numeros = []
+        rejeitadas: List[Tuple[int, str]] = []
+        for numero, linha in linhas:
+            self.recebidos += 1
+            if linha is None:
+                rejeitadas.append(
+                    (numero, f"Linha maior que {TAMANHO_MAX_LINHA} bytes.")
+                )
+                continue
+            try:
+                dado = from_json(linha)
+            except ValueError as e:
+                rejeitadas.append((numero, f"JSON inválido: {e}"))
+                continue
+            if not isinstance(dado, dict):
+                rejeitadas.append((numero, "Cada linha deve ser um objeto JSON."))
+                continue
+            dados.append(dado)
+            numeros.append(numero)
+
+        itens, erros = validar_itens(dados)
+        rejeitadas.extend((numeros[indice], erro) for indice, erro in erros.items())
+        for numero, erro in sorted(rejeitadas):
+            self._rejeitar(numero, erro)
+        self.incluidos += len(itens)
+        return itens
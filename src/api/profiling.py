@@ -0,0 +1,271 @@
+"""
+Profiling sob demanda para a API Sabor Express.
+
+Responsável por:
+- Decidir, por requisição, se ela deve ser perfilada (cabeçalho com token
+  ou amostragem aleatória).
+- Perfilar a requisição inteira com cProfile, até o último bloco do corpo
+  da resposta ser enviado (inclui a serialização feita depois do handler e
+  o corpo das respostas em streaming), e gravar o resultado no formato
+  padrão do pstats (.prof), legível por `pstats`, snakeviz, etc.
+- Perfilar a inicialização da aplicação (carregamento dos dados).
+
+Quando nenhum gatilho está configurado, nada é instalado: o decorador
+devolve a função original e o middleware não é registrado.
+
+O perfil principal roda na thread do event loop. Até o Python 3.11, o
+cProfile só registra a thread que o ativou, então o trabalho feito no
+threadpool (handlers síncronos marcados com '@perfilavel' e os blocos de
+corpos gerados com 'iterar_perfilado') é perfilado em trechos separados,
+somados ao arquivo no final. A partir do Python 3.12, o perfil principal
+já registra todas as threads e os trechos não são necessários.
+
+Só uma requisição é perfilada por vez no processo: a partir do Python 3.12
+o cProfile recusa um segundo perfil ('Another profiling tool is already
+active'). Uma requisição que encontra outro perfil ativo simplesmente não
+é perfilada; o profiling nunca faz uma requisição falhar. Como o perfil
+registra tudo o que roda nas threads perfiladas, ele pode incluir trabalho
+de outras requisições simultâneas.
+"""
+
+import cProfile
+import pstats
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, Set, TypeVar
+from fastapi import FastAPI
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from core.config import settings
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_FILE_HEADER = "X-Profile-File"
+
+T = TypeVar("T")
+# Marca o fim de um iterador em 'iterar_perfilado'
+_FIM = object()
+
+# Um perfil ativo por vez no processo (ver o docstring do módulo)
+_perfil_em_uso = threading.Lock()
+
+
+class _Coleta:
+    """Perfil de uma requisição: o principal e os trechos em outras threads."""
+
+    def __init__(self) -> None:
+        self.principal = cProfile.Profile()
+        # Um perfil por thread do threadpool, reativado a cada trecho
+        self.trechos: Dict[int, cProfile.Profile] = {}
+        self.encerrada = False
+        self._thread_principal: Optional[int] = None
+        self._ativas: Set[int] = set()
+
+    def iniciar(self) -> bool:
+        """Ativa o perfil principal na thread atual (False se não foi possível)."""
+        try:
+            self.principal.enable()
+        except ValueError:
+            # Outra ferramenta de profiling (fora deste módulo) está ativa
+            return False
+        self._thread_principal = threading.get_ident()
+        return True
+
+    @contextmanager
+    def trecho(self) -> Iterator[None]:
+        """Perfila o bloco envolvido, se a thread atual não estiver coberta."""
+        thread = threading.get_ident()
+        perfil = None
+        if not self.encerrada and thread not in self._ativas:
+            if thread != self._thread_principal:
+                perfil = self.trechos.setdefault(thread, cProfile.Profile())
+                try:
+                    perfil.enable()
+                    self._ativas.add(thread)
+                except ValueError:
+                    # Python 3.12+: o perfil principal já registra esta thread
+                    perfil = None
+        try:
+            yield
+        finally:
+            if perfil is not None:
+                perfil.disable()
+                self._ativas.discard(thread)
+
+    def encerrar(self, file_path: Path) -> bool:
+        """Desativa o perfil principal e grava tudo em 'file_path'."""
+        self.encerrada = True
+        self.principal.disable()
+        # Trechos ainda em andamento (ao atingir o tempo máximo) ficam de fora
+        trechos = [p for t, p in self.trechos.items() if t not in self._ativas]
+        perfis = [p for p in (self.principal, *trechos) if p.getstats()]
+        if not perfis:
+            return False
+        estatisticas = pstats.Stats(perfis[0])
+        if perfis[1:]:
+            estatisticas.add(*perfis[1:])
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        estatisticas.dump_stats(file_path)
+        return True
+
+
+# Perfil da requisição corrente. Os handlers síncronos rodam no threadpool,
+# e o contexto é copiado para a thread, então o handler encontra aqui o
+# mesmo objeto criado pelo middleware.
+_coleta_atual: ContextVar[Optional[_Coleta]] = ContextVar("coleta_atual", default=None)
+
+
+@contextmanager
+def _perfilando(perfil: cProfile.Profile) -> Iterator[None]:
+    """Ativa 'perfil' durante o bloco, se nenhum outro estiver ativo."""
+    ativo = False
+    if _perfil_em_uso.acquire(blocking=False):
+        try:
+            perfil.enable()
+            ativo = True
+        except ValueError:
+            # Outra ferramenta de profiling (fora deste módulo) está ativa
+            _perfil_em_uso.release()
+    try:
+        yield
+    finally:
+        if ativo:
+            perfil.disable()
+            _perfil_em_uso.release()
+
+
+def _caminho_perfil(rotulo: str) -> Path:
+    """Caminho do arquivo de um novo perfil no diretório configurado."""
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", rotulo).strip("_").lower() or "raiz"
+    nome_arquivo = f"{time.strftime('%Y%m%d-%H%M%S')}-{time.time_ns() % 10**9}"
+    return settings.PROFILING_DIR / f"{nome_arquivo}-{slug}.prof"
+
+
+def _deve_perfilar(headers: Headers) -> bool:
+    """Verifica o cabeçalho de profiling e a taxa de amostragem."""
+    token = headers.get(PROFILE_HEADER)
+    if settings.PROFILING_TOKEN and token == settings.PROFILING_TOKEN:
+        return True
+    return random.random() < settings.PROFILING_SAMPLE_RATE
+
+
+def perfilavel(func: Callable) -> Callable:
+    """
+    Decorador para handlers síncronos: quando a requisição corrente está
+    sendo perfilada, registra a execução do handler no threadpool.
+    Com o profiling desligado, retorna a própria função (custo zero).
+    """
+    if not settings.profiling_habilitado:
+        return func
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        coleta = _coleta_atual.get()
+        if coleta is None:
+            return func(*args, **kwargs)
+        with coleta.trecho():
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def iterar_perfilado(blocos: Iterator[T]) -> Iterator[T]:
+    """
+    Para o corpo síncrono de uma 'StreamingResponse': quando a requisição
+    corrente está sendo perfilada, registra a geração de cada bloco (feita
+    no threadpool). Sem profiling, devolve o próprio iterador.
+    """
+    coleta = _coleta_atual.get()
+    if coleta is None:
+        return blocos
+
+    def perfilado() -> Iterator[T]:
+        while True:
+            with coleta.trecho():
+                bloco = next(blocos, _FIM)
+            if bloco is _FIM:
+                return
+            yield bloco
+
+    return perfilado()
+
+
+class ProfilingMiddleware:
+    """
+    Perfila as requisições selecionadas do início até o fim do envio do
+    corpo da resposta. Fluxos longos, como o SSE, deixam de ser perfilados
+    no primeiro bloco enviado depois de 'PROFILING_MAX_SECONDS'.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not _deve_perfilar(Headers(scope=scope)):
+            await self.app(scope, receive, send)
+            return
+        if not _perfil_em_uso.acquire(blocking=False):
+            await self.app(scope, receive, send)  # Outro perfil está ativo
+            return
+
+        coleta = _Coleta()
+        if not coleta.iniciar():
+            _perfil_em_uso.release()
+            await self.app(scope, receive, send)
+            return
+
+        file_path = _caminho_perfil(f"{scope['method']}_{scope['path']}")
+        limite = time.perf_counter() + settings.PROFILING_MAX_SECONDS
+
+        def encerrar() -> None:
+            if not coleta.encerrada:
+                try:
+                    coleta.encerrar(file_path)
+                finally:
+                    _perfil_em_uso.release()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and not coleta.encerrada:
+                MutableHeaders(scope=message)[PROFILE_FILE_HEADER] = file_path.name
+            await send(message)
+            if message["type"] == "http.response.body" and (
+                time.perf_counter() > limite
+            ):
+                encerrar()
+
+        token_ctx = _coleta_atual.set(coleta)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _coleta_atual.reset(token_ctx)
+            encerrar()
+
+
+def instalar_profiling(app: FastAPI) -> None:
+    """Registra o middleware de profiling, se algum gatilho estiver configurado."""
+    if settings.profiling_habilitado:
+        app.add_middleware(ProfilingMiddleware)
+
+
+@contextmanager
+def perfilar_inicializacao() -> Iterator[None]:
+    """Perfila o bloco envolvido quando 'PROFILE_STARTUP' estiver ativo."""
+    if not settings.PROFILE_STARTUP:
+        yield
+        return
+
+    perfil = cProfile.Profile()
+    try:
+        with _perfilando(perfil):
+            yield
+    finally:
+        if perfil.getstats():
+            file_path = _caminho_perfil("startup")
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            perfil.dump_stats(file_path)
+            print(f"INFO:     Perfil da inicialização salvo em: {file_path}")
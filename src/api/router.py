@@ -8,26 +8,38 @@ Responsável por:
 """
 
 from contextlib import asynccontextmanager
-from typing import Dict
 from fastapi import FastAPI
-from models.schemas import Restaurante
-from utils.data_reader import carregar_dados_restaurantes
-from .endpoints import restaurants
+from fastapi.responses import JSONResponse
+from utils.autocomplete import AutocompleteCatalogo
+from .carregamento import EstadoCarregamento
+from .catalogo import CatalogoVersionado
+from .coalescencia import SingleFlight
+from .conditional import ETagMiddleware
+from .endpoints import autocomplete, events, export, restaurants
+from .events import EventBroker
+from .profiling import instalar_profiling
 
-# "Banco de dados" em memória
-db: Dict[str, Restaurante] = {}
+# "Banco de dados" em memória (versionado, para a sincronização incremental)
+db = CatalogoVersionado()
+# Difusor dos eventos de alteração do catálogo (SSE)
+broker = EventBroker()
+# Progresso da carga do catálogo, feita em segundo plano
+carga = EstadoCarregamento()
+# Listagens simultâneas iguais compartilham uma única execução
+coalescencia = SingleFlight()
+# Índices por prefixo de '/api/autocomplete', construídos ao fim da carga
+indices_autocomplete = AutocompleteCatalogo()
 
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
     """Gerenciador de contexto para eventos de inicialização e finalização da API."""
-    print("INFO:     Aplicação iniciando... Populando o banco de dados em memória.")
-    dados_carregados = carregar_dados_restaurantes()
-    db.clear()
-    db.update(dados_carregados)
-    print("INFO:     Banco de dados populado com sucesso.")
+    print("INFO:     Aplicação iniciando... Carregando o catálogo em segundo plano.")
+    # A API já aceita conexões: '/health/ready' indica quando a carga terminou
+    carga.iniciar(db, indices_autocomplete)
     yield
     print("INFO:     Aplicação finalizando... Limpando recursos.")
+    carga.cancelar()
     db.clear()
 
 
@@ -38,19 +50,51 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Respostas JSON de GET com ETag (o cliente revalida com 'If-None-Match')
+app.add_middleware(ETagMiddleware)
+
+# Profiling sob demanda (só é instalado se configurado em 'settings')
+instalar_profiling(app)
+
 
 # ===================================================================
 #  Injeção de Dependência (A FORMA CORRETA)
 # ===================================================================
-def get_db_dependency() -> Dict[str, Restaurante]:
+# 'async def': dependências síncronas rodam no threadpool, um salto de thread
+# por requisição só para devolver um objeto global.
+async def get_db_dependency() -> CatalogoVersionado:
     """Fornece o dicionário 'db' como uma dependência para os endpoints."""
     return db
 
 
+async def get_broker_dependency() -> EventBroker:
+    """Fornece o difusor de eventos como uma dependência para os endpoints."""
+    return broker
+
+
+async def get_carga_dependency() -> EstadoCarregamento:
+    """Fornece o estado da carga do catálogo como uma dependência."""
+    return carga
+
+
+async def get_coalescencia_dependency() -> SingleFlight:
+    """Fornece a coalescência das listagens como uma dependência."""
+    return coalescencia
+
+
+async def get_autocomplete_dependency() -> AutocompleteCatalogo:
+    """Fornece os índices do autocompletar como uma dependência."""
+    return indices_autocomplete
+
+
 # CORREÇÃO: Usei o método oficial do FastAPI para substituir a dependência.
 # Isso garante que, sempre que FastAPI encontrar 'restaurants.get_db', ele usará
 # a função 'get_db_dependency' em vez da placeholder.
 app.dependency_overrides[restaurants.get_db] = get_db_dependency
+app.dependency_overrides[restaurants.get_broker] = get_broker_dependency
+app.dependency_overrides[restaurants.get_carga] = get_carga_dependency
+app.dependency_overrides[restaurants.get_coalescencia] = get_coalescencia_dependency
+app.dependency_overrides[restaurants.get_autocomplete] = get_autocomplete_dependency
 
 # ===================================================================
 #  Inclusão dos Routers
@@ -58,6 +102,11 @@ app.dependency_overrides[restaurants.get_db] = get_db_dependency
 app.include_router(
     restaurants.router, prefix="/api/restaurantes", tags=["Restaurantes"]
 )
+app.include_router(export.router, prefix="/api/exportar", tags=["Exportação"])
+app.include_router(events.router, prefix="/api/eventos", tags=["Eventos"])
+app.include_router(
+    autocomplete.router, prefix="/api/autocomplete", tags=["Autocompletar"]
+)
 
 
 # ===================================================================
@@ -67,3 +116,31 @@ app.include_router(
 def read_root():
     """Endpoint raiz que fornece uma mensagem de boas-vindas."""
     return {"message": "Bem-vindo à API Sabor Express!", "docs_url": "/docs"}
+
+
+# ===================================================================
+#  Verificações de Saúde (liveness / readiness)
+# ===================================================================
+@app.get("/health/live", summary="O processo está respondendo", tags=["Saúde"])
+def health_live():
+    """Responde assim que o servidor sobe, mesmo durante a carga do catálogo."""
+    return {"status": "ok"}
+
+
+@app.get("/health/ready", summary="O catálogo está pronto", tags=["Saúde"])
+def health_ready():
+    """200 quando o catálogo terminou de carregar; senão 503 com o progresso."""
+    progresso = carga.progresso()
+    return JSONResponse(progresso, status_code=200 if carga.pronto else 503)
+
+
+@app.get("/health/stats", summary="Contadores internos da API", tags=["Saúde"])
+def health_stats():
+    """Contadores da coalescência das listagens e da difusão de eventos."""
+    return {
+        "coalescencia": {
+            **coalescencia.stats,
+            "em_andamento": coalescencia.em_andamento,
+        },
+        "eventos": {**broker.stats, "assinantes": broker.assinantes},
+    }
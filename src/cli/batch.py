@@ -0,0 +1,140 @@
+"""
+Módulo do modo não interativo (em lote) da CLI.
+
+Executa operações sobre a API a partir de descrições simples em JSON
+(uma por linha, NDJSON), executando até 'paralelismo' operações ao mesmo
+tempo. Cada thread de execução usa o seu próprio ApiClient (a sessão HTTP
+e o cache do cliente não são seguros entre threads), reaproveitando as
+conexões entre as operações da mesma thread.
+
+Formato de entrada (uma operação por linha):
+    {"op": "list"}
+    {"op": "show", "nome": "KFC"}
+    {"op": "toggle", "nome": "KFC"}
+    {"op": "create", "nome": "Novo", "categoria": "Fast Food"}
+    {"op": "autocomplete", "q": "pizz", "tipo": "item"}
+
+Cada linha de saída traz o número da linha de entrada, 'ok' e o
+'resultado' (ou o 'erro'), na mesma ordem da entrada. Uma linha inválida
+(JSON malformado, campo ausente ou com tipo errado) vira um erro só dela,
+sem interromper o lote.
+"""
+
+import json
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List
+
+from .components.api_client import CACHE_TTLS, ApiClient, ApiClientError
+
+OPERACOES: Dict[str, Callable[..., Any]] = {
+    "list": lambda client, op: client.get_restaurants(),
+    "show": lambda client, op: client.get_restaurant_details(op["nome"]),
+    "toggle": lambda client, op: client.toggle_restaurant_status(op["nome"]),
+    "create": lambda client, op: client.create_restaurant(
+        op["nome"], op.get("categoria", "Não especificada")
+    ),
+    "autocomplete": lambda client, op: client.autocomplete(
+        op["q"], op.get("tipo"), op.get("limite", 10)
+    ),
+}
+
+# Tipos aceitos para os campos das operações (quando presentes)
+TIPOS_CAMPOS: Dict[str, tuple] = {
+    "nome": (str,),
+    "categoria": (str,),
+    "q": (str,),
+    "tipo": (str, type(None)),
+    "limite": (int,),
+}
+
+
+def criar_cliente(base_url: str) -> ApiClient:
+    """Cria um ApiClient sem cache (cada operação vê o estado atual da API)."""
+    return ApiClient(base_url, pool_size=1, cache_ttls={tipo: 0 for tipo in CACHE_TTLS})
+
+
+def _validar_campos(op: Dict[str, Any]) -> None:
+    """Rejeita campos com tipo inválido antes de chamar a API."""
+    for campo, tipos in TIPOS_CAMPOS.items():
+        valor = op.get(campo)
+        if campo in op and (not isinstance(valor, tipos) or isinstance(valor, bool)):
+            esperado = " ou ".join(
+                "null" if tipo is type(None) else tipo.__name__ for tipo in tipos
+            )
+            raise ApiClientError(
+                f"Campo '{campo}' com tipo inválido: esperado {esperado}, "
+                f"recebido {json.dumps(valor, ensure_ascii=False)}."
+            )
+
+
+def executar_operacao(client: ApiClient, op: Dict[str, Any]) -> Any:
+    """Executa uma operação descrita por um dicionário com a chave 'op'."""
+    nome_op = op.get("op")
+    if not isinstance(nome_op, str) or nome_op not in OPERACOES:
+        raise ApiClientError(
+            f"Operação desconhecida: '{nome_op}'. Use uma de: {', '.join(OPERACOES)}."
+        )
+    _validar_campos(op)
+    try:
+        return OPERACOES[nome_op](client, op)
+    except KeyError as e:
+        raise ApiClientError(f"Campo obrigatório ausente: {e}") from e
+    except (TypeError, ValueError) as e:
+        # Campo com tipo inválido (ex: "nome": {}, "limite": "abc")
+        raise ApiClientError(f"Campo com valor inválido: {e}") from e
+
+
+def _executar_linha(client: ApiClient, numero: int, linha: str) -> Dict[str, Any]:
+    try:
+        op = json.loads(linha)
+        if not isinstance(op, dict):
+            raise ApiClientError("Cada linha deve ser um objeto JSON.")
+        return {"linha": numero, "ok": True, "resultado": executar_operacao(client, op)}
+    except json.JSONDecodeError as e:
+        return {"linha": numero, "ok": False, "erro": f"JSON inválido: {e}"}
+    except ApiClientError as e:
+        return {"linha": numero, "ok": False, "erro": str(e)}
+
+
+def executar_lote(
+    linhas: Iterable[str], base_url: str, paralelismo: int = 1
+) -> Iterator[Dict[str, Any]]:
+    """
+    Executa as operações das linhas (NDJSON) e produz os resultados na ordem
+    da entrada. No máximo 'paralelismo' operações ficam em execução e a
+    entrada é consumida aos poucos, então o lote pode ter qualquer tamanho.
+    """
+    numeradas = (
+        (numero, linha) for numero, linha in enumerate(linhas, 1) if linha.strip()
+    )
+    if paralelismo <= 1:
+        with criar_cliente(base_url) as client:
+            for numero, linha in numeradas:
+                yield _executar_linha(client, numero, linha)
+        return
+
+    # Um cliente por thread do pool, criado na primeira operação da thread
+    locais = threading.local()
+    clientes: List[ApiClient] = []
+
+    def executar_na_thread(numero: int, linha: str) -> Dict[str, Any]:
+        client = getattr(locais, "client", None)
+        if client is None:
+            client = locais.client = criar_cliente(base_url)
+            clientes.append(client)
+        return _executar_linha(client, numero, linha)
+
+    pendentes: Deque[Future] = deque()
+    try:
+        with ThreadPoolExecutor(max_workers=paralelismo) as executor:
+            for numero, linha in numeradas:
+                pendentes.append(executor.submit(executar_na_thread, numero, linha))
+                if len(pendentes) >= paralelismo * 2:
+                    yield pendentes.popleft().result()
+            while pendentes:
+                yield pendentes.popleft().result()
+    finally:
+        for client in clientes:
+            client.close()
@@ -5,48 +5,369 @@ Responsável por toda a comunicação com a API Sabor Express.
 Abstrai os detalhes das requisições HTTP.
 """
 
+import json
+import random
+import time
+from typing import Any, Dict, Iterable, Iterator, Optional
 import requests
+from requests.adapters import HTTPAdapter
+from .cache import ClientCache
+
+# Métodos que podem ser repetidos com segurança em caso de falha transitória
+METODOS_IDEMPOTENTES = frozenset({"get", "head", "options", "put", "delete"})
+# Status que indicam indisponibilidade temporária do servidor
+STATUS_TRANSITORIOS = frozenset({502, 503, 504})
+# TTL padrão (segundos) das respostas em cache, por tipo de endpoint
+CACHE_TTLS: Dict[str, float] = {
+    "lista": 5.0,
+    "detalhes": 30.0,
+    "categorias": 30.0,
+    "cardapio": 30.0,
+}
+# Tamanho dos blocos lidos das respostas em streaming (exportação NDJSON)
+TAMANHO_BLOCO_STREAM = 64 * 1024
 
 
 class ApiClientError(Exception):
     """Exceção customizada para erros na comunicação com a API."""
 
 
+def normalizar_nome(nome: str) -> str:
+    """Normaliza o nome do restaurante da mesma forma que a API."""
+    return nome.strip().replace("_", " ").title()
+
+
+def extrair_detalhe_erro(response) -> str:
+    """Obtém a mensagem de erro da resposta, mesmo que o corpo não seja JSON."""
+    try:
+        corpo = response.json()
+    except ValueError:
+        # 'reason' (requests) ou 'reason_phrase' (httpx, no AsyncApiClient)
+        motivo = getattr(response, "reason", None) or getattr(
+            response, "reason_phrase", None
+        )
+        return response.text.strip() or motivo or "Erro desconhecido."
+    if isinstance(corpo, dict) and "detail" in corpo:
+        return str(corpo["detail"])
+    return "Erro desconhecido do servidor."
+
+
 class ApiClient:
     """Responsável por toda a comunicação com a API Sabor Express."""
 
-    def __init__(self, base_url: str = "http://127.0.0.1:8000/api"):
+    def __init__(
+        self,
+        base_url: str = "http://127.0.0.1:8000/api",
+        timeout: float = 5.0,
+        retries: int = 3,
+        backoff: float = 0.2,
+        pool_size: int = 10,
+        cache_ttls: Optional[Dict[str, float]] = None,
+        cache_size: int = 256,
+    ):
+        """
+        Args:
+            base_url: URL base da API.
+            timeout: Timeout padrão (segundos) de cada requisição.
+            retries: Tentativas extras para chamadas idempotentes com falha
+                transitória (erro de conexão, timeout ou 502/503/504).
+            backoff: Espera base (segundos) do backoff exponencial com jitter.
+            pool_size: Quantidade máxima de conexões mantidas abertas (keep-alive).
+            cache_ttls: TTL por tipo de endpoint (ver CACHE_TTLS); 0 desativa.
+            cache_size: Quantidade máxima de respostas mantidas em cache.
+        """
         self.base_url = base_url
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.cache_ttls = {**CACHE_TTLS, **(cache_ttls or {})}
+        self.cache = ClientCache(cache_size)
+        # Sessão persistente: reaproveita as conexões TCP entre as chamadas.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """Fecha as conexões abertas da sessão."""
+        self.session.close()
+
+    def __enter__(self) -> "ApiClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
-    def _make_request(self, method: str, endpoint: str, **kwargs):
+    def _esperar_backoff(self, tentativa: int) -> None:
+        """Backoff exponencial com 'full jitter' antes da próxima tentativa."""
+        time.sleep(random.uniform(0, self.backoff * 2**tentativa))
+
+    def _send(
+        self, method: str, endpoint: str, timeout: Optional[float] = None, **kwargs
+    ) -> requests.Response:
+        """Envia a requisição com retentativas e converte falhas em ApiClientError."""
+        url = f"{self.base_url}/{endpoint}"
+        tentativas = self.retries + 1 if method.lower() in METODOS_IDEMPOTENTES else 1
+        timeout = self.timeout if timeout is None else timeout
+
+        for tentativa in range(tentativas):
+            ultima_tentativa = tentativa == tentativas - 1
+            try:
+                response = self.session.request(method, url, timeout=timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if ultima_tentativa:
+                    raise ApiClientError(f"Erro de conexão com a API: {e}") from e
+                self._esperar_backoff(tentativa)
+                continue
+            except requests.RequestException as e:
+                raise ApiClientError(f"Erro de conexão com a API: {e}") from e
+
+            if response.status_code in STATUS_TRANSITORIOS and not ultima_tentativa:
+                self._esperar_backoff(tentativa)
+                continue
+            if response.status_code >= 400:
+                raise ApiClientError(f"Erro na API: {extrair_detalhe_erro(response)}")
+            return response
+        raise ApiClientError("Erro de conexão com a API: tentativas esgotadas.")
+
+    def _make_request(
+        self, method: str, endpoint: str, timeout: Optional[float] = None, **kwargs
+    ):
         """Método genérico para fazer requisições e tratar erros comuns."""
-        try:
-            url = f"{self.base_url}/{endpoint}"
-            response = requests.request(method, url, timeout=5, **kwargs)
-            response.raise_for_status()
-            # Retorna None para requisições bem-sucedidas
-            #  sem conteúdo (ex: 204 No Content)
-            return response.json() if response.status_code != 204 else None
-        except requests.HTTPError as e:
-            detail = e.response.json().get("detail", "Erro desconhecido do servidor.")
-            raise ApiClientError(f"Erro na API: {detail}") from e
-        except requests.RequestException as e:
-            raise ApiClientError(f"Erro de conexão com a API: {e}") from e
-
-    def get_restaurants(self):
+        response = self._send(method, endpoint, timeout=timeout, **kwargs)
+        # Retorna None para requisições bem-sucedidas
+        #  sem conteúdo (ex: 204 No Content)
+        return response.json() if response.status_code != 204 else None
+
+    def _cached_get(
+        self,
+        chave: str,
+        tipo: str,
+        endpoint: str,
+        timeout: Optional[float] = None,
+        params: Optional[Dict[str, str]] = None,
+    ):
+        """
+        GET com cache: entradas frescas são devolvidas sem rede; entradas
+        vencidas são revalidadas com 'If-None-Match' (304 renova o TTL).
+        """
+        ttl = self.cache_ttls.get(tipo, 0)
+        if ttl <= 0:
+            return self._make_request("get", endpoint, timeout=timeout, params=params)
+
+        entrada = self.cache.get(chave)
+        if entrada is not None and entrada.fresca:
+            self.cache.stats["hits"] += 1
+            return entrada.data
+
+        headers = {"If-None-Match": entrada.etag} if entrada and entrada.etag else {}
+        response = self._send(
+            "get", endpoint, timeout=timeout, headers=headers, params=params
+        )
+        if response.status_code == 304 and entrada is not None:
+            self.cache.stats["revalidados"] += 1
+            self.cache.renovar(chave, ttl)
+            return entrada.data
+
+        self.cache.stats["misses"] += 1
+        data = response.json()
+        self.cache.put(chave, data, response.headers.get("ETag"), ttl)
+        return data
+
+    def _invalidar_restaurante(self, name: str) -> None:
+        """Descarta a lista e os dados em cache de um restaurante alterado."""
+        self.cache.invalidate("restaurantes?")
+        self.cache.invalidate(f"restaurantes/{normalizar_nome(name)}#")
+
+    def get_restaurants(self, timeout: Optional[float] = None):
         """Busca a lista de todos os restaurantes."""
-        return self._make_request("get", "restaurantes")
+        return self._cached_get("restaurantes?", "lista", "restaurantes", timeout)
+
+    def get_changes(self, since: int, timeout: Optional[float] = None):
+        """
+        Busca os restaurantes alterados desde a versão 'since' do catálogo.
+        Com 'resync' verdadeiro, a cópia local deve ser recarregada inteira.
+        """
+        return self._make_request(
+            "get", "restaurantes/changes", timeout=timeout, params={"since": since}
+        )
 
-    def get_restaurant_details(self, name: str):
+    def autocomplete(
+        self,
+        prefix: str,
+        tipo: Optional[str] = None,
+        limite: int = 10,
+        timeout: Optional[float] = None,
+    ):
+        """Sugestões de restaurantes e itens para um prefixo (sem cache)."""
+        params: Dict[str, Any] = {"q": prefix, "limite": limite}
+        if tipo:
+            params["tipo"] = tipo
+        return self._make_request("get", "autocomplete", timeout=timeout, params=params)
+
+    def get_restaurant_details(self, name: str, timeout: Optional[float] = None):
         """Busca os detalhes completos, incluindo o cardápio, de um restaurante."""
         # A URL será, por exemplo, /restaurantes/Burger%20King
-        return self._make_request("get", f"restaurantes/{name}")
+        return self._cached_get(
+            f"restaurantes/{normalizar_nome(name)}#detalhes",
+            "detalhes",
+            f"restaurantes/{name}",
+            timeout,
+        )
+
+    def get_restaurant_categories(self, name: str, timeout: Optional[float] = None):
+        """Busca as categorias do cardápio de um restaurante, com as quantidades."""
+        return self._cached_get(
+            f"restaurantes/{normalizar_nome(name)}#categorias",
+            "categorias",
+            f"restaurantes/{name}/categorias",
+            timeout,
+        )
 
-    def create_restaurant(self, name: str, category: str):
+    def get_menu_items(self, name: str, category: str, timeout: Optional[float] = None):
+        """Busca apenas os itens do cardápio de uma categoria."""
+        return self._cached_get(
+            f"restaurantes/{normalizar_nome(name)}#cardapio?{category}",
+            "cardapio",
+            f"restaurantes/{name}/cardapio",
+            timeout,
+            params={"categoria": category},
+        )
+
+    def create_restaurant(
+        self, name: str, category: str, timeout: Optional[float] = None
+    ):
         """Envia dados para criar um novo restaurante."""
         payload = {"nome": name, "categoria": category, "ativo": False}
-        return self._make_request("post", "restaurantes", json=payload)
+        restaurante = self._make_request(
+            "post", "restaurantes", timeout=timeout, json=payload
+        )
+        self._invalidar_restaurante(name)
+        return restaurante
 
-    def toggle_restaurant_status(self, name: str):
+    def toggle_restaurant_status(self, name: str, timeout: Optional[float] = None):
         """Solicita a alteração de status de um restaurante."""
-        return self._make_request("patch", f"restaurantes/{name}/toggle_status")
+        restaurante = self._make_request(
+            "patch", f"restaurantes/{name}/toggle_status", timeout=timeout
+        )
+        self._invalidar_restaurante(name)
+        return restaurante
+
+    def ingest_menu_items(
+        self, name: str, blocos: Iterable[bytes], timeout: Optional[float] = None
+    ):
+        """
+        Envia itens do cardápio em NDJSON (um item por linha) em streaming: o
+        corpo segue conforme 'blocos' é consumido, sem ser montado na memória.
+        Retorna o resumo da ingestão (incluídos, rejeitados e erros por linha).
+        """
+        resultado = self._make_request(
+            "post",
+            f"restaurantes/{name}/cardapio",
+            timeout=timeout,
+            data=blocos,
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        self._invalidar_restaurante(name)
+        return resultado
+
+    def _stream_export(
+        self, nivel: str, filtros: Optional[Dict[str, Any]], timeout: Optional[float]
+    ) -> requests.Response:
+        """Abre a resposta da exportação NDJSON sem ler o corpo."""
+        params = {"nivel": nivel, **(filtros or {})}
+        return self._send(
+            "get", "exportar/restaurantes", timeout=timeout, params=params, stream=True
+        )
+
+    def export_restaurants(
+        self,
+        nivel: str = "restaurantes",
+        filtros: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Exporta o catálogo em streaming (NDJSON), produzindo cada linha já
+        decodificada assim que chega, sem esperar a resposta completa.
+        """
+        with self._stream_export(nivel, filtros, timeout) as response:
+            try:
+                for linha in response.iter_lines(chunk_size=TAMANHO_BLOCO_STREAM):
+                    if linha:
+                        yield json.loads(linha)
+            except requests.RequestException as e:
+                raise ApiClientError(f"Exportação interrompida: {e}") from e
+
+    def export_restaurants_raw(
+        self,
+        nivel: str = "restaurantes",
+        filtros: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[bytes]:
+        """Exporta o catálogo em streaming, produzindo os blocos NDJSON brutos."""
+        with self._stream_export(nivel, filtros, timeout) as response:
+            try:
+                yield from response.iter_content(chunk_size=TAMANHO_BLOCO_STREAM)
+            except requests.RequestException as e:
+                raise ApiClientError(f"Exportação interrompida: {e}") from e
+
+    def watch_events(
+        self,
+        ultimo_id: Optional[int] = None,
+        reconectar: bool = True,
+        timeout_leitura: float = 45.0,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Acompanha o fluxo de eventos do catálogo (SSE), produzindo cada evento
+        como {"id", "evento", "dados"}. Se a conexão cair, reconecta com
+        'Last-Event-ID' e recebe os eventos perdidos nesse intervalo.
+
+        Args:
+            ultimo_id: Retoma a partir deste evento (None: só eventos novos).
+            reconectar: Reconecta automaticamente quando a conexão cai.
+            timeout_leitura: Tempo máximo sem receber nada (nem keep-alive).
+        """
+        tentativa = 0
+        while True:
+            headers = {} if ultimo_id is None else {"Last-Event-ID": str(ultimo_id)}
+            try:
+                response = self._send(
+                    "get",
+                    "eventos",
+                    timeout=(self.timeout, timeout_leitura),
+                    headers=headers,
+                    stream=True,
+                )
+                with response:
+                    for evento in _ler_eventos_sse(response.iter_lines()):
+                        tentativa = 0
+                        if evento["id"] is not None:
+                            ultimo_id = evento["id"]
+                        yield evento
+            except (ApiClientError, requests.RequestException) as e:
+                if not reconectar:
+                    raise ApiClientError(f"Fluxo de eventos interrompido: {e}") from e
+            if not reconectar:
+                return
+            self._esperar_backoff(min(tentativa, 5))
+            tentativa += 1
+
+
+def _ler_eventos_sse(linhas: Iterator[bytes]) -> Iterator[Dict[str, Any]]:
+    """Interpreta as linhas de um fluxo SSE, ignorando comentários (keep-alive)."""
+    evento: Dict[str, Any] = {"id": None, "evento": "message", "dados": []}
+    for bruta in linhas:
+        linha = bruta.decode("utf-8")
+        if not linha:
+            if evento["dados"]:
+                yield {**evento, "dados": json.loads("\n".join(evento["dados"]))}
+            evento = {"id": None, "evento": "message", "dados": []}
+            continue
+        campo, _, valor = linha.partition(":")
+        valor = valor[1:] if valor.startswith(" ") else valor
+        if campo == "id":
+            evento["id"] = int(valor)
+        elif campo == "event":
+            evento["evento"] = valor
+        elif campo == "data":
+            evento["dados"].append(valor)
@@ -0,0 +1,128 @@
+"""
+Componente Cliente Assíncrono da API.
+
+Variante asyncio (httpx) do ApiClient, usada para buscar vários recursos em
+paralelo (ex: o pré-carregamento do menu). Fica num módulo separado para
+que o cliente síncrono não precise importar o httpx.
+"""
+
+import asyncio
+import random
+from typing import Optional
+import httpx
+from .api_client import (
+    METODOS_IDEMPOTENTES,
+    STATUS_TRANSITORIOS,
+    ApiClientError,
+    extrair_detalhe_erro,
+)
+
+
+class AsyncApiClient:
+    """
+    Variante assíncrona (asyncio + httpx) do ApiClient, com a mesma interface
+    e o mesmo tratamento de erros, para buscar vários recursos em paralelo.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://127.0.0.1:8000/api",
+        timeout: float = 5.0,
+        retries: int = 3,
+        backoff: float = 0.2,
+        pool_size: int = 10,
+    ):
+        """Os argumentos têm o mesmo significado que em 'ApiClient'."""
+        self.base_url = base_url
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=pool_size, max_keepalive_connections=pool_size
+            )
+        )
+
+    async def aclose(self) -> None:
+        """Fecha as conexões abertas do cliente."""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncApiClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def _make_request(
+        self, method: str, endpoint: str, timeout: Optional[float] = None, **kwargs
+    ):
+        """Método genérico para fazer requisições e tratar erros comuns."""
+        url = f"{self.base_url}/{endpoint}"
+        tentativas = self.retries + 1 if method.lower() in METODOS_IDEMPOTENTES else 1
+        timeout = self.timeout if timeout is None else timeout
+
+        for tentativa in range(tentativas):
+            ultima_tentativa = tentativa == tentativas - 1
+            try:
+                response = await self.client.request(
+                    method, url, timeout=timeout, **kwargs
+                )
+            except httpx.TransportError as e:
+                if ultima_tentativa:
+                    raise ApiClientError(f"Erro de conexão com a API: {e}") from e
+                await asyncio.sleep(random.uniform(0, self.backoff * 2**tentativa))
+                continue
+            except httpx.HTTPError as e:
+                raise ApiClientError(f"Erro de conexão com a API: {e}") from e
+
+            if response.status_code in STATUS_TRANSITORIOS and not ultima_tentativa:
+                await asyncio.sleep(random.uniform(0, self.backoff * 2**tentativa))
+                continue
+            if response.status_code >= 400:
+                raise ApiClientError(f"Erro na API: {extrair_detalhe_erro(response)}")
+            return response.json() if response.status_code != 204 else None
+        return None
+
+    async def get_restaurants(self, timeout: Optional[float] = None):
+        """Busca a lista de todos os restaurantes."""
+        return await self._make_request("get", "restaurantes", timeout=timeout)
+
+    async def get_restaurant_details(self, name: str, timeout: Optional[float] = None):
+        """Busca os detalhes completos, incluindo o cardápio, de um restaurante."""
+        return await self._make_request("get", f"restaurantes/{name}", timeout=timeout)
+
+    async def get_restaurant_categories(
+        self, name: str, timeout: Optional[float] = None
+    ):
+        """Busca as categorias do cardápio de um restaurante, com as quantidades."""
+        return await self._make_request(
+            "get", f"restaurantes/{name}/categorias", timeout=timeout
+        )
+
+    async def get_menu_items(
+        self, name: str, category: str, timeout: Optional[float] = None
+    ):
+        """Busca apenas os itens do cardápio de uma categoria."""
+        return await self._make_request(
+            "get",
+            f"restaurantes/{name}/cardapio",
+            timeout=timeout,
+            params={"categoria": category},
+        )
+
+    async def create_restaurant(
+        self, name: str, category: str, timeout: Optional[float] = None
+    ):
+        """Envia dados para criar um novo restaurante."""
+        payload = {"nome": name, "categoria": category, "ativo": False}
+        return await self._make_request(
+            "post", "restaurantes", timeout=timeout, json=payload
+        )
+
+    async def toggle_restaurant_status(
+        self, name: str, timeout: Optional[float] = None
+    ):
+        """Solicita a alteração de status de um restaurante."""
+        return await self._make_request(
+            "patch", f"restaurantes/{name}/toggle_status", timeout=timeout
+        )
@@ -0,0 +1,72 @@
+"""
+Componente de Cache do cliente da API.
+
+Cache em memória com TTL por entrada e tamanho máximo (descarta a entrada
+usada há mais tempo). Entradas vencidas não são apagadas de imediato: o
+ApiClient as revalida com uma requisição condicional (ETag) e, se o
+servidor responder 304, só renova a validade.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class CacheEntry:
+    """Uma resposta armazenada no cache."""
+
+    data: Any
+    etag: Optional[str]
+    expira_em: float
+
+    @property
+    def fresca(self) -> bool:
+        """Indica se a entrada ainda está dentro do TTL."""
+        return time.monotonic() < self.expira_em
+
+
+class ClientCache:
+    """Cache LRU com TTL e estatísticas de uso."""
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._entradas: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.stats: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "revalidados": 0,
+            "invalidacoes": 0,
+            "descartes": 0,
+        }
+
+    def get(self, chave: str) -> Optional[CacheEntry]:
+        """Retorna a entrada (fresca ou vencida) e a marca como usada."""
+        entrada = self._entradas.get(chave)
+        if entrada is not None:
+            self._entradas.move_to_end(chave)
+        return entrada
+
+    def put(self, chave: str, data: Any, etag: Optional[str], ttl: float) -> None:
+        """Armazena a resposta, descartando a menos usada se exceder o limite."""
+        self._entradas[chave] = CacheEntry(data, etag, time.monotonic() + ttl)
+        self._entradas.move_to_end(chave)
+        while len(self._entradas) > self.max_entries:
+            self._entradas.popitem(last=False)
+            self.stats["descartes"] += 1
+
+    def renovar(self, chave: str, ttl: float) -> None:
+        """Renova a validade de uma entrada confirmada pelo servidor (304)."""
+        entrada = self._entradas.get(chave)
+        if entrada is not None:
+            entrada.expira_em = time.monotonic() + ttl
+
+    def invalidate(self, prefixo: str) -> None:
+        """Remove todas as entradas cuja chave começa com 'prefixo'."""
+        for chave in [c for c in self._entradas if c.startswith(prefixo)]:
+            del self._entradas[chave]
+            self.stats["invalidacoes"] += 1
+
+    def __len__(self) -> int:
+        return len(self._entradas)
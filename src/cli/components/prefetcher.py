@@ -0,0 +1,102 @@
+"""
+Componente de Pré-carregamento (prefetch) dos cardápios dos restaurantes.
+
+Enquanto o usuário lê a lista e digita o nome do restaurante, busca em
+segundo plano as categorias do cardápio dos restaurantes listados, com
+concorrência limitada. Ao confirmar a escolha, elas normalmente já estão
+disponíveis.
+
+O AsyncApiClient roda num event loop próprio, numa thread de fundo, para
+não interferir no fluxo síncrono (baseado em 'input()') do menu.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Dict, Iterable, Optional
+
+from .api_client import normalizar_nome
+
+
+class MenuPrefetcher:
+    """Busca cardápios de restaurantes em segundo plano com concorrência limitada."""
+
+    def __init__(
+        self, base_url: str = "http://127.0.0.1:8000/api", concorrencia: int = 4
+    ) -> None:
+        self.base_url = base_url
+        self.concorrencia = concorrencia
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._client = None
+        self._semaforo: Optional[asyncio.Semaphore] = None
+        self._futuros: Dict[str, Future] = {}
+
+    def _iniciar(self) -> None:
+        """Sobe o event loop de fundo na primeira utilização."""
+        if self._loop is not None:
+            return
+        # Importado aqui: o httpx só é carregado se o prefetch for usado
+        from .async_api_client import (  # pylint: disable=import-outside-toplevel
+            AsyncApiClient,
+        )
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="prefetcher", daemon=True
+        )
+        self._thread.start()
+
+        async def _criar_recursos():
+            self._client = AsyncApiClient(self.base_url, pool_size=self.concorrencia)
+            self._semaforo = asyncio.Semaphore(self.concorrencia)
+
+        asyncio.run_coroutine_threadsafe(_criar_recursos(), self._loop).result()
+
+    async def _buscar(self, nome: str):
+        async with self._semaforo:
+            return await self._client.get_restaurant_categories(nome)
+
+    def prefetch(self, nomes: Iterable[str]) -> None:
+        """Agenda a busca das categorias de cada restaurante ainda não agendado."""
+        self._iniciar()
+        for nome in nomes:
+            chave = normalizar_nome(nome)
+            if chave not in self._futuros:
+                self._futuros[chave] = asyncio.run_coroutine_threadsafe(
+                    self._buscar(nome), self._loop
+                )
+
+    def obter(self, nome: str, timeout: Optional[float] = None):
+        """
+        Retorna as categorias pré-carregadas do restaurante, aguardando até
+        'timeout' segundos se a busca ainda estiver em andamento.
+
+        Retorna None se o restaurante não foi agendado ou se a busca falhou;
+        nesse caso, o chamador deve fazer a requisição normalmente.
+        """
+        futuro = self._futuros.get(normalizar_nome(nome))
+        if futuro is None:
+            return None
+        try:
+            return futuro.result(timeout=timeout)
+        except Exception:  # pylint: disable=broad-exception-caught
+            # Erros são tratados pela requisição síncrona do chamador
+            return None
+
+    def cancelar(self) -> None:
+        """Cancela as buscas pendentes e descarta os resultados."""
+        for futuro in self._futuros.values():
+            futuro.cancel()
+        self._futuros.clear()
+
+    def close(self) -> None:
+        """Cancela o que estiver pendente e encerra o event loop de fundo."""
+        self.cancelar()
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._client.aclose(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
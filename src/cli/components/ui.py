@@ -6,7 +6,14 @@ Não contém nenhuma lógica de negócio ou de comunicação com a API.
 """
 
 import os
-from typing import List, Optional, Dict, Any
+import sys
+import time
+from typing import Iterable, List, Optional, Dict, Any
+
+# Linhas acumuladas antes de cada escrita no terminal (listagens em streaming)
+LINHAS_POR_ESCRITA = 500
+# Intervalo máximo (segundos) sem atualizar o terminal durante o streaming
+INTERVALO_ESCRITA = 0.1
 
 
 class MenuUI:
@@ -44,27 +51,54 @@ class MenuUI:
         input("\nPressione Enter para voltar ao menu principal.")
 
     @staticmethod
-    def display_restaurant_list(restaurants: list):
-        """Formata e exibe a lista de restaurantes."""
-        if not restaurants:
-            print("Nenhum restaurante cadastrado.")
-            return
-
-        print(
-            f'{"Nome do Restaurante".ljust(25)} | {"Categoria".ljust(25)} | {"Status"}'
-        )
+    def display_restaurant_list(restaurants: Iterable[Dict[str, Any]]) -> int:
+        """
+        Formata e exibe a lista de restaurantes, à medida que chegam.
+
+        A primeira linha é escrita assim que chega; as demais, em blocos (a
+        cada LINHAS_POR_ESCRITA linhas ou INTERVALO_ESCRITA segundos), em vez
+        de um 'print' por restaurante. Retorna a quantidade de restaurantes
+        exibidos.
+        """
+        buffer: List[str] = []
+        ultima_escrita = time.monotonic()
+        total = 0
         for r in restaurants:
+            if not total:
+                header = f'{"Nome do Restaurante".ljust(25)} | {"Categoria".ljust(25)}'
+                buffer.append(f"{header} | Status")
+            total += 1
             nome = r.get("nome", "N/A").ljust(25)
             categoria = r.get("categoria", "N/A").ljust(25)
             ativo = "Ativado" if r.get("ativo", False) else "Desativado"
-            print(f"- {nome} | {categoria} | {ativo}")
+            buffer.append(f"- {nome} | {categoria} | {ativo}")
+            agora = time.monotonic()
+            if (
+                total == 1
+                or len(buffer) >= LINHAS_POR_ESCRITA
+                or agora - ultima_escrita >= INTERVALO_ESCRITA
+            ):
+                sys.stdout.write("\n".join(buffer) + "\n")
+                sys.stdout.flush()
+                buffer.clear()
+                ultima_escrita = agora
+
+        if not total:
+            buffer.append("Nenhum restaurante cadastrado.")
+        if buffer:
+            sys.stdout.write("\n".join(buffer) + "\n")
+            sys.stdout.flush()
+        return total
 
     @staticmethod
-    def prompt_for_category(categories: List[str]) -> Optional[str]:
+    def prompt_for_category(
+        categories: List[str], counts: Optional[Dict[str, int]] = None
+    ) -> Optional[str]:
         """Exibe uma lista numerada de categorias e solicita a escolha do usuário."""
         print("\nSelecione uma categoria para ver os itens:")
         for i, category in enumerate(categories, 1):
-            print(f"  {i}. {category}")
+            quantidade = f" ({counts[category]} itens)" if counts else ""
+            print(f"  {i}. {category}{quantidade}")
 
         try:
             choice = int(input("\nEscolha uma opção: "))
@@ -96,3 +130,9 @@ class MenuUI:
         """Exibe uma mensagem de sucesso ou erro."""
         prefix = "[ERRO]" if is_error else "[SUCESSO]"
         print(f"\n{prefix} {message}")
+
+    @staticmethod
+    def display_cache_stats(stats: Dict[str, int], entradas: int):
+        """Exibe as estatísticas do cache do cliente (modo debug)."""
+        resumo = " | ".join(f"{chave}: {valor}" for chave, valor in stats.items())
+        print(f"\n[DEBUG] Cache ({entradas} entradas) -> {resumo}")
@@ -8,6 +8,7 @@ para criar e executar a aplicação de menu.
 from typing import Callable, Dict, List, Optional, Tuple
 
 from .components.api_client import ApiClient, ApiClientError
+from .components.prefetcher import MenuPrefetcher
 from .components.ui import MenuUI
 
 
@@ -23,8 +24,11 @@ class MenuApp:
 
     Option = Tuple[str, Callable[[], Optional[bool]]]
 
-    def __init__(self) -> None:
+    def __init__(self, debug: bool = False) -> None:
+        self.debug = debug
         self.api_client = ApiClient()
+        # Busca os cardápios em segundo plano enquanto o usuário escolhe
+        self.prefetcher = MenuPrefetcher(self.api_client.base_url)
         # mapping: tecla -> (descrição, handler)
         self.options: Dict[str, MenuApp.Option] = {
             "1": ("Listar restaurantes", self.handle_list_restaurants),
@@ -49,9 +53,12 @@ class MenuApp:
         return value
 
     def _get_restaurants(self) -> List[dict]:
-        """Obtém lista de restaurantes da API, garantindo lista como retorno."""
+        """
+        Obtém a listagem leve dos restaurantes (sem os cardápios), garantindo
+        lista como retorno.
+        """
         try:
-            restaurants = self.api_client.get_restaurants() or []
+            restaurants = list(self.api_client.export_restaurants("restaurantes"))
         except ApiClientError as e:
             MenuUI.display_message(str(e), is_error=True)
             return []
@@ -61,11 +68,11 @@ class MenuApp:
     def handle_list_restaurants(self) -> None:
         """Lida com a lógica de listar todos os restaurantes."""
         MenuUI.display_subtitle("Listando os restaurantes")
-        restaurants = self._get_restaurants()
-        if not restaurants:
-            MenuUI.display_message("Não há restaurantes cadastrados para exibir.")
-            return
-        MenuUI.display_restaurant_list(restaurants)
+        try:
+            # Exibe os restaurantes conforme chegam, sem esperar a lista completa
+            MenuUI.display_restaurant_list(self.api_client.export_restaurants())
+        except ApiClientError as e:
+            MenuUI.display_message(str(e), is_error=True)
 
     def handle_view_menu(self) -> None:
         """
@@ -79,6 +86,7 @@ class MenuApp:
                 raise MenuFlowError("Não há restaurantes cadastrados para exibir.")
 
             MenuUI.display_restaurant_list(restaurants)
+            self.prefetcher.prefetch(r["nome"] for r in restaurants if r.get("nome"))
 
             nome_restaurante = self._prompt_non_empty(
                 "\nDigite o nome do restaurante que deseja ver o cardápio: "
@@ -86,35 +94,27 @@ class MenuApp:
             if not nome_restaurante:
                 return
 
-            restaurant_details = self.api_client.get_restaurant_details(
-                nome_restaurante
-            )
-            if not restaurant_details:
-                raise MenuFlowError(
-                    f"Não foi possível obter os detalhes para o restaurante "
-                    f"'{nome_restaurante}'."
-                )
-
-            cardapio = restaurant_details.get("cardapio") or []
-            if not cardapio:
+            # Usa o resultado pré-carregado; se não houver, busca agora
+            categorias = self.prefetcher.obter(
+                nome_restaurante, timeout=self.api_client.timeout
+            ) or self.api_client.get_restaurant_categories(nome_restaurante)
+            if not categorias:
                 raise MenuFlowError("Este restaurante não possui itens no cardápio.")
 
-            available_categories = sorted(
-                {item.get("categoria") for item in cardapio if item.get("categoria")}
-            )
-            if not available_categories:
-                raise MenuFlowError("Não há categorias disponíveis neste cardápio.")
-
-            chosen_category = MenuUI.prompt_for_category(available_categories)
+            quantidades = {c["categoria"]: c["quantidade"] for c in categorias}
+            chosen_category = MenuUI.prompt_for_category(list(quantidades), quantidades)
             if not chosen_category:
                 raise MenuFlowError("Seleção de categoria inválida.")
 
-            items_to_display = [
-                item for item in cardapio if item.get("categoria") == chosen_category
-            ]
-            MenuUI.display_category_items(chosen_category, items_to_display)
+            # Só os itens da categoria escolhida são transferidos
+            items_to_display = self.api_client.get_menu_items(
+                nome_restaurante, chosen_category
+            )
+            MenuUI.display_category_items(chosen_category, items_to_display or [])
         except (ApiClientError, MenuFlowError) as e:
             MenuUI.display_message(str(e), is_error=True)
+        finally:
+            self.prefetcher.cancelar()
 
     def handle_register_restaurant(self) -> None:
         """Lida com a lógica de registrar um novo restaurante."""
@@ -163,6 +163,11 @@ class MenuApp:
         print("Obrigado por usar o Sabor Express! Até logo!\n")
         return False
 
+    def close(self) -> None:
+        """Libera as conexões e o pré-carregamento em segundo plano."""
+        self.prefetcher.close()
+        self.api_client.close()
+
     # ----- Loop principal -----
     def run(self) -> None:
         """Executa o loop principal do menu."""
@@ -185,6 +190,10 @@ class MenuApp:
                 except ApiClientError as e:
                     MenuUI.display_message(str(e), is_error=True)
 
+                if self.debug:
+                    MenuUI.display_cache_stats(
+                        self.api_client.cache.stats, len(self.api_client.cache)
+                    )
                 if running:
                     MenuUI.prompt_return_to_menu()
             else:
@@ -195,10 +204,13 @@ class MenuApp:
 # --- Ponto de Entrada ---
 
 
-def main() -> None:
+def main(debug: bool = False) -> None:
     """Função principal que inicia a aplicação do menu."""
-    app = MenuApp()
-    app.run()
+    app = MenuApp(debug=debug)
+    try:
+        app.run()
+    finally:
+        app.close()
 
 
 if __name__ == "__main__":
@@ -1,7 +1,8 @@
 """Módulo para centralizar as configurações da aplicação."""
 
 from pathlib import Path
-from pydantic import computed_field
+from typing import Literal, Optional
+from pydantic import Field, computed_field
 from pydantic_settings import BaseSettings
 
 
@@ -18,6 +19,28 @@ class Settings(BaseSettings):
     # .parents[2] -> Sobe 2 níveis na hierarquia de pastas
     PROJECT_ROOT: Path = Path(__file__).resolve().parents[2]
 
+    # Grava os cardápios em JSON compacto (sem indentação) no 'fetch-data'.
+    DATA_COMPACT_JSON: bool = False
+
+    # Classificador dos itens do cardápio: regras por palavra-chave ('regras')
+    # ou o modelo Naive Bayes treinado ('modelo', requer numpy).
+    CLASSIFIER_ENGINE: Literal["regras", "modelo"] = "regras"
+    # Arquivo do modelo; por padrão o distribuído em 'src/utils/modelos'.
+    CLASSIFIER_MODEL_FILE: Optional[Path] = None
+
+    # --- Profiling sob demanda (desligado por padrão) ---
+    # Token esperado no cabeçalho 'X-Profile' para perfilar uma requisição.
+    PROFILING_TOKEN: Optional[str] = None
+    # Fração das requisições perfiladas por amostragem (0.0 = nenhuma).
+    PROFILING_SAMPLE_RATE: float = Field(default=0.0, ge=0.0, le=1.0)
+    # Tempo máximo (s) de um perfil: o corpo da resposta é perfilado até o
+    # fim do envio, mas fluxos longos (ex: SSE) param de ser perfilados aqui.
+    PROFILING_MAX_SECONDS: float = Field(default=30.0, gt=0.0)
+    # Perfila o carregamento inicial dos dados (ver 'run-api --profile-startup').
+    PROFILE_STARTUP: bool = False
+    # Diretório de saída dos perfis; por padrão '<raiz>/profiles'.
+    PROFILE_DIR: Optional[Path] = None
+
     @computed_field
     @property
     def DATA_DIR(self) -> Path:
@@ -35,6 +58,35 @@ class Settings(BaseSettings):
         """Aponta para o arquivo de metadados dos restaurantes."""
         return self.PROJECT_ROOT / "data" / "restaurants_metadata.json"
 
+    @computed_field
+    @property
+    def MANIFEST_FILE(self) -> Path:
+        """Manifesto (hash, itens, tamanho) dos arquivos de cardápio."""
+        return self.PROJECT_ROOT / "data" / "restaurants_manifest.json"
+
+    @computed_field
+    @property
+    def FETCH_STATE_FILE(self) -> Path:
+        """Validadores HTTP (ETag/Last-Modified) da última busca dos dados."""
+        return self.PROJECT_ROOT / "data" / ".fetch_state.json"
+
+    @computed_field
+    @property
+    def MENU_CACHE_DIR(self) -> Path:
+        """Cardápios já classificados, por hash do arquivo (ver 'data_reader')."""
+        return self.PROJECT_ROOT / "data" / ".cache_cardapios"
+
+    @computed_field
+    @property
+    def PROFILING_DIR(self) -> Path:
+        """Diretório onde os perfis (.prof, formato pstats) são gravados."""
+        return self.PROFILE_DIR or self.PROJECT_ROOT / "profiles"
+
+    @property
+    def profiling_habilitado(self) -> bool:
+        """Indica se o profiling por requisição foi configurado."""
+        return bool(self.PROFILING_TOKEN) or self.PROFILING_SAMPLE_RATE > 0
+
 
 # Instância única das configurações para ser usada em toda a aplicação
 settings = Settings()
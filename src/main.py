@@ -4,28 +4,79 @@ Ponto de entrada principal da aplicação Sabor Express.
 Este módulo utiliza Typer para criar uma Interface de Linha de Comando (CLI)
 que gerencia a execução dos diferentes componentes do sistema, como
 iniciar o servidor da API.
+
+Os módulos de cada comando são importados dentro do próprio comando, para
+que cada subcomando (e o '--help') carregue apenas o que de fato usa:
+'run-cli' não paga pela pilha do servidor, nem 'run-api' pela da CLI.
 """
 
+# pylint: disable=import-outside-toplevel
+import json
+import os
+import sys
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Optional
 import typer
-import uvicorn
-from cli import menu as cli_menu
-from utils.data_fetcher import process_and_save_restaurants
 
 # Cria uma instância do Typer app. É o nosso orquestrador de comandos.
-cli_app = typer.Typer()
+# Sem formatação 'rich' na ajuda: só carregá-la custava ~100 ms por chamada.
+cli_app = typer.Typer(rich_markup_mode=None)
 
 
 @cli_app.command()
-def fetch_data():
+def fetch_data(
+    compacto: Optional[bool] = typer.Option(
+        None,
+        "--compacto/--indentado",
+        help="Formato dos arquivos salvos (padrão: 'DATA_COMPACT_JSON').",
+    ),
+):
     """
     Busca os dados de restaurantes da fonte original na internet
     e salva-os localmente na pasta 'data/restaurants'.
     """
+    from utils.data_fetcher import process_and_save_restaurants
+
     typer.echo("Iniciando a busca e salvamento dos dados dos restaurantes...")
-    process_and_save_restaurants()
+    process_and_save_restaurants(compacto=compacto)
     typer.echo("Operação concluída.")
 
 
+@cli_app.command()
+def train_classifier(
+    rotulos: Optional[Path] = typer.Option(
+        None, help="CSV rotulado (padrão: 'data/rotulos_classificador.csv')."
+    ),
+    saida: Optional[Path] = typer.Option(
+        None, help="Arquivo do modelo (padrão: o distribuído em 'src/utils/modelos')."
+    ),
+    dimensao: int = typer.Option(2**14, help="Tamanho do vetor de atributos."),
+    alfa: float = typer.Option(0.1, help="Suavização do Naive Bayes."),
+):
+    """
+    Treina o classificador estatístico de itens (Naive Bayes) a partir de um
+    CSV com as colunas 'item' e 'categoria' e grava o modelo.
+    """
+    from core.config import settings
+    from utils.classifier_model import (
+        MODELO_PADRAO,
+        NaiveBayesClassifier,
+        ler_rotulos,
+        validacao_cruzada,
+    )
+
+    rotulos = rotulos or settings.PROJECT_ROOT / "data" / "rotulos_classificador.csv"
+    saida = saida or MODELO_PADRAO
+    nomes, categorias = ler_rotulos(rotulos)
+    acuracia = validacao_cruzada(nomes, categorias, dimensao=dimensao, alfa=alfa)
+    typer.echo(f"{len(nomes)} exemplos; acurácia (validação cruzada): {acuracia:.1%}")
+
+    NaiveBayesClassifier.treinar(nomes, categorias, dimensao, alfa).salvar(saida)
+    typer.echo(f"Modelo salvo em {saida} ({saida.stat().st_size / 1024:.0f} KiB).")
+
+
 @cli_app.command()
 def run_api(
     host: str = typer.Option("127.0.0.1", help="O endereço do host para expor a API."),
@@ -33,22 +84,276 @@ def run_api(
     reload: bool = typer.Option(
         True, help="Habilita o recarregamento automático ao detectar mudanças."
     ),
+    profile_startup: bool = typer.Option(
+        False,
+        "--profile-startup",
+        help="Perfila o carregamento inicial dos dados (grava um arquivo .prof).",
+    ),
 ):
     """
     Inicia o servidor da API Sabor Express usando Uvicorn.
     """
+    import uvicorn
+
+    if profile_startup:
+        # Repassado via ambiente para que também valha no processo do --reload
+        os.environ["PROFILE_STARTUP"] = "1"
     typer.echo(f"Iniciando a API Sabor Express em http://{host}:{port}")
     # A string para uvicorn agora deve refletir o novo local do router
     uvicorn.run("api.router:app", host=host, port=port, reload=reload)
 
 
 @cli_app.command()
-def run_cli():
+def run_cli(
+    debug: bool = typer.Option(
+        False, help="Exibe as estatísticas do cache do cliente após cada ação."
+    ),
+):
     """
     Inicia a interface de linha de comando interativa (o menu).
     """
+    from cli import menu as cli_menu
+
     typer.echo("Iniciando o menu interativo do Sabor Express...")
-    cli_menu.main()
+    cli_menu.main(debug=debug)
+
+
+@cli_app.command()
+def loadtest(
+    url: str = typer.Option(
+        "http://127.0.0.1:8000/api", help="URL base da API em execução."
+    ),
+    concorrencia: int = typer.Option(50, help="Quantidade de clientes simultâneos."),
+    duracao: float = typer.Option(10.0, help="Duração do teste em segundos."),
+    mix: str = typer.Option(
+        "listar=50,filtrar=20,detalhe=20,toggle=5,criar=5",
+        help="Mistura de requisições no formato 'operacao=peso,...'.",
+    ),
+    timeout: float = typer.Option(10.0, help="Timeout por requisição em segundos."),
+    saida: Optional[Path] = typer.Option(
+        None, help="Grava o relatório em JSON neste arquivo."
+    ),
+    json_output: bool = typer.Option(
+        False, "--json", help="Imprime apenas o relatório em JSON."
+    ),
+):
+    """
+    Executa um teste de carga concorrente contra uma API em execução.
+    """
+    from utils.load_tester import LoadTestError, parse_mix, run_load_test
+
+    try:
+        relatorio = run_load_test(
+            url, parse_mix(mix), concorrencia, duracao, timeout=timeout
+        )
+    except LoadTestError as e:
+        typer.echo(f"[ERRO] {e}", err=True)
+        raise typer.Exit(code=1) from e
+
+    if saida:
+        with open(saida, "w", encoding="utf-8") as arquivo:
+            json.dump(relatorio, arquivo, indent=2, ensure_ascii=False)
+    if json_output:
+        typer.echo(json.dumps(relatorio, ensure_ascii=False))
+        return
+
+    lat = relatorio["latencia"]
+    typer.echo(
+        f"{relatorio['requisicoes']} requisições em {relatorio['duracao_s']:.1f}s "
+        f"({relatorio['vazao_rps']:.1f} req/s), {relatorio['erros']} erros"
+    )
+    typer.echo(
+        f"Latência: p50={lat['p50_ms']:.1f}ms p95={lat['p95_ms']:.1f}ms "
+        f"p99={lat['p99_ms']:.1f}ms max={lat['max_ms']:.1f}ms"
+    )
+    for operacao, dados in relatorio["por_operacao"].items():
+        typer.echo(
+            f"  - {operacao.ljust(8)} {dados['requisicoes']:>7} req | "
+            f"p50={dados['p50_ms']:.1f}ms p99={dados['p99_ms']:.1f}ms"
+        )
+    for erro, quantidade in relatorio["detalhe_erros"].items():
+        typer.echo(f"  [ERRO] {erro}: {quantidade}")
+
+
+# ===================================================================
+#  Comandos não interativos (saída em JSON, próprios para scripts)
+# ===================================================================
+API_URL_OPTION = typer.Option(
+    "http://127.0.0.1:8000/api", "--url", help="URL base da API em execução."
+)
+
+
+def _executar_e_imprimir(base_url: str, op: dict, ndjson: bool = False) -> None:
+    """Executa uma operação, imprime o resultado em JSON e trata os erros."""
+    from cli import batch as cli_batch
+    from cli.components.api_client import ApiClientError
+
+    with cli_batch.criar_cliente(base_url) as client:
+        try:
+            resultado: Any = cli_batch.executar_operacao(client, op)
+        except ApiClientError as e:
+            typer.echo(json.dumps({"erro": str(e)}, ensure_ascii=False), err=True)
+            raise typer.Exit(code=1) from e
+
+    if ndjson and isinstance(resultado, list):
+        for registro in resultado:
+            typer.echo(json.dumps(registro, ensure_ascii=False))
+    else:
+        typer.echo(json.dumps(resultado, ensure_ascii=False))
+
+
+@cli_app.command("list")
+def list_restaurants(
+    url: str = API_URL_OPTION,
+    ndjson: bool = typer.Option(False, help="Um restaurante por linha (NDJSON)."),
+):
+    """Lista os restaurantes em JSON."""
+    _executar_e_imprimir(url, {"op": "list"}, ndjson)
+
+
+@cli_app.command()
+def show(nome: str, url: str = API_URL_OPTION):
+    """Mostra um restaurante (com o cardápio) em JSON."""
+    _executar_e_imprimir(url, {"op": "show", "nome": nome})
+
+
+@cli_app.command()
+def toggle(nome: str, url: str = API_URL_OPTION):
+    """Ativa/desativa um restaurante e mostra o resultado em JSON."""
+    _executar_e_imprimir(url, {"op": "toggle", "nome": nome})
+
+
+@cli_app.command()
+def create(nome: str, categoria: str, url: str = API_URL_OPTION):
+    """Cadastra um restaurante e mostra o resultado em JSON."""
+    _executar_e_imprimir(url, {"op": "create", "nome": nome, "categoria": categoria})
+
+
+@cli_app.command()
+def autocomplete(
+    prefixo: str,
+    tipo: Optional[str] = typer.Option(None, help="Só 'restaurante' ou 'item'."),
+    limite: int = typer.Option(10, help="Quantidade máxima de sugestões."),
+    url: str = API_URL_OPTION,
+):
+    """Sugere nomes de restaurantes e itens que começam com o prefixo, em JSON."""
+    op = {"op": "autocomplete", "q": prefixo, "tipo": tipo, "limite": limite}
+    _executar_e_imprimir(url, op)
+
+
+@cli_app.command()
+def export(
+    url: str = API_URL_OPTION,
+    nivel: str = typer.Option(
+        "restaurantes", help="Uma linha por: restaurantes, completo ou itens."
+    ),
+    categoria: Optional[str] = typer.Option(None, help="Filtra pela categoria."),
+    ativo: Optional[bool] = typer.Option(None, help="Filtra pelo status."),
+):
+    """
+    Exporta o catálogo em NDJSON (streaming): as linhas são repassadas para a
+    saída padrão conforme chegam, sem carregar a resposta inteira na memória.
+    """
+    from cli import batch as cli_batch
+    from cli.components.api_client import ApiClientError
+
+    filtros = {
+        chave: valor
+        for chave, valor in {"categoria": categoria, "ativo": ativo}.items()
+        if valor is not None
+    }
+    saida = sys.stdout.buffer
+    with cli_batch.criar_cliente(url) as client:
+        try:
+            for bloco in client.export_restaurants_raw(nivel, filtros):
+                saida.write(bloco)
+        except ApiClientError as e:
+            typer.echo(json.dumps({"erro": str(e)}, ensure_ascii=False), err=True)
+            raise typer.Exit(code=1) from e
+    saida.flush()
+
+
+@cli_app.command()
+def ingest(
+    nome: str,
+    arquivo: Optional[Path] = typer.Option(
+        None, help="Arquivo NDJSON com os itens (padrão: a entrada padrão)."
+    ),
+    url: str = API_URL_OPTION,
+):
+    """
+    Inclui itens no cardápio de um restaurante a partir de NDJSON (um item
+    por linha, ex: {"item": "Big Mac", "price": 25.9}), enviado em streaming.
+    Imprime o resumo em JSON, com as linhas rejeitadas.
+    """
+    from cli import batch as cli_batch
+    from cli.components.api_client import TAMANHO_BLOCO_STREAM, ApiClientError
+
+    # A entrada padrão não é fechada ao final, só o arquivo aberto aqui
+    with (
+        open(arquivo, "rb") if arquivo else nullcontext(sys.stdin.buffer) as entrada,
+        cli_batch.criar_cliente(url) as client,
+    ):
+        blocos = iter(lambda: entrada.read(TAMANHO_BLOCO_STREAM), b"")
+        try:
+            resultado = client.ingest_menu_items(nome, blocos)
+        except ApiClientError as e:
+            typer.echo(json.dumps({"erro": str(e)}, ensure_ascii=False), err=True)
+            raise typer.Exit(code=1) from e
+    typer.echo(json.dumps(resultado, ensure_ascii=False))
+
+
+@cli_app.command()
+def watch(
+    url: str = API_URL_OPTION,
+    ultimo_id: Optional[int] = typer.Option(
+        None, help="Retoma a partir deste evento (padrão: só eventos novos)."
+    ),
+):
+    """
+    Acompanha as alterações do catálogo em tempo real (Server-Sent Events),
+    imprimindo um evento JSON por linha. Reconecta sozinho se a conexão cair.
+    """
+    from cli import batch as cli_batch
+
+    with cli_batch.criar_cliente(url) as client:
+        try:
+            for evento in client.watch_events(ultimo_id):
+                typer.echo(json.dumps(evento, ensure_ascii=False))
+        except KeyboardInterrupt:
+            pass
+
+
+@cli_app.command()
+def batch(
+    url: str = API_URL_OPTION,
+    paralelismo: int = typer.Option(
+        8, help="Quantidade de operações executadas ao mesmo tempo."
+    ),
+    resumo: bool = typer.Option(True, help="Imprime vazão e erros no stderr ao final."),
+):
+    """
+    Lê operações em NDJSON da entrada padrão e imprime um resultado NDJSON
+    por operação, na mesma ordem. Ex: {"op": "show", "nome": "KFC"}
+    """
+    from cli import batch as cli_batch
+
+    total = erros = 0
+    inicio = time.perf_counter()
+    for resultado in cli_batch.executar_lote(sys.stdin, url, paralelismo):
+        total += 1
+        erros += not resultado["ok"]
+        typer.echo(json.dumps(resultado, ensure_ascii=False))
+
+    duracao = time.perf_counter() - inicio
+    if resumo:
+        typer.echo(
+            f"{total} operações em {duracao:.2f}s "
+            f"({total / duracao if duracao else 0:.1f} ops/s), {erros} erros",
+            err=True,
+        )
+    if erros:
+        raise typer.Exit(code=1)
 
 
 # Este é o ponto de entrada quando o script é executado diretamente.
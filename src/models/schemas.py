@@ -1,7 +1,7 @@
 """Módulo de schemas Pydantic para validação e modelagem de dados."""
 
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class Avaliacao(BaseModel):
@@ -26,6 +26,13 @@ class ItemCardapio(BaseModel):
         populate_by_name = True
 
 
+class CategoriaCardapio(BaseModel):
+    """Schema para uma categoria do cardápio e sua quantidade de itens."""
+
+    categoria: str
+    quantidade: int
+
+
 class Restaurante(BaseModel):
     """Schema principal para um restaurante."""
 
@@ -35,6 +42,42 @@ class Restaurante(BaseModel):
     cardapio: List[ItemCardapio] = []
     avaliacoes: List[Avaliacao] = []
 
+    # Itens agrupados por categoria; não faz parte do JSON do restaurante.
+    _itens_por_categoria: Optional[Dict[str, List[ItemCardapio]]] = PrivateAttr(
+        default=None
+    )
+
+    def indexar_categorias(self) -> None:
+        """(Re)calcula os itens do cardápio agrupados por categoria."""
+        grupos: Dict[str, List[ItemCardapio]] = {}
+        for item in self.cardapio:
+            grupos.setdefault(item.categoria, []).append(item)
+        self._itens_por_categoria = dict(sorted(grupos.items()))
+
+    def adicionar_itens(self, itens: List[ItemCardapio]) -> None:
+        """
+        Acrescenta itens ao cardápio mantendo o agrupamento por categoria
+        (sem reagrupar o cardápio inteiro a cada lote de uma ingestão).
+        """
+        self.cardapio.extend(itens)
+        grupos = self._itens_por_categoria
+        if grupos is None:
+            return  # Agrupado sob demanda em 'itens_por_categoria'
+        novas = {item.categoria for item in itens} - grupos.keys()
+        if novas:
+            # Dicionário novo: quem já está percorrendo o atual não é afetado
+            grupos = dict(sorted({**grupos, **{c: [] for c in novas}}.items()))
+        for item in itens:
+            grupos[item.categoria].append(item)
+        self._itens_por_categoria = grupos
+
+    @property
+    def itens_por_categoria(self) -> Dict[str, List[ItemCardapio]]:
+        """Itens do cardápio agrupados por categoria (em ordem alfabética)."""
+        if self._itens_por_categoria is None:
+            self.indexar_categorias()
+        return self._itens_por_categoria
+
     @property
     def media_avaliacoes(self) -> float:
         """Calcula a média das avaliações do restaurante."""
@@ -42,3 +85,39 @@ class Restaurante(BaseModel):
             return 0.0
         total_notas = sum(avaliacao.nota for avaliacao in self.avaliacoes)
         return round(total_notas / len(self.avaliacoes), 1)
+
+
+class AlteracoesCatalogo(BaseModel):
+    """Schema da sincronização incremental do catálogo."""
+
+    versao: int
+    # True quando a versão pedida não é mais coberta: recarregar tudo
+    resync: bool = False
+    alterados: List[Restaurante] = []
+    removidos: List[str] = []
+
+
+class SugestoesAutocomplete(BaseModel):
+    """Sugestões de '/api/autocomplete', das mais relevantes às menos."""
+
+    restaurantes: List[str] = []
+    itens: List[str] = []
+
+
+class ErroIngestao(BaseModel):
+    """Uma linha rejeitada na ingestão de um cardápio em NDJSON."""
+
+    linha: int
+    erro: str
+
+
+class ResultadoIngestao(BaseModel):
+    """Resumo da ingestão de itens de cardápio em NDJSON."""
+
+    restaurante: str
+    recebidos: int
+    incluidos: int
+    rejeitados: int
+    # Só as primeiras linhas rejeitadas são detalhadas
+    erros: List[ErroIngestao] = []
+    versao: Optional[int] = None
@@ -0,0 +1,225 @@
+"""
+Módulo de Autocompletar (typeahead) por prefixo.
+
+Cada 'IndiceAutocomplete' guarda os nomes normalizados (sem acentos e sem
+diferenciar maiúsculas) num array ordenado: os nomes que começam com um
+prefixo ocupam uma faixa contínua, encontrada com 'bisect'.
+
+Para que toda consulta tenha custo limitado, os nós de uma trie compacta
+(implícita no array ordenado) cuja faixa tem mais de 'LIMIAR_FAIXA' nomes
+guardam as 'K_MAXIMO' melhores sugestões já calculadas. As demais faixas
+são pequenas por definição, e as melhores são escolhidas na hora.
+
+O 'AutocompleteCatalogo' reúne os índices de restaurantes e de itens do
+cardápio usados por '/api/autocomplete'.
+"""
+
+import heapq
+import threading
+import unicodedata
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+
+from models.schemas import Restaurante
+
+# Quantidade máxima de sugestões por consulta (pré-calculadas por nó)
+K_MAXIMO = 10
+# Faixas maiores que isto têm as melhores sugestões pré-calculadas
+LIMIAR_FAIXA = 128
+# Caractere maior que qualquer outro: fecha a faixa de um prefixo
+_FIM = "\U0010ffff"
+
+
+def normalizar(texto: str) -> str:
+    """Minúsculas, sem acentos e com espaços simples ('Café  X' -> 'cafe x')."""
+    if not texto.isascii():
+        decomposto = unicodedata.normalize("NFKD", texto)
+        texto = "".join(c for c in decomposto if not unicodedata.combining(c))
+    return " ".join(texto.casefold().split())
+
+
+def _prefixo_comum(a: str, b: str) -> int:
+    """Tamanho do maior prefixo comum entre 'a' e 'b'."""
+    # Busca binária comparando fatias (em C), em vez de caractere a caractere
+    baixo, alto = 0, min(len(a), len(b))
+    while baixo < alto:
+        meio = (baixo + alto + 1) // 2
+        if a[:meio] == b[:meio]:
+            baixo = meio
+        else:
+            alto = meio - 1
+    return baixo
+
+
+class IndiceAutocomplete:
+    """Sugestões por prefixo, ordenadas por peso (ex: frequência do nome)."""
+
+    def __init__(self, nomes: Iterable[Tuple[str, int]] = ()) -> None:
+        """
+        Args:
+            nomes: Pares (nome, peso); nomes que normalizam igual têm os
+                pesos somados e são exibidos na primeira grafia vista.
+        """
+        self._exibicao: Dict[str, str] = {}
+        self._peso: Dict[str, int] = {}
+        for nome, peso in nomes:
+            chave = normalizar(nome)
+            if chave:
+                self._exibicao.setdefault(chave, nome)
+                self._peso[chave] = self._peso.get(chave, 0) + peso
+        self._chaves: List[str] = sorted(self._peso)
+        # Prefixo completo de um nó -> suas melhores chaves (só nós grandes)
+        self._melhores: Dict[str, Tuple[str, ...]] = {}
+        self._precalcular()
+
+    def __len__(self) -> int:
+        return len(self._chaves)
+
+    def _ordem(self, chave: str) -> Tuple[int, str]:
+        # Maior peso primeiro; empate em ordem alfabética
+        return (-self._peso[chave], chave)
+
+    def _faixa(self, prefixo: str) -> Tuple[int, int]:
+        inicio = bisect_left(self._chaves, prefixo)
+        return inicio, bisect_left(self._chaves, prefixo + _FIM, inicio)
+
+    def _no(self, inicio: int, fim: int) -> str:
+        """Prefixo do nó da trie que cobre exatamente a faixa (não vazia)."""
+        primeira, ultima = self._chaves[inicio], self._chaves[fim - 1]
+        return primeira[: _prefixo_comum(primeira, ultima)]
+
+    def _calcular(self, inicio: int, fim: int) -> Tuple[str, ...]:
+        return tuple(
+            heapq.nsmallest(K_MAXIMO, self._chaves[inicio:fim], key=self._ordem)
+        )
+
+    def _precalcular(self) -> None:
+        """
+        Percorre os nomes em ordem, como uma busca em profundidade na trie
+        compacta: os nós são os pontos onde nomes vizinhos divergem (o maior
+        prefixo comum entre eles). Cada nó aberto acumula as K melhores da
+        sua faixa; ao fechar, repassa-as ao pai e, se a faixa passou de
+        'LIMIAR_FAIXA', elas são guardadas.
+        """
+        # Itens (peso, -posição): no heap de mínimo, o pior fica no topo
+        pilha: List[Tuple[int, int, List[Tuple[int, int]]]] = [(0, 0, [])]
+
+        def fechar(profundidade: int, inicio: int, heap, fim: int) -> None:
+            if fim - inicio > LIMIAR_FAIXA:
+                prefixo = self._chaves[inicio][:profundidade]
+                self._melhores[prefixo] = tuple(
+                    self._chaves[-posicao] for _, posicao in sorted(heap, reverse=True)
+                )
+
+        anterior = ""
+        for posicao, chave in enumerate(self._chaves):
+            comum = _prefixo_comum(anterior, chave)
+            filho = None
+            while pilha[-1][0] > comum:
+                filho = pilha.pop()
+                fechar(*filho, posicao)
+                if pilha[-1][0] >= comum:
+                    for item in filho[2]:
+                        self._empilhar(pilha[-1][2], item)
+            if filho is not None and pilha[-1][0] < comum:
+                # Ponto de divergência novo: herda a faixa e as melhores do filho
+                pilha.append((comum, filho[1], filho[2]))
+            pilha.append((len(chave), posicao, [(self._peso[chave], -posicao)]))
+            anterior = chave
+
+        while pilha:
+            profundidade, inicio, heap = pilha.pop()
+            fechar(profundidade, inicio, heap, len(self._chaves))
+            if pilha:
+                for item in heap:
+                    self._empilhar(pilha[-1][2], item)
+
+    @staticmethod
+    def _empilhar(heap: List[Tuple[int, int]], item: Tuple[int, int]) -> None:
+        if len(heap) < K_MAXIMO:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            heapq.heapreplace(heap, item)
+
+    def sugerir(self, prefixo: str, limite: int = K_MAXIMO) -> List[str]:
+        """As 'limite' melhores sugestões para 'prefixo', na grafia original."""
+        chave = normalizar(prefixo)
+        if chave and prefixo[-1:].isspace():
+            # 'pizza ' sugere 'Pizza Hut', mas não 'Pizzaria'
+            chave += " "
+        inicio, fim = self._faixa(chave)
+        if fim - inicio <= LIMIAR_FAIXA:
+            melhores = self._calcular(inicio, fim)
+        else:
+            no = self._no(inicio, fim)
+            melhores = self._melhores.get(no)
+            if melhores is None:
+                # Nó criado por 'adicionar' depois da construção
+                melhores = self._melhores[no] = self._calcular(inicio, fim)
+        return [self._exibicao[chave] for chave in melhores[:limite]]
+
+    def adicionar(self, nome: str, peso: int = 1) -> None:
+        """Inclui um nome (ou soma 'peso' a um já existente)."""
+        chave = normalizar(nome)
+        if not chave:
+            return
+        if chave in self._peso:
+            self._peso[chave] += peso
+        else:
+            self._exibicao[chave] = nome
+            self._peso[chave] = peso
+            insort(self._chaves, chave)
+        # Os nós guardados no caminho da chave passam a considerá-la
+        for tamanho in range(len(chave) + 1):
+            atuais = self._melhores.get(chave[:tamanho])
+            if atuais is not None:
+                candidatas = set(atuais)
+                candidatas.add(chave)
+                self._melhores[chave[:tamanho]] = tuple(
+                    sorted(candidatas, key=self._ordem)[:K_MAXIMO]
+                )
+
+
+class AutocompleteCatalogo:
+    """
+    Índices dos nomes de restaurantes (os de cardápio maior primeiro) e dos
+    nomes de itens (os presentes em mais cardápios primeiro).
+    """
+
+    def __init__(self) -> None:
+        self.restaurantes = IndiceAutocomplete()
+        self.itens = IndiceAutocomplete()
+        # Só as alterações são serializadas; as consultas não bloqueiam
+        self._lock = threading.Lock()
+
+    def construir(self, restaurantes: Iterable[Restaurante]) -> None:
+        """Reconstrói os dois índices a partir do catálogo carregado."""
+        nomes: List[Tuple[str, int]] = []
+        itens: Counter = Counter()
+        for restaurante in restaurantes:
+            nomes.append((restaurante.nome, len(restaurante.cardapio)))
+            itens.update({item.item for item in restaurante.cardapio})
+        indice_restaurantes = IndiceAutocomplete(nomes)
+        indice_itens = IndiceAutocomplete(itens.items())
+        with self._lock:
+            self.restaurantes, self.itens = indice_restaurantes, indice_itens
+
+    def adicionar_restaurante(self, restaurante: Restaurante) -> None:
+        """Inclui um restaurante cadastrado depois da carga (e seus itens)."""
+        with self._lock:
+            self.restaurantes.adicionar(restaurante.nome, len(restaurante.cardapio))
+            for nome in {item.item for item in restaurante.cardapio}:
+                self.itens.adicionar(nome)
+
+    def adicionar_itens(
+        self, nome_restaurante: str, quantidade: int, nomes_novos: Iterable[str]
+    ) -> None:
+        """
+        Registra 'quantidade' itens incluídos no cardápio de um restaurante;
+        'nomes_novos' são os nomes que o cardápio ainda não tinha.
+        """
+        with self._lock:
+            self.restaurantes.adicionar(nome_restaurante, quantidade)
+            for nome in nomes_novos:
+                self.itens.adicionar(nome)
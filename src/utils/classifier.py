@@ -3,8 +3,17 @@ Módulo de Classificação de Itens de Cardápio.
 
 Responsável por analisar o nome de um item e atribuir-lhe uma categoria
 com base em um conjunto de regras e palavras-chave.
+
+'classificar_lote' usa o motor configurado em 'settings.CLASSIFIER_ENGINE':
+as regras abaixo ou o modelo estatístico de 'utils.classifier_model'.
 """
 
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Sequence
+from core.config import settings
+
 # Usar sets para uma busca de palavras-chavede forma mais eficiente
 CATEGORIAS = {
     "BEBIDA": {
@@ -123,3 +132,55 @@ def classify_item(item_name: str) -> str:
             return categoria
 
     return "OUTROS"
+
+
+@lru_cache(maxsize=4)
+def _carregar_modelo(caminho: Optional[Path]):
+    """Carrega (uma única vez por arquivo) o modelo estatístico."""
+    # Importado aqui: o numpy só é necessário com o motor 'modelo'
+    from utils.classifier_model import (  # pylint: disable=import-outside-toplevel
+        MODELO_PADRAO,
+        NaiveBayesClassifier,
+    )
+
+    return NaiveBayesClassifier.carregar(caminho or MODELO_PADRAO)
+
+
+@lru_cache(maxsize=4)
+def _versao_arquivo(caminho: Optional[Path]) -> str:
+    if caminho is None:
+        from utils.classifier_model import (  # pylint: disable=import-outside-toplevel
+            MODELO_PADRAO,
+        )
+
+        caminho = MODELO_PADRAO
+    return hashlib.sha256(caminho.read_bytes()).hexdigest()
+
+
+def versao_classificador() -> str:
+    """
+    Identifica o motor configurado e suas regras (ou o arquivo do modelo):
+    muda sempre que a mesma entrada puder receber outra categoria.
+    """
+    if settings.CLASSIFIER_ENGINE == "modelo":
+        base = "modelo:" + _versao_arquivo(settings.CLASSIFIER_MODEL_FILE)
+    else:
+        regras = [(c, sorted(palavras)) for c, palavras in CATEGORIAS.items()]
+        base = "regras:" + repr(regras)
+    return hashlib.sha256(base.encode("utf-8")).hexdigest()[:16]
+
+
+def classificar_lote(nomes: Sequence[Optional[str]]) -> List[str]:
+    """
+    Classifica vários itens de uma vez com o motor configurado.
+
+    Args:
+        nomes: Os nomes dos itens a serem classificados.
+
+    Returns:
+        A categoria de cada item, na mesma ordem.
+    """
+    if settings.CLASSIFIER_ENGINE == "modelo":
+        modelo = _carregar_modelo(settings.CLASSIFIER_MODEL_FILE)
+        return modelo.predict(nome or "" for nome in nomes)
+    return [classify_item(nome) for nome in nomes]
@@ -0,0 +1,225 @@
+"""
+Módulo do Classificador Estatístico de Itens de Cardápio.
+
+Alternativa às regras por palavra-chave de 'utils.classifier': um modelo
+Naive Bayes multinomial (NumPy) sobre atributos com hashing:
+- palavras do nome;
+- pares de palavras consecutivas (bigramas);
+- n-gramas de caracteres de cada palavra (ex: 'mcnuggets' -> 'nug').
+
+O modelo é treinado offline a partir de um CSV rotulado (ver
+'sabor-express train-classifier') e salvo num arquivo '.npz' pequeno.
+A classificação é feita em lote com 'predict(nomes)'.
+
+Requer 'numpy' (dependência opcional, extra 'modelo').
+"""
+
+import csv
+import re
+import zlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+# Categoria atribuída a nomes vazios (mesmo comportamento de 'classify_item')
+CATEGORIA_PADRAO = "OUTROS"
+# Quantidade de posições do vetor de atributos (potência de 2)
+DIMENSAO_PADRAO = 2**14
+# Tamanho dos n-gramas de caracteres extraídos de cada palavra
+TAMANHO_NGRAMA = 4
+# Nomes classificados por vez em 'predict' (limita a memória temporária)
+TAMANHO_LOTE = 20_000
+# Modelo distribuído junto com o código
+MODELO_PADRAO = Path(__file__).resolve().parent / "modelos" / "classificador_nb.npz"
+
+_PALAVRA = re.compile(r"[^\W_]+")
+# Remove tamanho/variação do nome ("Coca-Cola, Large", "Latte (Small)")
+_VARIACAO = re.compile(
+    r"\(.*?\)|[,–].*$|\b(small|medium|large|junior|child|family|kids)\b"
+)
+
+
+def _hash(atributo: str) -> int:
+    """Hash estável (independente de PYTHONHASHSEED) de um atributo."""
+    return zlib.crc32(atributo.encode("utf-8"))
+
+
+@lru_cache(maxsize=200_000)
+def _atributos_palavra(palavra: str, dimensao: int) -> Tuple[int, Tuple[int, ...]]:
+    """Hash da palavra e índices da palavra e dos seus n-gramas de caracteres."""
+    mascara = dimensao - 1
+    marcada = f"<{palavra}>"
+    ngramas = {
+        marcada[i : i + TAMANHO_NGRAMA]
+        for i in range(max(1, len(marcada) - TAMANHO_NGRAMA + 1))
+    }
+    codigo = _hash("p:" + palavra)
+    return codigo, (codigo & mascara,) + tuple(
+        _hash("c:" + ngrama) & mascara for ngrama in ngramas
+    )
+
+
+def _indices_nome(nome: str, dimensao: int) -> Tuple[int, ...]:
+    """Índices (sem repetição) de todos os atributos de um nome."""
+    mascara = dimensao - 1
+    indices = set()
+    anterior = None
+    for palavra in _PALAVRA.findall(nome.lower()):
+        codigo, atributos = _atributos_palavra(palavra, dimensao)
+        indices.update(atributos)
+        if anterior is not None:
+            # Bigrama: combina os hashes das duas palavras, sem novo crc32
+            indices.add(((anterior * 0x9E3779B1) ^ codigo) & mascara)
+        anterior = codigo
+    return tuple(indices)
+
+
+class NaiveBayesClassifier:
+    """Naive Bayes multinomial sobre atributos com hashing."""
+
+    def __init__(
+        self, classes: Sequence[str], log_prior: np.ndarray, log_prob: np.ndarray
+    ) -> None:
+        """
+        Args:
+            classes: Nomes das categorias, na ordem das colunas do modelo.
+            log_prior: Log da probabilidade a priori de cada categoria (k,).
+            log_prob: Log da probabilidade de cada atributo por categoria
+                (dimensão, k).
+        """
+        self.classes = list(classes)
+        self.log_prior = log_prior.astype(np.float32)
+        self.log_prob = log_prob.astype(np.float32)
+        self.dimensao = log_prob.shape[0]
+
+    @classmethod
+    def treinar(
+        cls,
+        nomes: Sequence[str],
+        rotulos: Sequence[str],
+        dimensao: int = DIMENSAO_PADRAO,
+        alfa: float = 0.1,
+    ) -> "NaiveBayesClassifier":
+        """
+        Treina o modelo a partir de nomes rotulados.
+
+        Args:
+            nomes: Nomes dos itens.
+            rotulos: Categoria de cada nome.
+            dimensao: Tamanho do vetor de atributos (potência de 2).
+            alfa: Suavização de Laplace/Lidstone.
+        """
+        if dimensao & (dimensao - 1):
+            raise ValueError("A dimensão deve ser uma potência de 2.")
+        classes = sorted(set(rotulos))
+        coluna = {classe: i for i, classe in enumerate(classes)}
+
+        contagens = np.zeros((dimensao, len(classes)), dtype=np.float64)
+        linhas: List[int] = []
+        colunas: List[int] = []
+        for nome, rotulo in zip(nomes, rotulos):
+            indices = _indices_nome(nome or "", dimensao)
+            linhas.extend(indices)
+            colunas.extend([coluna[rotulo]] * len(indices))
+        np.add.at(contagens, (np.array(linhas), np.array(colunas)), 1)
+
+        por_classe = np.bincount(
+            [coluna[r] for r in rotulos], minlength=len(classes)
+        ).astype(np.float64)
+        log_prior = np.log(por_classe / por_classe.sum())
+        log_prob = np.log(contagens + alfa) - np.log(
+            contagens.sum(axis=0) + alfa * dimensao
+        )
+        return cls(classes, log_prior, log_prob)
+
+    def predict(self, nomes: Iterable[str]) -> List[str]:
+        """Classifica os nomes em lote e retorna a categoria de cada um."""
+        nomes = list(nomes)
+        resultado: List[str] = []
+        for inicio in range(0, len(nomes), TAMANHO_LOTE):
+            resultado.extend(self._predict_lote(nomes[inicio : inicio + TAMANHO_LOTE]))
+        return resultado
+
+    def _predict_lote(self, nomes: List[str]) -> List[str]:
+        # Nomes repetidos (comuns entre cardápios) são classificados uma vez
+        unicos = list(dict.fromkeys(nomes))
+        indices: List[int] = []
+        quantidades = np.empty(len(unicos), dtype=np.int64)
+        for i, nome in enumerate(unicos):
+            atributos = _indices_nome(nome, self.dimensao) if nome else ()
+            indices.extend(atributos)
+            quantidades[i] = len(atributos)
+
+        categorias = np.full(len(unicos), CATEGORIA_PADRAO, dtype=object)
+        preenchidos = quantidades > 0
+        if indices:
+            # Soma os log-probs dos atributos de cada nome de uma só vez
+            inicios = np.concatenate(([0], np.cumsum(quantidades)[:-1]))[preenchidos]
+            pontuacao = np.add.reduceat(
+                self.log_prob[np.array(indices)], inicios, axis=0
+            )
+            melhores = np.argmax(pontuacao + self.log_prior, axis=1)
+            categorias[preenchidos] = np.array(self.classes, dtype=object)[melhores]
+
+        por_nome = dict(zip(unicos, categorias.tolist()))
+        return [por_nome[nome] for nome in nomes]
+
+    def salvar(self, caminho: Path) -> None:
+        """Grava o modelo em '.npz' compactado (float16 nos log-probs)."""
+        caminho.parent.mkdir(parents=True, exist_ok=True)
+        with open(caminho, "wb") as arquivo:
+            np.savez_compressed(
+                arquivo,
+                classes=np.array(self.classes),
+                log_prior=self.log_prior,
+                log_prob=self.log_prob.astype(np.float16),
+            )
+
+    @classmethod
+    def carregar(cls, caminho: Path) -> "NaiveBayesClassifier":
+        """Lê um modelo gravado com 'salvar'."""
+        with np.load(caminho) as dados:
+            return cls(dados["classes"].tolist(), dados["log_prior"], dados["log_prob"])
+
+
+def ler_rotulos(caminho: Path) -> Tuple[List[str], List[str]]:
+    """Lê um CSV com as colunas 'item' e 'categoria'."""
+    nomes: List[str] = []
+    rotulos: List[str] = []
+    with open(caminho, "r", encoding="utf-8", newline="") as arquivo:
+        for linha in csv.DictReader(arquivo):
+            nomes.append(linha["item"])
+            rotulos.append(linha["categoria"])
+    return nomes, rotulos
+
+
+def _grupo(nome: str) -> str:
+    """Nome sem tamanho/variação: variações do mesmo item ficam juntas."""
+    return " ".join(_PALAVRA.findall(_VARIACAO.sub(" ", nome.lower())))
+
+
+def validacao_cruzada(
+    nomes: Sequence[str],
+    rotulos: Sequence[str],
+    dobras: int = 5,
+    dimensao: int = DIMENSAO_PADRAO,
+    alfa: float = 0.1,
+) -> float:
+    """
+    Acurácia média em validação cruzada. As variações de um mesmo item
+    (ex: tamanhos de uma bebida) ficam sempre na mesma dobra, para que o
+    modelo não seja avaliado em quase-cópias do que viu no treino.
+    """
+    dobra = [zlib.crc32(_grupo(nome).encode("utf-8")) % dobras for nome in nomes]
+    acertos = 0
+    for atual in range(dobras):
+        treino = [i for i, d in enumerate(dobra) if d != atual]
+        teste = [i for i, d in enumerate(dobra) if d == atual]
+        modelo = NaiveBayesClassifier.treinar(
+            [nomes[i] for i in treino], [rotulos[i] for i in treino], dimensao, alfa
+        )
+        previstos = modelo.predict([nomes[i] for i in teste])
+        acertos += sum(p == rotulos[i] for p, i in zip(previstos, teste))
+    return acertos / len(nomes)
@@ -1,58 +1,336 @@
 """
 Módulo responsável por buscar dados de fontes externas e salvá-los localmente.
 Sua única responsabilidade é o ETL (Extract, Transform, Load) inicial dos dados.
+
+O download é:
+- Condicional: reenvia os validadores (ETag / Last-Modified) da última busca
+  e não baixa nada se a fonte não mudou (HTTP 304).
+- Em streaming: o corpo é gravado em disco em blocos e lido de volta com um
+  parser incremental, sem manter o JSON inteiro em memória.
+- Retomável: um download interrompido continua de onde parou (HTTP Range).
+
+Os itens são agrupados por restaurante em arquivos temporários no disco,
+de modo que o pico de memória é o do maior cardápio, e não o da fonte
+inteira. Na gravação, só os arquivos cujo conteúdo mudou são reescritos
+(ver 'utils.manifest'), sempre de forma atômica.
 """
 
 import json
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 import requests
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
 from core.config import settings
+from utils.manifest import (
+    arquivo_inalterado,
+    carregar_manifesto,
+    escrever_atomicamente,
+    hash_conteudo,
+    registrar_arquivo,
+    salvar_manifesto,
+)
+
+URL_FONTE = (
+    "https://raw.githubusercontent.com/YuriArduino/Estudos_Artificial_Intelligence/"
+    "refs/heads/Dados/restaurantes.json"
+)
+TAMANHO_BLOCO = 64 * 1024
+# Leituras sem 'read1' (urllib3 < 2.3): uma queda perde no máximo isto
+TAMANHO_LEITURA = 8 * 1024
+# Itens guardados em memória antes de serem repassados aos arquivos temporários
+LIMITE_ITENS_EM_MEMORIA = 50_000
+
+
+def _carregar_estado() -> Dict[str, Any]:
+    """Lê os validadores salvos da última busca (vazio se não houver)."""
+    try:
+        with open(settings.FETCH_STATE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _salvar_estado(estado: Dict[str, Any]) -> None:
+    """Persiste os validadores para a próxima busca condicional."""
+    settings.FETCH_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(settings.FETCH_STATE_FILE, "w", encoding="utf-8") as f:
+        json.dump(estado, f, indent=4, ensure_ascii=False)
+
+
+def _validadores(response: requests.Response) -> Dict[str, Optional[str]]:
+    return {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+
+
+def _ler_conforme_chega(response: requests.Response) -> Iterator[bytes]:
+    """
+    Produz o corpo em pedaços conforme chegam, sem esperar completar um
+    bloco: se a conexão cair, nada do que já foi recebido se perde.
+    """
+    raw = response.raw
+    while True:
+        if hasattr(raw, "read1"):
+            pedaco = raw.read1(TAMANHO_BLOCO)
+        else:
+            pedaco = raw.read(TAMANHO_LEITURA)
+        if not pedaco:
+            return
+        yield pedaco
+
+
+def baixar_fonte(url: str, destino: Path, timeout: int = 10) -> bool:
+    """
+    Baixa 'url' para 'destino' de forma condicional, em streaming e retomável.
+
+    Args:
+        url: Endereço da fonte de dados.
+        destino: Arquivo onde o corpo completo será gravado.
+        timeout: Timeout de conexão/leitura em segundos.
+
+    Returns:
+        True se um conteúdo novo foi baixado; False se a fonte não mudou.
+    """
+    estado = _carregar_estado()
+    parcial = destino.with_name(destino.name + ".partial")
+    # Sem compressão: os offsets do 'Range' são os bytes gravados no parcial
+    headers: Dict[str, str] = {"Accept-Encoding": "identity"}
+
+    # 1. Download anterior interrompido: tenta retomar do último byte gravado.
+    #    'If-Range' garante que só retomamos se a fonte ainda for a mesma.
+    info_parcial = estado.get("parcial") or {}
+    validador_parcial = info_parcial.get("etag") or info_parcial.get("last_modified")
+    offset = parcial.stat().st_size if parcial.exists() else 0
+    if offset and info_parcial.get("url") == url and validador_parcial:
+        headers["Range"] = f"bytes={offset}-"
+        headers["If-Range"] = validador_parcial
+    else:
+        offset = 0
+        # 2. Sem retomada: busca condicional com os validadores da última busca.
+        if estado.get("url") == url:
+            if estado.get("etag"):
+                headers["If-None-Match"] = estado["etag"]
+            if estado.get("last_modified"):
+                headers["If-Modified-Since"] = estado["last_modified"]
+
+    with requests.get(url, headers=headers, stream=True, timeout=timeout) as response:
+        if response.status_code == 304:
+            return False
+        if response.status_code == 416 and offset:
+            # O parcial já não corresponde à fonte: descarta e recomeça.
+            parcial.unlink(missing_ok=True)
+            estado.pop("parcial", None)
+            _salvar_estado(estado)
+            return baixar_fonte(url, destino, timeout)
+        response.raise_for_status()
+
+        retomando = response.status_code == 206
+        if not retomando:
+            offset = 0
+        print(
+            f"Retomando download a partir do byte {offset}..."
+            if retomando
+            else "Baixando dados..."
+        )
+        estado["parcial"] = {"url": url, **_validadores(response)}
+        _salvar_estado(estado)
+
+        destino.parent.mkdir(parents=True, exist_ok=True)
+        with open(parcial, "ab" if retomando else "wb") as arquivo:
+            try:
+                for pedaco in _ler_conforme_chega(response):
+                    arquivo.write(pedaco)
+                    arquivo.flush()
+            except Urllib3HTTPError as e:
+                # O que chegou fica no parcial: a próxima busca continua dele
+                raise requests.ConnectionError(f"Download interrompido: {e}") from e
+
+    parcial.replace(destino)
+    return True
+
+
+def iterar_itens_json(
+    file_path: Path, tamanho_bloco: int = TAMANHO_BLOCO
+) -> Iterator[Any]:
+    """
+    Percorre os elementos de um array JSON de nível superior em streaming.
+
+    Lê o arquivo em blocos e decodifica um elemento por vez, de modo que a
+    memória usada é limitada pelo tamanho do bloco e do maior elemento.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    inicio_array = False
+    with open(file_path, "r", encoding="utf-8") as arquivo:
+        while True:
+            bloco = arquivo.read(tamanho_bloco)
+            buffer += bloco
+            posicao = 0
+            while True:
+                # Pula espaços e separadores entre os elementos
+                while posicao < len(buffer) and buffer[posicao] in " \t\r\n,":
+                    posicao += 1
+                if posicao >= len(buffer):
+                    break
+                if not inicio_array:
+                    if buffer[posicao] != "[":
+                        raise json.JSONDecodeError(
+                            "Esperado um array JSON", buffer, posicao
+                        )
+                    inicio_array = True
+                    posicao += 1
+                    continue
+                if buffer[posicao] == "]":
+                    return
+                try:
+                    elemento, posicao = decoder.raw_decode(buffer, posicao)
+                except json.JSONDecodeError:
+                    if not bloco:
+                        raise
+                    break  # Elemento incompleto: lê mais um bloco
+                yield elemento
+            buffer = buffer[posicao:]
+            if not bloco:
+                raise json.JSONDecodeError("Array JSON não finalizado", buffer, 0)
+
+
+def agrupar_em_disco(itens: Iterable[dict], pasta: Path) -> Dict[str, Path]:
+    """
+    Agrupa os itens da fonte por restaurante em arquivos NDJSON dentro de
+    'pasta', repassando-os ao disco a cada 'LIMITE_ITENS_EM_MEMORIA' itens.
+
+    Returns:
+        O arquivo de cada restaurante, na ordem em que apareceram na fonte.
+    """
+    arquivos: Dict[str, Path] = {}
+    pendentes: Dict[str, List[str]] = {}
+    quantidade = 0
+
+    def descarregar() -> None:
+        for nome, linhas in pendentes.items():
+            with open(arquivos[nome], "a", encoding="utf-8") as arquivo:
+                arquivo.writelines(linhas)
+        pendentes.clear()
+
+    for item in itens:
+        company_name = item.get("Company")
+        if not company_name:
+            continue
+        if company_name not in arquivos:
+            arquivos[company_name] = pasta / f"{len(arquivos):06d}.ndjson"
+        linha = json.dumps(
+            {
+                "item": item.get("Item"),
+                "price": item.get("price"),
+                "description": item.get("description"),
+            },
+            ensure_ascii=False,
+        )
+        pendentes.setdefault(company_name, []).append(linha + "\n")
+        quantidade += 1
+        if quantidade >= LIMITE_ITENS_EM_MEMORIA:
+            descarregar()
+            quantidade = 0
+    descarregar()
+    return arquivos
 
 
-def process_and_save_restaurants():
+def ler_grupos(arquivos: Dict[str, Path]) -> Iterator[Tuple[str, List[dict]]]:
+    """Lê de volta, um restaurante por vez, os grupos de 'agrupar_em_disco'."""
+    for nome, file_path in arquivos.items():
+        with open(file_path, "r", encoding="utf-8") as arquivo:
+            dados = [json.loads(linha) for linha in arquivo]
+        file_path.unlink()
+        yield nome, dados
+
+
+def salvar_restaurantes(
+    restaurantes_agrupados: Union[
+        Mapping[str, List[dict]], Iterable[Tuple[str, List[dict]]]
+    ],
+    compacto: Optional[bool] = None,
+) -> Dict[str, int]:
+    """
+    Salva o cardápio de cada restaurante em 'DATA_DIR', reescrevendo apenas
+    os arquivos cujo conteúdo mudou (comparando o hash com o manifesto).
+
+    Args:
+        restaurantes_agrupados: Itens do cardápio agrupados pelo nome do
+            restaurante, num dicionário ou em pares (nome, itens) lidos aos
+            poucos (ex: 'ler_grupos').
+        compacto: Grava JSON sem indentação. Se None, usa 'settings.DATA_COMPACT_JSON'.
+
+    Returns:
+        Contagem de arquivos escritos e inalterados e total de bytes gravados.
+    """
+    if compacto is None:
+        compacto = settings.DATA_COMPACT_JSON
+    opcoes_json = {"separators": (",", ":")} if compacto else {"indent": 4}
+
+    settings.DATA_DIR.mkdir(parents=True, exist_ok=True)
+    print(f"Verificando/criando diretório de dados em: {settings.DATA_DIR}")
+
+    if isinstance(restaurantes_agrupados, Mapping):
+        restaurantes_agrupados = restaurantes_agrupados.items()
+
+    manifesto = carregar_manifesto()
+    estatisticas = {"escritos": 0, "inalterados": 0, "bytes_escritos": 0}
+    for nome, dados in restaurantes_agrupados:
+        file_name = f'{nome.replace(" ", "_").lower()}.json'
+        file_path = settings.DATA_DIR / file_name
+
+        conteudo = json.dumps(dados, ensure_ascii=False, **opcoes_json)
+        conteudo = conteudo.encode("utf-8")
+        sha256 = hash_conteudo(conteudo)
+        entrada = manifesto.get(file_name) or {}
+        if entrada.get("sha256") == sha256 and arquivo_inalterado(manifesto, file_path):
+            estatisticas["inalterados"] += 1
+            continue
+
+        print(f"Salvando dados de '{nome}' em '{file_path}'...")
+        escrever_atomicamente(file_path, conteudo)
+        registrar_arquivo(manifesto, file_path, nome, sha256, len(dados))
+        estatisticas["escritos"] += 1
+        estatisticas["bytes_escritos"] += len(conteudo)
+
+    salvar_manifesto(manifesto)
+    return estatisticas
+
+
+def process_and_save_restaurants(
+    url: str = URL_FONTE, timeout: int = 10, compacto: Optional[bool] = None
+):
     """
     Carrega dados de restaurantes de uma URL, processa e salva em arquivos JSON
     separados por restaurante no diretório 'data/restaurants'.
     """
-    url = (
-        "https://raw.githubusercontent.com/YuriArduino/Estudos_Artificial_Intelligence/"
-        "refs/heads/Dados/restaurantes.json"
-    )
-    timeout = 10
+    download_path = settings.FETCH_STATE_FILE.with_name("restaurantes_fonte.json")
 
     print("Iniciando download dos dados dos restaurantes...")
     try:
-        response = requests.get(url, timeout=timeout)
-        response.raise_for_status()
-        dados_json = response.json()
+        if not baixar_fonte(url, download_path, timeout=timeout):
+            print("Os dados na fonte não mudaram desde a última busca. Nada a fazer.")
+            return
         print("Download concluído com sucesso.")
 
-        restaurantes_agrupados = {}
-        for item in dados_json:
-            company_name = item.get("Company")
-            if not company_name:
-                continue
-
-            if company_name not in restaurantes_agrupados:
-                restaurantes_agrupados[company_name] = []
-
-            restaurantes_agrupados[company_name].append(
-                {
-                    "item": item.get("Item"),
-                    "price": item.get("price"),
-                    "description": item.get("description"),
-                }
-            )
-
-        settings.DATA_DIR.mkdir(parents=True, exist_ok=True)
-        print(f"Verificando/criando diretório de dados em: {settings.DATA_DIR}")
-
-        for nome, dados in restaurantes_agrupados.items():
-            file_name = f'{nome.replace(" ", "_").lower()}.json'
-            file_path = settings.DATA_DIR / file_name
-
-            print(f"Salvando dados de '{nome}' em '{file_path}'...")
-            with open(file_path, "w", encoding="utf-8") as arquivo:
-                json.dump(dados, arquivo, indent=4, ensure_ascii=False)
+        with tempfile.TemporaryDirectory(
+            dir=download_path.parent, prefix=".agrupamento_"
+        ) as pasta:
+            arquivos = agrupar_em_disco(iterar_itens_json(download_path), Path(pasta))
+            estatisticas = salvar_restaurantes(ler_grupos(arquivos), compacto)
+        print(
+            f"{estatisticas['escritos']} arquivo(s) escrito(s), "
+            f"{estatisticas['inalterados']} inalterado(s) "
+            f"({estatisticas['bytes_escritos']} bytes gravados)."
+        )
+
+        # Só após processar tudo os validadores passam a valer para a
+        # próxima busca condicional.
+        estado = _carregar_estado()
+        _salvar_estado({"url": url, **(estado.pop("parcial", None) or {})})
+        download_path.unlink(missing_ok=True)
 
         print("\nProcesso de salvamento de dados concluído.")
 
@@ -1,14 +1,131 @@
 """
 Módulo responsável por ler os dados locais e carregá-los em modelos Pydantic.
 Combina metadados dos restaurantes com seus respectivos cardápios.
+
+Cada cardápio classificado é guardado em 'MENU_CACHE_DIR', pelo hash do
+arquivo e pela versão do classificador. Um arquivo que não mudou é carregado
+do cache, já com as categorias, numa única validação: sem decodificar o
+JSON original nem classificar os itens de novo. O hash vem do manifesto do
+'data_fetcher' quando o arquivo ainda é o registrado nele (mesmo tamanho e
+mtime); senão, é calculado a partir do conteúdo.
 """
 
 import json
-from typing import Dict
-from pydantic import ValidationError
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+from pydantic import TypeAdapter, ValidationError
 from core.config import settings
 from models.schemas import Restaurante, ItemCardapio
-from utils.classifier import classify_item
+from utils.classifier import classificar_lote, versao_classificador
+from utils.manifest import (
+    Manifesto,
+    arquivo_inalterado,
+    carregar_manifesto,
+    escrever_atomicamente,
+    hash_conteudo,
+)
+
+# Validador reutilizável para a lista de itens de um cardápio
+_CARDAPIO_ADAPTER = TypeAdapter(List[ItemCardapio])
+
+
+def validar_itens(
+    dados: List[Dict[str, Any]],
+) -> Tuple[List[ItemCardapio], Dict[int, str]]:
+    """
+    Classifica e valida itens de cardápio em lote, como na carga do catálogo,
+    mas sem descartar o lote inteiro por causa de um item inválido.
+
+    Returns:
+        Os itens válidos (na ordem de 'dados') e a mensagem de erro de cada
+        item inválido, pelo seu índice em 'dados'.
+    """
+    categorias = classificar_lote(
+        [
+            item_dict.get("item") if isinstance(item_dict.get("item"), str) else None
+            for item_dict in dados
+        ]
+    )
+    for item_dict, categoria_item in zip(dados, categorias):
+        item_dict["categoria"] = categoria_item
+    try:
+        return _CARDAPIO_ADAPTER.validate_python(dados), {}
+    except ValidationError as e:
+        erros: Dict[int, str] = {}
+        for erro in e.errors():
+            indice, *campo = erro["loc"]
+            mensagem = f"{'.'.join(map(str, campo)) or 'item'}: {erro['msg']}"
+            erros[indice] = (
+                f"{erros[indice]}; {mensagem}" if indice in erros else mensagem
+            )
+    validos = [item_dict for i, item_dict in enumerate(dados) if i not in erros]
+    return _CARDAPIO_ADAPTER.validate_python(validos), erros
+
+
+def _ler_cache(cache_path: Path) -> Optional[List[ItemCardapio]]:
+    """Cardápio já classificado do cache (None se ausente ou inválido)."""
+    try:
+        return _CARDAPIO_ADAPTER.validate_json(cache_path.read_bytes())
+    except (OSError, ValidationError):
+        return None
+
+
+def _ler_cardapio(
+    filepath: Path, manifesto: Manifesto, versao: str, usados: Set[str]
+) -> List[ItemCardapio]:
+    """
+    Lê, classifica e valida o cardápio de 'filepath', ou o carrega do cache
+    se o mesmo conteúdo já foi processado com o mesmo classificador.
+    """
+    conteudo = None
+    if arquivo_inalterado(manifesto, filepath):
+        sha256 = manifesto[filepath.name]["sha256"]
+    else:
+        conteudo = filepath.read_bytes()
+        sha256 = hash_conteudo(conteudo)
+    cache_path = settings.MENU_CACHE_DIR / f"{sha256}-{versao}.json"
+    usados.add(cache_path.name)
+
+    cardapio = _ler_cache(cache_path)
+    if cardapio is not None:
+        return cardapio
+
+    if conteudo is None:
+        conteudo = filepath.read_bytes()
+    dados_cardapio_raw = json.loads(conteudo)
+
+    # 1. Classifica todos os itens do cardápio de uma vez
+    categorias = classificar_lote(
+        [item_dict.get("item") for item_dict in dados_cardapio_raw]
+    )
+
+    # 2. Adiciona a categoria ao dicionário de cada item
+    for item_dict, categoria_item in zip(dados_cardapio_raw, categorias):
+        item_dict["categoria"] = categoria_item
+
+    # 3. Agora, valida o cardápio completo (com as categorias) de
+    #    uma só vez, o que é bem mais rápido que item a item.
+    cardapio = _CARDAPIO_ADAPTER.validate_python(dados_cardapio_raw)
+
+    try:
+        settings.MENU_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Sem fsync: uma entrada corrompida é rejeitada em '_ler_cache'
+        escrever_atomicamente(
+            cache_path, _CARDAPIO_ADAPTER.dump_json(cardapio), sincronizar=False
+        )
+    except OSError as e:
+        print(f"[AVISO] Não foi possível gravar o cache de '{filepath.name}': {e}")
+    return cardapio
+
+
+def _limpar_cache(usados: Set[str]) -> None:
+    """Remove do cache os cardápios que não correspondem a nenhum arquivo atual."""
+    try:
+        for cache_path in settings.MENU_CACHE_DIR.glob("*.json"):
+            if cache_path.name not in usados:
+                cache_path.unlink(missing_ok=True)
+    except OSError as e:
+        print(f"[AVISO] Não foi possível limpar o cache de cardápios: {e}")
 
 
 def carregar_dados_restaurantes() -> Dict[str, Restaurante]:
@@ -16,8 +133,26 @@ def carregar_dados_restaurantes() -> Dict[str, Restaurante]:
     Lê o arquivo de metadados e os arquivos de cardápio, combina-os
     e retorna um dicionário de restaurantes prontos para a API.
     """
-    restaurantes_carregados: Dict[str, Restaurante] = {}
+    restaurantes_carregados = {
+        restaurante.nome.title(): restaurante for restaurante in iterar_restaurantes()
+    }
+    print(
+        f"Carregados dados de {len(restaurantes_carregados)} restaurantes para a API."
+    )
+    return restaurantes_carregados
+
 
+def iterar_restaurantes(
+    ao_listar: Optional[Callable[[int], None]] = None,
+) -> Iterator[Restaurante]:
+    """
+    Produz os restaurantes um a um, conforme cada cardápio é lido e
+    validado (permite servir os primeiros antes de terminar a carga).
+
+    Args:
+        ao_listar: Chamada com a quantidade de arquivos de cardápio
+            encontrados, antes do primeiro restaurante ser lido.
+    """
     # 1. Carregar os metadados primeiro
     metadata_restaurantes = {}
     if settings.METADATA_FILE.exists():
@@ -37,49 +172,45 @@ def carregar_dados_restaurantes() -> Dict[str, Restaurante]:
             f"[AVISO] Diretório de dados de cardápios não encontrado:"
             f" {settings.DATA_DIR}"
         )
-        return restaurantes_carregados
-
-    for filepath in settings.DATA_DIR.iterdir():
-        if filepath.suffix == ".json":
-            nome_restaurante = filepath.stem.replace("_", " ").title()
-            metadata = metadata_restaurantes.get(nome_restaurante, {})
-
-            try:
-                with open(filepath, "r", encoding="utf-8") as f:
-                    dados_cardapio_raw = json.load(f)
-
-                cardapio_processado = []
-                for item_dict in dados_cardapio_raw:
-                    # 1. Classifica o item para obter a categoria
-                    categoria_item = classify_item(item_dict.get("item"))
-
-                    # 2. Adiciona a categoria ao dicionário do item
-                    item_dict["categoria"] = categoria_item
-
-                    # 3. Agora, valida o dicionário completo (com a categoria)
-                    item_validado = ItemCardapio.model_validate(item_dict)
-                    cardapio_processado.append(item_validado)
-
-                # Cria a instância do Restaurante com o cardápio já processado
-                restaurante = Restaurante(
-                    nome=metadata.get("nome", nome_restaurante),
-                    categoria=metadata.get("categoria", "Não especificada"),
-                    ativo=metadata.get("ativo", False),
-                    cardapio=cardapio_processado,  # Usa a lista processada
-                )
-                restaurantes_carregados[restaurante.nome.title()] = restaurante
-
-            except json.JSONDecodeError:
-                print(f"[ERRO] O arquivo JSON '{filepath.name}' está mal formatado.")
-            except ValidationError as e:
-                print(
-                    f"[ERRO] Erro de validação de dados em"
-                    f" '{filepath.name}'. Detalhes: {e}"
-                )
-            except OSError as e:
-                print(f"[ERRO] Erro de I/O ao ler o arquivo '{filepath.name}': {e}")
+        if ao_listar is not None:
+            ao_listar(0)
+        return
 
-    print(
-        f"Carregados dados de {len(restaurantes_carregados)} restaurantes para a API."
-    )
-    return restaurantes_carregados
+    arquivos = [p for p in settings.DATA_DIR.iterdir() if p.suffix == ".json"]
+    if ao_listar is not None:
+        ao_listar(len(arquivos))
+
+    manifesto = carregar_manifesto()
+    versao = versao_classificador()
+    usados: Set[str] = set()
+
+    for filepath in arquivos:
+        nome_restaurante = filepath.stem.replace("_", " ").title()
+        metadata = metadata_restaurantes.get(nome_restaurante, {})
+
+        try:
+            cardapio_processado = _ler_cardapio(filepath, manifesto, versao, usados)
+
+            # Cria a instância do Restaurante com o cardápio já processado
+            restaurante = Restaurante(
+                nome=metadata.get("nome", nome_restaurante),
+                categoria=metadata.get("categoria", "Não especificada"),
+                ativo=metadata.get("ativo", False),
+                cardapio=cardapio_processado,  # Usa a lista processada
+            )
+            # Pré-calcula os itens por categoria para os endpoints do cardápio
+            restaurante.indexar_categorias()
+
+            yield restaurante
+
+        except json.JSONDecodeError:
+            print(f"[ERRO] O arquivo JSON '{filepath.name}' está mal formatado.")
+        except ValidationError as e:
+            print(
+                f"[ERRO] Erro de validação de dados em"
+                f" '{filepath.name}'. Detalhes: {e}"
+            )
+        except OSError as e:
+            print(f"[ERRO] Erro de I/O ao ler o arquivo '{filepath.name}': {e}")
+
+    _limpar_cache(usados)
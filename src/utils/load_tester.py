@@ -0,0 +1,185 @@
+"""
+Módulo de teste de carga da API Sabor Express.
+
+Dispara requisições concorrentes contra uma API em execução usando um pool
+de clientes asyncio (httpx), segundo uma mistura configurável de operações,
+e resume vazão, latências (p50/p95/p99/máx) e erros.
+"""
+
+import asyncio
+import math
+import random
+import time
+import uuid
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+# Operações suportadas e seus pesos padrão na mistura de requisições
+MIX_PADRAO: Dict[str, int] = {
+    "listar": 50,
+    "filtrar": 20,
+    "detalhe": 20,
+    "toggle": 5,
+    "criar": 5,
+}
+
+
+class LoadTestError(Exception):
+    """Exceção customizada para erros de configuração do teste de carga."""
+
+
+def parse_mix(texto: str) -> Dict[str, int]:
+    """
+    Converte uma string 'op=peso,op=peso' em um dicionário de pesos.
+
+    Exemplo: 'listar=70,detalhe=30'.
+    """
+    mix: Dict[str, int] = {}
+    for parte in filter(None, (p.strip() for p in texto.split(","))):
+        operacao, _, peso = parte.partition("=")
+        operacao = operacao.strip()
+        if operacao not in MIX_PADRAO:
+            raise LoadTestError(
+                f"Operação desconhecida: '{operacao}'. "
+                f"Use uma de: {', '.join(MIX_PADRAO)}."
+            )
+        try:
+            mix[operacao] = int(peso or 1)
+        except ValueError as e:
+            raise LoadTestError(f"Peso inválido para '{operacao}': {peso}") from e
+    if not mix or sum(mix.values()) <= 0:
+        raise LoadTestError("A mistura de requisições não pode ser vazia.")
+    return mix
+
+
+def percentil(valores_ordenados: List[float], p: float) -> float:
+    """
+    Percentil pelo método do posto mais próximo (lista já ordenada): o menor
+    valor que tem pelo menos p% das amostras menores ou iguais a ele.
+    """
+    if not valores_ordenados:
+        return 0.0
+    # Multiplica antes de dividir: 'p / 100 * n' arredonda (0.07 * 100 = 7.000...1)
+    posto = math.ceil(p * len(valores_ordenados) / 100)
+    return valores_ordenados[min(max(posto, 1), len(valores_ordenados)) - 1]
+
+
+def _resumo_latencias(latencias: List[float]) -> Dict[str, float]:
+    ordenadas = sorted(latencias)
+    return {
+        "p50_ms": percentil(ordenadas, 50) * 1000,
+        "p95_ms": percentil(ordenadas, 95) * 1000,
+        "p99_ms": percentil(ordenadas, 99) * 1000,
+        "max_ms": (ordenadas[-1] if ordenadas else 0.0) * 1000,
+    }
+
+
+def _montar_requisicao(
+    operacao: str, rng: random.Random, nomes: List[str]
+) -> Tuple[str, str, Dict[str, Any]]:
+    """Retorna (método, endpoint, kwargs) para a operação sorteada."""
+    if operacao == "listar":
+        return "GET", "restaurantes", {}
+    if operacao == "filtrar":
+        return "GET", "restaurantes", {"params": {"categoria": "Fast Food"}}
+    if operacao == "criar":
+        payload = {"nome": f"Loadtest {uuid.uuid4().hex[:12]}", "categoria": "Teste"}
+        return "POST", "restaurantes", {"json": payload}
+    nome = rng.choice(nomes)
+    if operacao == "detalhe":
+        return "GET", f"restaurantes/{nome}", {}
+    return "PATCH", f"restaurantes/{nome}/toggle_status", {}
+
+
+async def _executar(
+    base_url: str,
+    mix: Dict[str, int],
+    concorrencia: int,
+    duracao: float,
+    timeout: float,
+    semente: int,
+) -> Dict[str, Any]:
+    limites = httpx.Limits(
+        max_connections=concorrencia, max_keepalive_connections=concorrencia
+    )
+    async with httpx.AsyncClient(
+        base_url=base_url.rstrip("/") + "/", limits=limites, timeout=timeout
+    ) as client:
+        try:
+            resposta = await client.get("restaurantes")
+            resposta.raise_for_status()
+        except httpx.HTTPError as e:
+            raise LoadTestError(f"API indisponível em {base_url}: {e}") from e
+        nomes = [r["nome"] for r in resposta.json()]
+        if not nomes and ({"detalhe", "toggle"} & mix.keys()):
+            raise LoadTestError(
+                "A API não possui restaurantes para 'detalhe'/'toggle'."
+            )
+
+        operacoes, pesos = list(mix), list(mix.values())
+        latencias: Dict[str, List[float]] = defaultdict(list)
+        erros: Counter = Counter()
+        fim = time.perf_counter() + duracao
+
+        async def worker(indice: int) -> None:
+            rng = random.Random(semente + indice)
+            while time.perf_counter() < fim:
+                operacao = rng.choices(operacoes, pesos)[0]
+                method, endpoint, kwargs = _montar_requisicao(operacao, rng, nomes)
+                inicio = time.perf_counter()
+                try:
+                    resposta = await client.request(method, endpoint, **kwargs)
+                    if resposta.status_code >= 400:
+                        erros[f"{operacao}:http_{resposta.status_code}"] += 1
+                except httpx.HTTPError as e:
+                    erros[f"{operacao}:{type(e).__name__}"] += 1
+                latencias[operacao].append(time.perf_counter() - inicio)
+
+        inicio_teste = time.perf_counter()
+        await asyncio.gather(*(worker(i) for i in range(concorrencia)))
+        tempo_total = time.perf_counter() - inicio_teste
+
+    todas = [lat for lista in latencias.values() for lat in lista]
+    return {
+        "base_url": base_url,
+        "concorrencia": concorrencia,
+        "duracao_s": tempo_total,
+        "mix": mix,
+        "requisicoes": len(todas),
+        "vazao_rps": len(todas) / tempo_total if tempo_total else 0.0,
+        "erros": sum(erros.values()),
+        "latencia": _resumo_latencias(todas),
+        "por_operacao": {
+            operacao: {"requisicoes": len(lista), **_resumo_latencias(lista)}
+            for operacao, lista in sorted(latencias.items())
+        },
+        "detalhe_erros": dict(erros.most_common()),
+    }
+
+
+def run_load_test(
+    base_url: str = "http://127.0.0.1:8000/api",
+    mix: Optional[Dict[str, int]] = None,
+    concorrencia: int = 50,
+    duracao: float = 10.0,
+    timeout: float = 10.0,
+    semente: int = 0,
+) -> Dict[str, Any]:
+    """
+    Executa o teste de carga e retorna o relatório como dicionário.
+
+    Args:
+        base_url: URL base da API (ex: http://127.0.0.1:8000/api).
+        mix: Pesos por operação (ver MIX_PADRAO).
+        concorrencia: Quantidade de clientes simultâneos (e de conexões no pool).
+        duracao: Duração do teste em segundos.
+        timeout: Timeout por requisição em segundos.
+        semente: Semente para tornar a sequência de operações reprodutível.
+    """
+    if concorrencia < 1 or duracao <= 0:
+        raise LoadTestError("Concorrência e duração devem ser positivas.")
+    return asyncio.run(
+        _executar(base_url, mix or MIX_PADRAO, concorrencia, duracao, timeout, semente)
+    )
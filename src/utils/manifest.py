@@ -0,0 +1,97 @@
+"""
+Módulo do manifesto do diretório de dados.
+
+O manifesto registra, para cada arquivo de cardápio, o hash SHA-256 do seu
+conteúdo, a quantidade de itens, o tamanho e o mtime. É escrito pelo
+'data_fetcher', e permite que:
+- o 'data_fetcher' reescreva apenas os arquivos cujo conteúdo mudou;
+- o 'data_reader' encontre, sem reler nem hashear um arquivo que não mudou,
+  o seu cardápio já classificado no cache.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict
+from core.config import settings
+
+Manifesto = Dict[str, Dict[str, Any]]
+
+
+def hash_conteudo(conteudo: bytes) -> str:
+    """Retorna o SHA-256 (hex) dos bytes do arquivo."""
+    return hashlib.sha256(conteudo).hexdigest()
+
+
+def escrever_atomicamente(
+    file_path: Path, conteudo: bytes, sincronizar: bool = True
+) -> None:
+    """
+    Grava 'conteudo' num arquivo temporário do mesmo diretório e o renomeia
+    para 'file_path'. Um leitor nunca vê um arquivo pela metade.
+
+    Com 'sincronizar', o conteúdo vai para o disco (fsync) antes da troca,
+    e sobrevive a uma queda do sistema; dispensável para caches.
+    """
+    descritor, temp_path = tempfile.mkstemp(
+        dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(descritor, "wb") as arquivo:
+            arquivo.write(conteudo)
+            if sincronizar:
+                arquivo.flush()
+                os.fsync(arquivo.fileno())
+        os.replace(temp_path, file_path)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
+def carregar_manifesto() -> Manifesto:
+    """Lê o manifesto (vazio se não existir ou estiver corrompido)."""
+    try:
+        with open(settings.MANIFEST_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def salvar_manifesto(manifesto: Manifesto) -> None:
+    """Grava o manifesto de forma atômica."""
+    settings.MANIFEST_FILE.parent.mkdir(parents=True, exist_ok=True)
+    conteudo = json.dumps(manifesto, indent=2, ensure_ascii=False, sort_keys=True)
+    escrever_atomicamente(settings.MANIFEST_FILE, conteudo.encode("utf-8"))
+
+
+def registrar_arquivo(
+    manifesto: Manifesto,
+    file_path: Path,
+    nome: str,
+    sha256: str,
+    itens: int,
+) -> None:
+    """Cria/atualiza a entrada de 'file_path' com o estado atual do disco."""
+    stat = file_path.stat()
+    manifesto[file_path.name] = {
+        "nome": nome,
+        "sha256": sha256,
+        "itens": itens,
+        "bytes": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+
+
+def arquivo_inalterado(manifesto: Manifesto, file_path: Path) -> bool:
+    """Indica se o arquivo no disco ainda é o registrado no manifesto."""
+    entrada = manifesto.get(file_path.name)
+    if not entrada:
+        return False
+    try:
+        stat = file_path.stat()
+    except OSError:
+        return False
+    mesmo_tamanho = stat.st_size == entrada.get("bytes")
+    return mesmo_tamanho and stat.st_mtime_ns == entrada.get("mtime_ns")